@@ -0,0 +1,96 @@
+# benchmarks/kaydet_benchmark.py
+
+import os
+import sys
+import time
+import logging
+import argparse
+import tempfile
+from PIL import Image as PILImage, ImageDraw
+
+KOK_DIZIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+if KOK_DIZIN not in sys.path:
+    sys.path.insert(0, KOK_DIZIN)
+
+from logic.pdf_generator import PDFCreator
+
+"""
+Soru Otomasyon Sistemi - 'PDFCreator.kaydet' Benchmark'ı
+
+Sentetik soru görselleriyle (geçici klasörde) N sayfalık bir TEST PDF'i
+oluşturur ve her N için kaydetme süresini ve dosya boyutunu raporlar.
+Şablonlar gerçek 'templates/' klasöründen okunur.
+
+Kullanım:
+    python benchmarks/kaydet_benchmark.py
+    python benchmarks/kaydet_benchmark.py --sayfalar 10 100 500 --tekrar 3
+"""
+
+FARKLI_GORSEL_SAYISI = 24
+
+
+def sentetik_gorseller_olustur(klasor):
+    """Farklı en/boy oranlarında soru görselleri üretir."""
+    yollar = []
+    for i in range(FARKLI_GORSEL_SAYISI):
+        genislik = 800
+        yukseklik = 300 + (i % 6) * 90
+        img = PILImage.new("RGB", (genislik, yukseklik), "white")
+        ciz = ImageDraw.Draw(img)
+        for satir in range(20, yukseklik - 20, 28):
+            ciz.line([(20, satir), (genislik - 20 - (satir * 7 + i * 13) % 300, satir)], fill="black", width=3)
+        yol = os.path.join(klasor, f"soru_{i:02d}.png")
+        img.save(yol)
+        yollar.append(yol)
+    return yollar
+
+
+def sayfa_haritasi_hazirla(gorseller, sayfa_sayisi):
+    """Tam olarak 'sayfa_sayisi' sayfalık bir test planı döndürür."""
+    pdf = PDFCreator()
+    soru_sayisi = sayfa_sayisi * 8
+    while True:
+        pdf.gorsel_listesi = [gorseller[i % len(gorseller)] for i in range(soru_sayisi)]
+        harita = pdf.planla_test_duzeni()
+        if len(harita) >= sayfa_sayisi:
+            return pdf.gorsel_listesi, harita[:sayfa_sayisi]
+        soru_sayisi = int(soru_sayisi * 1.5) + 1
+
+
+def olc(gorseller, sayfa_sayisi, tekrar, klasor):
+    gorsel_listesi, harita = sayfa_haritasi_hazirla(gorseller, sayfa_sayisi)
+    cikti = os.path.join(klasor, f"benchmark_{sayfa_sayisi}.pdf")
+
+    sureler = []
+    for _ in range(tekrar):
+        pdf = PDFCreator()
+        pdf.soru_tipi = "test"
+        pdf.gorsel_listesi = gorsel_listesi
+        pdf.baslik_ekle("BENCHMARK SINAVI")
+        baslangic = time.perf_counter()
+        if not pdf.kaydet(cikti, harita):
+            raise RuntimeError(f"{sayfa_sayisi} sayfalık PDF kaydedilemedi")
+        sureler.append(time.perf_counter() - baslangic)
+
+    return min(sureler), os.path.getsize(cikti)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="PDFCreator.kaydet süre/boyut ölçümü")
+    parser.add_argument("--sayfalar", type=int, nargs="+", default=[10, 100, 500])
+    parser.add_argument("--tekrar", type=int, default=1, help="Her boyut için tekrar sayısı (en iyisi raporlanır)")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+
+    with tempfile.TemporaryDirectory() as klasor:
+        gorseller = sentetik_gorseller_olustur(klasor)
+        print(f"{'Sayfa':>6} | {'Süre (sn)':>10} | {'Boyut (KB)':>11} | {'KB/sayfa':>9}")
+        print("-" * 46)
+        for sayfa_sayisi in args.sayfalar:
+            sure, boyut = olc(gorseller, sayfa_sayisi, args.tekrar, klasor)
+            print(f"{sayfa_sayisi:>6} | {sure:>10.2f} | {boyut / 1024:>11.1f} | {boyut / 1024 / sayfa_sayisi:>9.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,290 @@
+import os
+import sys
+import json
+import random
+import logging
+import argparse
+from logger_config import setup_logging
+from logic.pdf_generator import PDFCreator
+from logic.gorsel_olcer import boyut_servisi_al
+from logic.soru_secici import gorselleri_sec
+from logic.soru_katalogu import cevap_anahtari
+
+"""
+Soru Otomasyon Sistemi - Komut Satırı (Arayüzsüz Toplu Sınav Üretimi)
+
+Arayüzdeki akışın (soru seçimi -> planlama -> PDF kaydetme) aynısını
+customtkinter AÇMADAN çalıştırır.
+
+Tek sınav:
+    python cli.py --kok "D:/SoruBankasi" --ders Matematik \\
+        --konu "Türev=5" --konu "İntegral=3" --tip test --zorluk orta \\
+        --baslik "1. Deneme" --cevap-anahtari -o deneme1.pdf
+
+Manifest ile N varyant (tek process):
+    python cli.py --manifest sinavlar.json
+
+Manifest (JSON): Üst seviyedeki alanlar TÜM varyantlar için varsayılandır,
+her varyant istediği alanı ezebilir. Göreli yollar manifest klasörüne göredir.
+    {
+        "kok": "D:/SoruBankasi", "ders": "Matematik",
+        "tip": "test", "zorluk": "orta", "cevap_anahtari": true,
+        "konular": {"Türev": 5, "İntegral": 3},
+        "varyantlar": [
+            {"cikti": "A.pdf", "baslik": "Deneme A", "tohum": 1},
+            {"cikti": "B.pdf", "baslik": "Deneme B", "tohum": 2}
+        ]
+    }
+Bir varyantta "kitapciklar": ["A", "B", "C", "D"] verilirse aynı sorular
+her kitapçık için farklı sırayla 'cikti_A.pdf', 'cikti_B.pdf', ... olarak yazılır.
+'varyantlar' yerine "adet": N ve "cikti": "deneme_{no}.pdf" de verilebilir.
+Üst seviyede "tohum" verilirse varyant 'no' için tohum + no - 1 kullanılır.
+"""
+
+logger = logging.getLogger(__name__)
+
+SORU_TIPLERI = ("test", "yazili")
+ZORLUKLAR = ("kolay", "orta", "zor")
+VARSAYILAN_BASLIK = "QUIZ"
+
+
+class CLIHatasi(Exception):
+    """Kullanıcıya gösterilecek (traceback'siz) komut satırı hatası."""
+
+
+def konu_dagilimi_coz(ifadeler):
+    """["Türev=5", "İntegral=3"] -> {"Türev": 5, "İntegral": 3}"""
+    konu_dagilimi = {}
+    for ifade in ifadeler or []:
+        konu_adi, ayrac, sayi = ifade.rpartition("=")
+        if not ayrac or not konu_adi.strip():
+            raise CLIHatasi(f"Geçersiz konu ifadesi: '{ifade}' (Beklenen: 'Konu Adı=5')")
+        try:
+            konu_dagilimi[konu_adi.strip()] = int(sayi)
+        except ValueError:
+            raise CLIHatasi(f"Geçersiz soru sayısı: '{ifade}'")
+    return konu_dagilimi
+
+
+def konulari_bul(ders_klasoru, konu_adlari):
+    """{konu_adi: konu_klasor_yolu} (arayüzdeki 'secilen_konular' ile aynı şekil)"""
+    if not os.path.isdir(ders_klasoru):
+        raise CLIHatasi(f"Ders klasörü bulunamadı: {ders_klasoru}")
+    secilen_konular = {}
+    for konu_adi in konu_adlari:
+        konu_path = os.path.join(ders_klasoru, konu_adi)
+        if not os.path.isdir(konu_path):
+            raise CLIHatasi(f"Konu klasörü bulunamadı: {konu_path}")
+        secilen_konular[konu_adi] = konu_path
+    return secilen_konular
+
+
+def sinav_olustur(ayarlar):
+    """
+    Tek bir sınav PDF'i üretir.
+
+    Args:
+        ayarlar (dict): kok, ders, konular ({konu: sayi}), tip, zorluk, cikti,
+            baslik, cevap_anahtari, tohum, dpi
+
+    'kitapciklar' (örn: ["A", "B", "C", "D"]) verilirse AYNI soru seti her
+    kitapçık için farklı sırayla ayrı PDF'e yazılır ('PDFCreator.varyantlari_kaydet').
+
+    Returns:
+        list[dict]: Her PDF için {'cikti', 'soru', 'sayfa', 'bilinmeyen_cevap',
+            'eksik_konular'}. 'eksik_konular' = {konu: (istenen, secilen)}; kopyalar
+            elendiği / soru yetmediği için istenen sayıya ulaşamayan konular.
+    """
+    soru_tipi = str(ayarlar.get("tip", "")).lower()
+    zorluk = str(ayarlar.get("zorluk", "")).lower()
+    if soru_tipi not in SORU_TIPLERI:
+        raise CLIHatasi(f"Geçersiz soru tipi: '{soru_tipi}' ({'/'.join(SORU_TIPLERI)})")
+    if zorluk not in ZORLUKLAR:
+        raise CLIHatasi(f"Geçersiz zorluk: '{zorluk}' ({'/'.join(ZORLUKLAR)})")
+
+    konu_dagilimi = {k: int(v) for k, v in (ayarlar.get("konular") or {}).items() if int(v) > 0}
+    if not konu_dagilimi:
+        raise CLIHatasi("En az bir konu için soru sayısı belirtmelisiniz!")
+    for anahtar in ("kok", "ders", "cikti"):
+        if not ayarlar.get(anahtar):
+            raise CLIHatasi(f"'{anahtar}' belirtilmedi.")
+
+    kok = ayarlar["kok"]
+    secilen_konular = konulari_bul(os.path.join(kok, ayarlar["ders"]), konu_dagilimi.keys())
+
+    # 1. SEÇİM (Arayüzdeki 'secili_gorselleri_al' ile aynı mantık)
+    tohum = ayarlar.get("tohum")
+    rastgele = random.Random(tohum) if tohum is not None else random.Random()
+    eksikler = {}
+    secilen_gorseller = gorselleri_sec(konu_dagilimi, secilen_konular, soru_tipi, zorluk, rastgele=rastgele,
+                                       eksikler=eksikler)
+    if not secilen_gorseller:
+        raise CLIHatasi("Seçilen konularda görsel bulunamadı!")
+
+    # 2. PLANLAMA
+    pdf = PDFCreator()
+    pdf.boyut_servisi = boyut_servisi_al(kok)
+    pdf.cikti_dpi = ayarlar.get("dpi")
+    pdf.soru_tipi = soru_tipi
+    pdf.baslik_ekle((ayarlar.get("baslik") or "").strip() or VARSAYILAN_BASLIK)
+    pdf.gorsel_listesi = secilen_gorseller
+
+    cikti = os.path.abspath(ayarlar["cikti"])
+    os.makedirs(os.path.dirname(cikti), exist_ok=True)
+
+    kitapciklar = ayarlar.get("kitapciklar")
+    if kitapciklar:
+        # KİTAPÇIK MODU: Tek seçim, N farklı sıralama (görseller bir kez hazırlanır)
+        govde, uzanti = os.path.splitext(cikti)
+        dosya_yollari = [f"{govde}_{etiket}{uzanti}" for etiket in kitapciklar]
+        tohumlar = [rastgele.randrange(2**32) for _ in kitapciklar]
+        varyantlar = pdf.varyantlari_kaydet(
+            dosya_yollari, tohumlar,
+            cevap_anahtari=bool(ayarlar.get("cevap_anahtari")),
+            baslik_etiketleri=[f"{etiket} Kitapçığı" for etiket in kitapciklar]
+        )
+        basarisiz = [v['dosya'] for v in varyantlar if not v['basarili']]
+        if basarisiz:
+            raise CLIHatasi(f"PDF kaydedilemedi: {', '.join(basarisiz)}")
+        return [{
+            'cikti': v['dosya'],
+            'soru': len(v['cevaplar']),
+            'sayfa': len(v['sayfa_haritasi']),
+            'bilinmeyen_cevap': sum(1 for c in v['cevaplar'] if str(c).strip() == "?"),
+            'eksik_konular': eksikler,
+        } for v in varyantlar]
+
+    if soru_tipi == "test":
+        sayfa_haritasi = pdf.planla_test_duzeni()
+    else:
+        sayfa_haritasi = pdf.planla_yazili_duzeni()
+
+    # 3. CEVAP ANAHTARI (Planlanmış sırayla)
+    cevaplar = cevap_anahtari(
+        soru_info['path']
+        for sayfa_sutunlari in sayfa_haritasi for sutun in sayfa_sutunlari for soru_info in sutun
+    )
+    if ayarlar.get("cevap_anahtari") and cevaplar:
+        pdf.cevap_anahtari_ekle(cevaplar)
+
+    # 4. KAYDET
+    if not pdf.kaydet(cikti, sayfa_haritasi):
+        raise CLIHatasi(f"PDF kaydedilemedi: {cikti}")
+
+    return [{
+        'cikti': cikti,
+        'soru': len(cevaplar),
+        'sayfa': len(sayfa_haritasi),
+        'bilinmeyen_cevap': sum(1 for c in cevaplar if str(c).strip() == "?"),
+        'eksik_konular': eksikler,
+    }]
+
+
+def manifest_oku(manifest_yolu):
+    """Manifest'i okur ve her varyant için birleştirilmiş 'ayarlar' listesi döndürür."""
+    try:
+        with open(manifest_yolu, "r", encoding="utf-8") as f:
+            manifest = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        raise CLIHatasi(f"Manifest okunamadı: {manifest_yolu} -> {e}")
+
+    manifest_klasoru = os.path.dirname(os.path.abspath(manifest_yolu))
+    varsayilanlar = {k: v for k, v in manifest.items() if k not in ("varyantlar", "adet")}
+
+    varyantlar = manifest.get("varyantlar")
+    if varyantlar is None:
+        adet = int(manifest.get("adet", 1))
+        varyantlar = [{} for _ in range(adet)]
+
+    ayar_listesi = []
+    for no, varyant in enumerate(varyantlar, start=1):
+        ayarlar = dict(varsayilanlar)
+        ayarlar.update(varyant)
+        # Ortak tohum verildiyse varyantlar aynı sınav olmasın: tohum, tohum+1, ...
+        if "tohum" not in varyant and varsayilanlar.get("tohum") is not None:
+            ayarlar["tohum"] = int(varsayilanlar["tohum"]) + no - 1
+        ayarlar.setdefault("tohum", None)
+        if "cikti" in ayarlar:
+            ayarlar["cikti"] = str(ayarlar["cikti"]).replace("{no}", str(no))
+        for anahtar in ("kok", "cikti"):
+            if ayarlar.get(anahtar) and not os.path.isabs(ayarlar[anahtar]):
+                ayarlar[anahtar] = os.path.join(manifest_klasoru, ayarlar[anahtar])
+        ayar_listesi.append(ayarlar)
+    return ayar_listesi
+
+
+def arguman_ayristirici():
+    parser = argparse.ArgumentParser(
+        prog="cli.py",
+        description="Soru Otomasyon Sistemi - Arayüzsüz sınav PDF'i üretimi"
+    )
+    parser.add_argument("--manifest", help="Birden fazla varyant için JSON manifest dosyası")
+    parser.add_argument("--kok", help="Soru bankası ana klasörü (ders klasörlerini içerir)")
+    parser.add_argument("--ders", help="Ders klasörünün adı")
+    parser.add_argument("--konu", action="append", metavar="KONU=SAYI",
+                        help="Konu ve soru sayısı (birden fazla verilebilir)")
+    parser.add_argument("--tip", choices=SORU_TIPLERI, help="Soru tipi")
+    parser.add_argument("--zorluk", choices=ZORLUKLAR, help="Zorluk seviyesi")
+    parser.add_argument("--baslik", default=VARSAYILAN_BASLIK, help="PDF başlığı")
+    parser.add_argument("--cevap-anahtari", action="store_true", help="Cevap anahtarı sayfası ekle")
+    parser.add_argument("--tohum", type=int, help="Tekrarlanabilir seçim için rastgelelik tohumu")
+    parser.add_argument("--dpi", type=int, help="Soru görsellerini bu DPI'a küçülterek göm")
+    parser.add_argument("--kitapcik", nargs="+", metavar="ETIKET",
+                        help="Aynı sorularla farklı sıralı kitapçıklar üret (örn: A B C D)")
+    parser.add_argument("-o", "--cikti", help="Çıktı PDF dosyası")
+    parser.add_argument("-v", "--ayrintili", action="store_true", help="Logları konsola da yaz")
+    return parser
+
+
+def main(argv=None):
+    parser = arguman_ayristirici()
+    args = parser.parse_args(argv)
+
+    setup_logging()
+    konsol = logging.StreamHandler()
+    konsol.setLevel(logging.INFO if args.ayrintili else logging.WARNING)
+    konsol.setFormatter(logging.Formatter("%(levelname)s | %(message)s"))
+    logging.getLogger().addHandler(konsol)
+
+    try:
+        if args.manifest:
+            ayar_listesi = manifest_oku(args.manifest)
+        else:
+            eksikler = [ad for ad in ("kok", "ders", "konu", "tip", "zorluk", "cikti") if not getattr(args, ad)]
+            if eksikler:
+                parser.error("Eksik argüman(lar): " + ", ".join("--" + ad for ad in eksikler))
+            ayar_listesi = [{
+                "kok": args.kok, "ders": args.ders, "konular": konu_dagilimi_coz(args.konu),
+                "tip": args.tip, "zorluk": args.zorluk, "cikti": args.cikti,
+                "baslik": args.baslik, "cevap_anahtari": args.cevap_anahtari,
+                "tohum": args.tohum, "dpi": args.dpi, "kitapciklar": args.kitapcik,
+            }]
+    except CLIHatasi as e:
+        print(f"HATA: {e}", file=sys.stderr)
+        return 2
+
+    logger.info(f"CLI: {len(ayar_listesi)} sınav üretilecek")
+    hatali = 0
+    for no, ayarlar in enumerate(ayar_listesi, start=1):
+        try:
+            sonuclar = sinav_olustur(ayarlar)
+            for sonuc in sonuclar:
+                uyari = f" ({sonuc['bilinmeyen_cevap']} cevap bilinmiyor)" if sonuc['bilinmeyen_cevap'] else ""
+                print(f"[{no}/{len(ayar_listesi)}] {sonuc['cikti']}: {sonuc['soru']} soru, {sonuc['sayfa']} sayfa{uyari}")
+            # Kitapçıklar aynı seçimi paylaşır: eksikler bir kez yazılır
+            for konu, (istenen, secilen) in sonuclar[0]['eksik_konular'].items():
+                print(f"[{no}/{len(ayar_listesi)}] UYARI: {konu}: {istenen} soru istendi, {secilen} seçilebildi "
+                      f"(aynı / çok benzer sorular elendi)", file=sys.stderr)
+        except CLIHatasi as e:
+            hatali += 1
+            print(f"[{no}/{len(ayar_listesi)}] HATA: {e}", file=sys.stderr)
+        except Exception as e:
+            hatali += 1
+            logger.error(f"CLI sınav üretim hatası (varyant {no})", exc_info=True)
+            print(f"[{no}/{len(ayar_listesi)}] BEKLENMEYEN HATA: {e}", file=sys.stderr)
+
+    return 1 if hatali else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
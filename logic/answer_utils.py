@@ -1,82 +1,164 @@
 import os
 import json
 import logging
+import threading
 
 # Yeni loglama sistemi: Bu modülün kendi logger'ını al.
 # Adı otomatik olarak 'logic.answer_utils' olacaktır.
 logger = logging.getLogger(__name__)
 
-def get_answer_for_image(image_path):
+def test_cevabi_ayikla(dosya_adi):
     """
-    GÜNCELLENDİ (HİBRİT SİSTEM):
-    Dosya yolunda 'test' kelimesi varsa cevabı dosya adından ('1-A.png') okur.
-    Dosya yolunda 'yazili' kelimesi varsa cevabı 'cevaplar.json' dosyasından okur.
+    Test sorusu dosya adından cevabı çıkarır ('1-A.png' -> 'A').
+    Dosya adında tire yoksa None döner (loglamaz; katalog taramasında da kullanılır).
+    """
+    file_root, _ = os.path.splitext(os.path.basename(dosya_adi))
+    if '-' not in file_root:
+        return None
+    # Dosya adını SADECE EN SON tire'den böl, boşlukları temizle ve BÜYÜK harfe çevir
+    return file_root.rsplit('-', 1)[-1].strip().upper()
+
+# --- Cevap Çözücü ---
+
+CEVAP_DOSYASI = "cevaplar.json"
+
+
+def _soru_modu(image_path):
+    """Yolda 'test' / 'yazili' klasörü geçiyorsa o modu, yoksa None döndürür."""
+    # Dosya yolunu küçük harfe çevirerek 'test' veya 'yazili' ara
+    # (Windows '\' vs Linux '/' ayırıcılarını standart hale getir)
+    normalized_path = os.path.normpath(image_path).lower().replace(os.sep, '/')
+    if '/test/' in normalized_path:
+        return 'test'
+    if '/yazili/' in normalized_path:
+        return 'yazili'
+    return None
+
+
+class CevapCozucu:
     """
-    try:
-        # Dosya yolunu küçük harfe çevirerek 'test' veya 'yazili' ara
-        # (Windows/Linux/Mac yolları için os.path.normpath ile normalize edelim)
-        normalized_path = os.path.normpath(image_path).lower()
-        
-        # Yoldaki ayırıcıları standart hale getir (Windows '\' vs Linux '/')
-        normalized_path = normalized_path.replace(os.sep, '/')
-
-        # --- TEST MODU (Dosya Adından Oku) ---
-        if '/test/' in normalized_path:
-            # 1. Dosya adını ve uzantısını ayır (örn: "1-A.png" -> "1-A" ve ".png")
-            filename_with_ext = os.path.basename(image_path)
-            file_root, file_ext = os.path.splitext(filename_with_ext)
-            
-            # 2. Dosya adında '-' (tire) olup olmadığını kontrol et
-            if '-' in file_root:
-                # 3. Dosya adını SADECE EN SON tire'den böl
-                parts = file_root.rsplit('-', 1)
-                
-                if len(parts) >= 2:
-                    # 4. Son parçayı (cevabı) al, boşlukları temizle ve BÜYÜK harfe çevir
-                    answer = parts[-1].strip().upper()
-                    return answer
+    YENİ: Görsel yollarından cevapları çözer (thread-safe).
+
+    'get_answer_for_image' her yazılı soru için klasörün 'cevaplar.json'
+    dosyasını açıp yeniden 'json.load' ediyordu; 40 soruluk bir yazılı
+    sınavda aynı dosyalar onlarca kez ayrıştırılıyordu. Burada her klasörün
+    ayrıştırılmış JSON'u (mtime_ns, boyut) anahtarıyla önbelleklenir: dosya
+    değişmediyse sadece bir 'os.stat' yapılır.
+
+    Metodlar:
+    - cevap(self, image_path): Tek görselin cevabı (bulunamazsa "?").
+    - resolve_answers(self, paths): Yolları klasöre göre gruplar; her klasör
+        için cevap dosyası bir kez kontrol edilir. Cevapları 'paths' ile
+        AYNI sırada liste olarak döndürür.
+    - temizle(self): JSON önbelleğini boşaltır.
+    """
+
+    def __init__(self):
+        self._jsonlar = {} # {klasör: (mtime_ns, boyut, {dosya_adi: cevap})}
+        self._kilit = threading.Lock()
+
+    def cevap(self, image_path):
+        return self.resolve_answers([image_path])[0]
+
+    def resolve_answers(self, paths):
+        paths = list(paths)
+        cevaplar = ["?"] * len(paths)
+        klasorler = {} # {klasör: [(sıra, yol), ...]}
+        for i, image_path in enumerate(paths):
+            try:
+                mod = _soru_modu(image_path)
+                if mod == 'test':
+                    cevaplar[i] = self._test_cevabi(image_path)
+                elif mod == 'yazili':
+                    klasorler.setdefault(os.path.dirname(image_path), []).append((i, image_path))
                 else:
-                    logger.warning(f"TEST modu: Dosya '{filename_with_ext}' cevap formatı bozuk (tire'den sonrası yok).")
-                    return "?"
-            else:
-                # 5. Dosya adında '-' (tire) yoksa (örn: "soru.png")
-                logger.warning(f"TEST modu: Dosya '{filename_with_ext}' cevap formatına uymuyor (tire '-' yok).")
-                return "?"
-
-        # --- YAZILI MODU (JSON'dan Oku) ---
-        elif '/yazili/' in normalized_path:
-            folder_path = os.path.dirname(image_path)
-            metadata_path = os.path.join(folder_path, "cevaplar.json")
-            
-            if os.path.exists(metadata_path):
-                with open(metadata_path, "r", encoding="utf-8") as f:
-                    answers = json.load(f)
-                
+                    logger.error(f"Cevap okunamadı: Dosya yolu '{image_path}' ne 'test' ne de 'yazili' içeriyor.")
+            except Exception:
+                # Beklenmedik bir hata olursa ASLA ÇÖKME
+                logger.error(f"Cevap okunurken beklenmedik bir hata oluştu: {image_path}", exc_info=True)
+
+        for folder_path, sorular in klasorler.items():
+            answers = self._klasor_cevaplari(folder_path)
+            if answers is None:
+                continue
+            for i, image_path in sorular:
                 filename = os.path.basename(image_path)
-                # JSON'dan cevabı al
                 answer = answers.get(filename, "?")
-                
                 if answer == "?":
                     logger.warning(f"YAZILI modu: Dosya '{filename}' cevap metadata'sında bulunamadı.")
-                
-                return answer
-            else:
-                logger.warning(f"YAZILI modu: Metadata dosyası bulunamadı: {os.path.basename(folder_path)}/cevaplar.json")
-                return "?"
-
-        # --- HİÇBİRİ DEĞİLSE (veya format bozuksa) ---
-        else:
-            logger.error(f"Cevap okunamadı: Dosya yolu '{image_path}' ne 'test' ne de 'yazili' içeriyor.")
-            return "?"
-            
-    except json.JSONDecodeError as e:
-        logger.error(f"YAZILI modu: JSON dosyası bozuk veya okunamıyor: {metadata_path}", exc_info=True)
-        return "?"
-    except Exception as e:
-        # 7. Beklenmedik bir hata olursa ASLA ÇÖKME
-        logger.error(f"Cevap okunurken beklenmedik bir hata oluştu: {image_path}", exc_info=True)
+                cevaplar[i] = answer
+        return cevaplar
+
+    @staticmethod
+    def _test_cevabi(image_path):
+        """TEST modu: cevap dosya adından ('1-A.png') okunur."""
+        filename_with_ext = os.path.basename(image_path)
+        answer = test_cevabi_ayikla(filename_with_ext)
+        if answer is not None:
+            return answer
+        # Dosya adında '-' (tire) yoksa (örn: "soru.png")
+        logger.warning(f"TEST modu: Dosya '{filename_with_ext}' cevap formatına uymuyor (tire '-' yok).")
         return "?"
 
+    def _klasor_cevaplari(self, folder_path):
+        """YAZILI modu: klasörün 'cevaplar.json' içeriği (önbellekten); okunamazsa None."""
+        metadata_path = os.path.join(folder_path, CEVAP_DOSYASI)
+        anahtar = os.path.normpath(os.path.abspath(folder_path))
+        try:
+            st = os.stat(metadata_path)
+        except OSError:
+            with self._kilit:
+                self._jsonlar.pop(anahtar, None)
+            logger.warning(f"YAZILI modu: Metadata dosyası bulunamadı: {os.path.basename(folder_path)}/{CEVAP_DOSYASI}")
+            return None
+
+        with self._kilit:
+            kayit = self._jsonlar.get(anahtar)
+        if kayit is not None and kayit[:2] == (st.st_mtime_ns, st.st_size):
+            return kayit[2]
+
+        try:
+            with open(metadata_path, "r", encoding="utf-8") as f:
+                answers = json.load(f)
+            if not isinstance(answers, dict):
+                raise ValueError("cevaplar.json bir sözlük (dosya_adi: cevap) olmalı")
+        except (json.JSONDecodeError, ValueError):
+            logger.error(f"YAZILI modu: JSON dosyası bozuk veya okunamıyor: {metadata_path}", exc_info=True)
+            return None
+        except Exception:
+            logger.error(f"Cevap dosyası okunurken beklenmedik bir hata oluştu: {metadata_path}", exc_info=True)
+            return None
+
+        with self._kilit:
+            self._jsonlar[anahtar] = (st.st_mtime_ns, st.st_size, answers)
+        return answers
+
+    def temizle(self):
+        with self._kilit:
+            self._jsonlar.clear()
+
+
+_cozucu = CevapCozucu()
+
+
+def resolve_answers(paths):
+    """
+    YENİ: Görsel yollarının cevaplarını 'paths' ile aynı sırada döndürür.
+    Yazılı klasörlerinin 'cevaplar.json' dosyaları klasör başına bir kez
+    (değişmediyse hiç) okunur.
+    """
+    return _cozucu.resolve_answers(paths)
+
+
+def get_answer_for_image(image_path):
+    """
+    GÜNCELLENDİ (HİBRİT SİSTEM):
+    Dosya yolunda 'test' kelimesi varsa cevabı dosya adından ('1-A.png') okur.
+    Dosya yolunda 'yazili' kelimesi varsa cevabı 'cevaplar.json' dosyasından okur.
+    Paylaşılan 'CevapCozucu' üzerinden çalışır; JSON her seferinde ayrıştırılmaz.
+    """
+    return _cozucu.cevap(image_path)
+
 def set_log_level(level):
     """Logger seviyesini degistirir."""
     level_map = {
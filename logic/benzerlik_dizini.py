@@ -0,0 +1,398 @@
+# logic/benzerlik_dizini.py
+
+import os
+import math
+import time
+import sqlite3
+import logging
+import threading
+import statistics
+from concurrent.futures import ThreadPoolExecutor
+from PIL import Image
+from logic.soru_katalogu import katalog_al
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    np = None
+    NUMPY_AVAILABLE = False
+
+"""
+Soru Otomasyon Sistemi - Algısal Benzerlik Dizini (Yakın Kopya Tespiti)
+
+İçerik özeti ('icerik_dizini') yalnızca BAYT BAYT aynı dosyaları yakalar.
+Aynı sorunun farklı çözünürlükte yeniden taranmış / yeniden kaydedilmiş
+hali farklı özet verir. Bu modül her soru görseli için algısal özetler
+hesaplar ve birbirine çok yakın görselleri kümeler.
+
+Soru görselleri beyaz zemin üzerinde yazıdır ve genelde geniştir; kare
+32x32'ye indirilen klasik pHash farklı soruları satır düzenleri benzer
+diye eşleştiriyordu. Bu yüzden:
+- Görsel (uzun kenarı yatay olacak şekilde) 128x32 gri ızgaraya indirilir
+  ve 2B DCT'si alınır. DCT bir matris çarpımıdır; NumPy varsa bir
+  yığındaki tüm görseller tek 'matmul' ile hesaplanır, yoksa saf Python
+  (ayrık, sadece gereken katsayılar) kullanılır.
+- Aday özeti: en düşük 8x8 katsayı, medyana göre 64 bit. Yalnızca aday
+  bulmak için kullanılır.
+- Doğrulama özeti: 8 dikey x 32 yatay katsayı, 256 bit. Yazı satırlarının
+  ayrıntısını taşır; farklı sorular arasında mesafe yeniden kaydedilmiş
+  kopyalara göre çok büyüktür.
+- En/boy oranı: oranları 'EN_BOY_TOLERANSI'ndan fazla farklı görseller
+  kopya sayılmaz.
+
+Tüm çiftleri karşılaştırmak yerine çoklu indeksli hashing kullanılır:
+64 bitlik aday özeti 4 adet 16 bitlik parçaya bölünür; mesafe <= 7 ise
+(güvercin yuvası) en az bir parça en fazla 1 bit farklıdır. Her parça için
+17 kova bakılır, yalnızca bu adaylar doğrulanır.
+
+Kümeler zincirlenmez: görseller sabit sırada işlenir, her görsel yalnızca
+bir kümenin TEMSİLCİSİNE (ilk görseli) yakınsa o kümeye girer. Böylece
+"A~B, B~C" zinciriyle birbirine benzemeyen sorular aynı kümeye düşmez.
+
+Özetler, katalog anlık görüntüsüyle aynı SQLite dosyasında
+('algisal_ozetler' tablosu) tutulur; 'guncelle()' sadece yeni/değişmiş
+dosyaları işler.
+
+Ana Sınıf:
+- BenzerlikDizini:
+  'guncelle()' toplu işi çalıştırır; 'kume(yol)', 'kume_no(yol)' ve
+  'kumeler()' yakın kopya kümelerini verir.
+
+Yardımcı:
+- benzerlik_dizini_al(kok_klasor): Kök klasör başına TEK dizin döndürür.
+- algisal_ozetler(izgaralar): 128x32 gri görsel listesinden [(aday, ozet), ...].
+"""
+
+logger = logging.getLogger(__name__)
+
+ADAY_ESIGI = 7            # 64 bitlik aday özeti; 4 parçalı indeks bu değere göre (<= 7)
+DOGRULAMA_ESIGI = 24      # 256 bitlik doğrulama özeti
+EN_BOY_TOLERANSI = 0.05   # |log(oran_a / oran_b)|
+YIGIN_BOYUTU = 128
+OKUMA_ISCI_SAYISI = min(4, os.cpu_count() or 1)
+_PARCA_SAYISI = 4
+_PARCA_BIT = 64 // _PARCA_SAYISI
+_PARCA_MASKESI = (1 << _PARCA_BIT) - 1
+_PARCA_YARICAPI = ADAY_ESIGI // _PARCA_SAYISI
+
+_IZGARA_EN, _IZGARA_BOY = 128, 32
+_K_EN, _K_BOY = 32, 8     # Saklanan katsayılar: 8 dikey x 32 yatay frekans
+_ADAY_K = 8               # Aday özeti: 8 x 8 en düşük frekans
+
+
+def _dct_satirlari(n, k):
+    """n noktalı ortonormal DCT-II matrisinin ilk k satırı."""
+    satirlar = []
+    for u in range(k):
+        olcek = math.sqrt(1.0 / n) if u == 0 else math.sqrt(2.0 / n)
+        satirlar.append([olcek * math.cos(math.pi * (2 * x + 1) * u / (2 * n)) for x in range(n)])
+    return satirlar
+
+
+_DCT_YATAY = _dct_satirlari(_IZGARA_EN, _K_EN)   # (32, 128)
+_DCT_DIKEY = _dct_satirlari(_IZGARA_BOY, _K_BOY)  # (8, 32)
+if NUMPY_AVAILABLE:
+    _DCT_YATAY_M = np.array(_DCT_YATAY, dtype=np.float64)
+    _DCT_DIKEY_M = np.array(_DCT_DIKEY, dtype=np.float64)
+
+
+def mesafe(a, b):
+    return bin(a ^ b).count("1")
+
+
+def en_boy_uyumlu(en_a, boy_a, en_b, boy_b):
+    """İki görselin en/boy oranı 'EN_BOY_TOLERANSI' içinde mi?"""
+    if not (en_a and boy_a and en_b and boy_b):
+        return False
+    return abs(math.log((en_a * boy_b) / (boy_a * en_b))) <= EN_BOY_TOLERANSI
+
+
+def _bitleri_sayiya(bitler):
+    sonuc = 0
+    for bit in bitler:
+        sonuc = (sonuc << 1) | (1 if bit else 0)
+    return sonuc
+
+
+def _kucuk_gri_oku(path):
+    """Görseli 128x32 gri ızgaraya indirir; (ızgara, (en, boy)) veya okunamazsa None."""
+    try:
+        with Image.open(path) as img:
+            boyut = img.size
+            if img.format == "JPEG":
+                img.draft("L", (_IZGARA_EN * 2, _IZGARA_EN * 2))
+            if img.mode in ("RGBA", "LA") or (img.mode == "P" and "transparency" in img.info):
+                img = img.convert("RGBA")
+                zemin = Image.new("RGBA", img.size, "white")
+                zemin.alpha_composite(img)
+                img = zemin
+            gri = img.convert("L")
+            if gri.height > gri.width:
+                gri = gri.transpose(Image.TRANSPOSE) # Uzun kenar yatay
+            return gri.resize((_IZGARA_EN, _IZGARA_BOY), Image.LANCZOS), boyut
+    except Exception as e:
+        logger.debug(f"Algısal özet için okunamadı: {path} -> {e}")
+        return None
+
+
+def algisal_ozetler(izgaralar):
+    """[gri_128x32, ...] -> [(aday_64bit, ozet_256bit), ...]"""
+    if not izgaralar:
+        return []
+    if NUMPY_AVAILABLE:
+        return _algisal_ozetler_numpy(izgaralar)
+    return [_algisal_ozet_python(g) for g in izgaralar]
+
+
+def _algisal_ozetler_numpy(izgaralar):
+    x = np.stack([np.asarray(g, dtype=np.float64) for g in izgaralar])           # (N, 32, 128)
+    katsayilar = np.matmul(np.matmul(_DCT_DIKEY_M, x), _DCT_YATAY_M.T)         # (N, 8, 32)
+    n = len(izgaralar)
+
+    dusuk = katsayilar[:, :, :_ADAY_K].reshape(n, -1)                          # (N, 64)
+    a_bitler = dusuk > np.median(dusuk[:, 1:], axis=1, keepdims=True)          # DC hariç
+    tum = katsayilar.reshape(n, -1)                                            # (N, 256)
+    o_bitler = tum > np.median(tum[:, 1:], axis=1, keepdims=True)
+
+    adaylar = [int.from_bytes(satir.tobytes(), "big") for satir in np.packbits(a_bitler, axis=1)]
+    ozetler = [int.from_bytes(satir.tobytes(), "big") for satir in np.packbits(o_bitler, axis=1)]
+    return list(zip(adaylar, ozetler))
+
+
+def _algisal_ozet_python(izgara):
+    piksel = list(izgara.tobytes()) # "L" kipinde piksel başına bir bayt
+    satirlar = [piksel[y * _IZGARA_EN:(y + 1) * _IZGARA_EN] for y in range(_IZGARA_BOY)]
+    # Ayrık DCT: önce satırlar (32x32), sonra sütunlar (8x32)
+    ara = [[sum(a * b for a, b in zip(satir, _DCT_YATAY[v])) for v in range(_K_EN)] for satir in satirlar]
+    katsayilar = [
+        [sum(_DCT_DIKEY[u][y] * ara[y][v] for y in range(_IZGARA_BOY)) for v in range(_K_EN)]
+        for u in range(_K_BOY)
+    ]
+    dusuk = [k for satir in katsayilar for k in satir[:_ADAY_K]]
+    medyan = statistics.median(dusuk[1:])
+    aday = _bitleri_sayiya(k > medyan for k in dusuk)
+    tum = [k for satir in katsayilar for k in satir]
+    medyan = statistics.median(tum[1:])
+    ozet = _bitleri_sayiya(k > medyan for k in tum)
+    return aday, ozet
+
+
+def _parca_varyantlari(parca):
+    """16 bitlik parçanın kendisi ve 1 bit farklı tüm halleri."""
+    yield parca
+    if _PARCA_YARICAPI >= 1:
+        for i in range(_PARCA_BIT):
+            yield parca ^ (1 << i)
+
+
+class BenzerlikDizini:
+    """
+    Soru bankası yakın kopya dizini (thread-safe).
+
+    Metodlar:
+    - guncelle(self, iptal_token=None): Yeni/değişen görsellerin algısal
+        özetlerini yığınlar halinde hesaplar, kümeleri yeniden kurar.
+    - kume_no(self, yol): Görselin küme numarası (yakın kopyası yoksa None).
+    - kume(self, yol): Görselle aynı kümedeki DİĞER yollar (set).
+    - kumeler(self): Tüm kümeler ([[yol, ...], ...], her biri >= 2 görsel).
+    """
+
+    def __init__(self, katalog):
+        self.katalog = katalog
+        self._yollar = {}    # {yol: (boyut, mtime_ns, aday, ozet, en, boy)}
+        self._kume_no = {}   # {yol: küme numarası}
+        self._kumeler = []   # [[yol, ...], ...]
+        self._kilit = threading.RLock()
+        self._yuklendi = False
+        self._guncelleme_kilidi = threading.Lock() # Eşitlemeler sırayla çalışır
+
+    @staticmethod
+    def _normal(yol):
+        return os.path.normcase(os.path.normpath(os.path.abspath(yol)))
+
+    # --- Sorgular ---
+
+    def kume_no(self, yol):
+        self._yukle()
+        with self._kilit:
+            return self._kume_no.get(self._normal(yol))
+
+    def kume(self, yol):
+        yol = self._normal(yol)
+        self._yukle()
+        with self._kilit:
+            no = self._kume_no.get(yol)
+            if no is None:
+                return set()
+            return set(self._kumeler[no]) - {yol}
+
+    def kumeler(self):
+        self._yukle()
+        with self._kilit:
+            return [list(k) for k in self._kumeler]
+
+    # --- Toplu iş ---
+
+    def guncelle(self, iptal_token=None):
+        """
+        Katalogdaki soru görsellerinin algısal özetlerini günceller (thread'de
+        çalışmalıdır). Ders ekranı ile resim yönetimi ekranı aynı anda
+        çağırırsa ikincisi ilkini bekler; görseller iki kez okunmaz.
+        """
+        with self._guncelleme_kilidi:
+            self._guncelle(iptal_token)
+
+    def _guncelle(self, iptal_token):
+        self._yukle()
+        baslangic = time.perf_counter()
+        mevcut, bekleyen = {}, []
+        for klasor in self.katalog.gorsel_klasorleri():
+            for ad, (boyut, mtime_ns) in self.katalog.klasor_dosyalari(klasor).items():
+                yol = self._normal(os.path.join(klasor, ad))
+                mevcut[yol] = (boyut, mtime_ns)
+                with self._kilit:
+                    kayit = self._yollar.get(yol)
+                if kayit is None or kayit[:2] != (boyut, mtime_ns):
+                    bekleyen.append(yol)
+
+        yeni = {}
+        with ThreadPoolExecutor(max_workers=OKUMA_ISCI_SAYISI, thread_name_prefix="AlgisalOzet") as havuz:
+            for i in range(0, len(bekleyen), YIGIN_BOYUTU):
+                if iptal_token is not None and iptal_token.is_set():
+                    return
+                yigin = bekleyen[i:i + YIGIN_BOYUTU]
+                okunanlar = [(yol, g) for yol, g in zip(yigin, havuz.map(_kucuk_gri_oku, yigin)) if g]
+                ozetler = algisal_ozetler([izgara for _, (izgara, _) in okunanlar])
+                for (yol, (_, (en, boy))), (aday, ozet) in zip(okunanlar, ozetler):
+                    yeni[yol] = mevcut[yol] + (aday, ozet, en, boy)
+
+        with self._kilit:
+            silinen = [yol for yol in self._yollar if yol not in mevcut]
+            for yol in silinen:
+                del self._yollar[yol]
+            self._yollar.update(yeni)
+            self._kumeleri_kur()
+            kume_sayisi = len(self._kumeler)
+        self._kaydet(yeni, silinen)
+        logger.info(
+            f"Benzerlik dizini güncellendi: {len(mevcut)} görsel, {len(yeni)} yeni özet "
+            f"({'NumPy' if NUMPY_AVAILABLE else 'saf Python'}), {kume_sayisi} yakın kopya kümesi, "
+            f"{time.perf_counter() - baslangic:.2f} sn"
+        )
+
+    def _kumeleri_kur(self):
+        """
+        Çoklu indeksli hashing + temsilciye bağlı kümeleme (kilit altında).
+
+        Görseller yol sırasıyla işlenir. Her görsel, aday özeti yakın olan
+        küme TEMSİLCİLERİ arasında en/boy oranı uyan ve doğrulama özeti
+        'DOGRULAMA_ESIGI' içinde kalan en yakın temsilcinin kümesine girer;
+        yoksa kendisi yeni bir kümenin temsilcisi olur. İndekste yalnızca
+        temsilciler tutulur, bu yüzden benzerlik zincirleme yayılmaz.
+        """
+        yollar = sorted(self._yollar)
+        kovalar = [{} for _ in range(_PARCA_SAYISI)]  # Yalnızca temsilciler
+        gruplar = {}                                  # {temsilci yolu: [yol, ...]}
+
+        for yol in yollar:
+            aday, ozet, en, boy = self._yollar[yol][2:]
+            adaylar = set()
+            for p in range(_PARCA_SAYISI):
+                parca = (aday >> (p * _PARCA_BIT)) & _PARCA_MASKESI
+                for varyant in _parca_varyantlari(parca):
+                    adaylar.update(kovalar[p].get(varyant, ()))
+
+            en_yakin = None
+            for temsilci in adaylar:
+                t_aday, t_ozet, t_en, t_boy = self._yollar[temsilci][2:]
+                if mesafe(aday, t_aday) > ADAY_ESIGI or not en_boy_uyumlu(en, boy, t_en, t_boy):
+                    continue
+                fark = mesafe(ozet, t_ozet)
+                if fark <= DOGRULAMA_ESIGI and (en_yakin is None or (fark, temsilci) < en_yakin):
+                    en_yakin = (fark, temsilci)
+
+            if en_yakin is not None:
+                gruplar[en_yakin[1]].append(yol)
+                continue
+            gruplar[yol] = [yol]
+            for p in range(_PARCA_SAYISI):
+                kovalar[p].setdefault((aday >> (p * _PARCA_BIT)) & _PARCA_MASKESI, []).append(yol)
+
+        self._kumeler = [g for g in gruplar.values() if len(g) > 1]
+        self._kume_no = {yol: no for no, kume in enumerate(self._kumeler) for yol in kume}
+
+    # --- Kalıcılık ---
+
+    def _baglan(self):
+        baglanti = self.katalog.anlik_goruntu_baglantisi()
+        sutunlar = {satir[1] for satir in baglanti.execute("PRAGMA table_info(algisal_ozetler)")}
+        if sutunlar and "ozet" not in sutunlar:
+            # Eski biçim (64 bit pHash/dHash): özetler yeniden hesaplanacak
+            baglanti.execute("DROP TABLE algisal_ozetler")
+        baglanti.execute(
+            "CREATE TABLE IF NOT EXISTS algisal_ozetler ("
+            "yol TEXT PRIMARY KEY, boyut INTEGER, mtime_ns INTEGER, aday TEXT, ozet TEXT, "
+            "en INTEGER, boy INTEGER) WITHOUT ROWID"
+        )
+        return baglanti
+
+    def _yukle(self):
+        if self._yuklendi:
+            return
+        with self._kilit:
+            if self._yuklendi:
+                return
+            self._yuklendi = True
+            if not os.path.exists(self.katalog.anlik_goruntu_yolu):
+                return
+            try:
+                baglanti = self._baglan()
+                try:
+                    for goreli, boyut, mtime_ns, aday, ozet, en, boy in baglanti.execute(
+                            "SELECT yol, boyut, mtime_ns, aday, ozet, en, boy FROM algisal_ozetler"):
+                        self._yollar[self._normal(self.katalog._mutlak(goreli))] = (
+                            boyut, mtime_ns, int(aday, 16), int(ozet, 16), en, boy)
+                finally:
+                    baglanti.close()
+            except (sqlite3.Error, ValueError, TypeError) as e:
+                logger.warning(f"Benzerlik dizini okunamadı, yeniden oluşturulacak: {e}")
+                self._yollar.clear()
+            self._kumeleri_kur()
+
+    def _kaydet(self, yeni, silinen):
+        if not yeni and not silinen:
+            return
+        try:
+            baglanti = self._baglan()
+            try:
+                with baglanti:
+                    baglanti.executemany(
+                        "DELETE FROM algisal_ozetler WHERE yol = ?",
+                        [(g,) for g in map(self.katalog._goreli, silinen) if g is not None]
+                    )
+                    baglanti.executemany(
+                        "INSERT OR REPLACE INTO algisal_ozetler (yol, boyut, mtime_ns, aday, ozet, en, boy) "
+                        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+                        [(g, boyut, mtime_ns, f"{aday:016x}", f"{ozet:064x}", en, boy)
+                         for g, (boyut, mtime_ns, aday, ozet, en, boy) in
+                         ((self.katalog._goreli(yol), kayit) for yol, kayit in yeni.items())
+                         if g is not None]
+                    )
+            finally:
+                baglanti.close()
+        except sqlite3.Error as e:
+            logger.warning(f"Benzerlik dizini kaydedilemedi: {e}")
+
+
+_dizinler = {}
+_dizinler_kilit = threading.Lock()
+
+
+def benzerlik_dizini_al(kok_klasor):
+    """Aynı soru bankası için her yerden AYNI dizini döndürür."""
+    katalog = katalog_al(kok_klasor)
+    with _dizinler_kilit:
+        if katalog.kok not in _dizinler:
+            _dizinler[katalog.kok] = BenzerlikDizini(katalog)
+        return _dizinler[katalog.kok]
@@ -0,0 +1,238 @@
+# logic/gorsel_hazirlayici.py
+
+import os
+import math
+import hashlib
+import logging
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from PIL import Image as PILImage
+from logic.gorsel_olcer import baslik_boyutu_oku
+from logic.uygulama_klasorleri import onbellek_klasoru
+
+"""
+Soru Otomasyon Sistemi - PDF Görsel Hazırlayıcı
+
+'_create_working_test_layout' soru görselini orijinal yoluyla 'drawImage'e
+verir; telefonla çekilmiş 4000px'lik bir soru ~270pt'lik sütuna basılsa bile
+PDF'e TAM çözünürlükte gömülür. Bu modül, görseli PDF'te basılacağı boyuta
+ve hedef DPI'a göre küçültür:
+
+- JPEG kaynaklar JPEG olarak (ReportLab JPEG'i yeniden kodlamadan gömer),
+  diğerleri PNG (Flate) olarak kaydedilir.
+- Sonuçlar içerik özeti (BLAKE2) + hedef piksel boyutu anahtarıyla diskte
+  önbelleklenir; aynı soru bir sonraki PDF'te tekrar işlenmez.
+- Görsel zaten hedef çözünürlükte veya daha küçükse orijinal yol döner
+  (asla büyütme yapılmaz).
+
+Ana Sınıf:
+- GorselHazirlayici:
+  'hazirla(path, genislik_pt, yukseklik_pt)' ile PDF'e gömülecek yolu döndürür.
+  'toplu_hazirla(istekler)' ile tüm PDF'in görsellerini CPU sayısı kadar
+  process'te (ProcessPoolExecutor) önceden hazırlar.
+
+Yardımcı:
+- gorsel_hazirla(...): Tek görseli işleyen, modül seviyesindeki (pickle
+  edilebilir) fonksiyon. Sınıf bunu kullanır.
+"""
+
+logger = logging.getLogger(__name__)
+
+JPEG_KALITESI = 85
+# Hedefin bu kadar üstünde olmayan görseller küçültülmez (gereksiz kayıp olmasın)
+KUCULTME_ESIGI = 1.05
+_JPEG_UZANTILARI = ('.jpg', '.jpeg')
+# Bundan az görsel için process havuzu açmaya değmez (açılış maliyeti).
+# Ölçüm: spawn ile bir işçinin açılışı ~150-180 ms; 4000x3000 telefon JPEG'i
+# 'draft' sayesinde sıralı ~33 ms'de, aynı boyutta PNG ~290 ms'de hazırlanır.
+# 4 işçiyle havuz, N * 33 * (1 - 1/4) > ~180 ms olduğunda, yani ~8 JPEG'den
+# itibaren kazandırır (PNG'de zaten ilk görselden itibaren).
+PARALEL_ESIK = 8
+
+
+def varsayilan_onbellek_klasoru():
+    """PDF görsel önbelleğinin klasörü."""
+    return onbellek_klasoru("pdf_gorselleri")
+
+
+def icerik_ozeti(gorsel_path):
+    """Dosya içeriğinin BLAKE2b özeti (hex)."""
+    ozet = hashlib.blake2b(digest_size=16)
+    with open(gorsel_path, "rb") as f:
+        for parca in iter(lambda: f.read(1024 * 1024), b""):
+            ozet.update(parca)
+    return ozet.hexdigest()
+
+
+def _beyaz_zemine_al(img):
+    """Şeffaf görselleri beyaz zemine oturtur (PDF'te siyah zemin çıkmasın)."""
+    if img.mode == "P":
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+    if img.mode in ("RGBA", "LA"):
+        zemin = PILImage.new("RGB", img.size, "white")
+        zemin.paste(img, mask=img.getchannel("A"))
+        return zemin
+    if img.mode not in ("RGB", "L"):
+        return img.convert("RGB")
+    return img
+
+
+def gorsel_hazirla(gorsel_path, genislik_pt, yukseklik_pt, hedef_dpi, onbellek_klasoru, jpeg_kalitesi=JPEG_KALITESI):
+    """
+    Görseli PDF'te basılacağı boyuta ('genislik_pt' x 'yukseklik_pt') ve
+    'hedef_dpi'a göre küçültüp önbelleğe yazar, gömülecek yolu döndürür.
+    Küçültme gerekmiyorsa 'gorsel_path'in kendisi döner.
+    """
+    hedef_genislik = max(1, math.ceil(genislik_pt * hedef_dpi / 72.0))
+    hedef_yukseklik = max(1, math.ceil(yukseklik_pt * hedef_dpi / 72.0))
+
+    # 1. Sadece başlığa bakarak küçültme gerekip gerekmediğine karar ver
+    try:
+        boyut = baslik_boyutu_oku(gorsel_path)
+    except Exception:
+        boyut = None
+    if not boyut:
+        with PILImage.open(gorsel_path) as img:
+            boyut = img.size
+    orijinal_genislik, orijinal_yukseklik = boyut
+
+    if (orijinal_genislik <= hedef_genislik * KUCULTME_ESIGI
+            and orijinal_yukseklik <= hedef_yukseklik * KUCULTME_ESIGI):
+        return gorsel_path
+
+    # En/boy oranını orijinalden koru
+    olcek = min(hedef_genislik / orijinal_genislik, hedef_yukseklik / orijinal_yukseklik)
+    yeni_boyut = (max(1, round(orijinal_genislik * olcek)), max(1, round(orijinal_yukseklik * olcek)))
+
+    # 2. Önbellekte var mı? (İçerik özeti: dosya taşınsa/yeniden adlandırılsa da geçerli)
+    jpeg_mi = gorsel_path.lower().endswith(_JPEG_UZANTILARI)
+    uzanti = ".jpg" if jpeg_mi else ".png"
+    ozet = icerik_ozeti(gorsel_path)
+    hedef_yol = os.path.join(
+        onbellek_klasoru, ozet[:2],
+        f"{ozet}_{yeni_boyut[0]}x{yeni_boyut[1]}" + (f"_q{jpeg_kalitesi}" if jpeg_mi else "") + uzanti
+    )
+    if os.path.exists(hedef_yol):
+        return hedef_yol
+
+    # 3. Küçült ve kaydet
+    with PILImage.open(gorsel_path) as img:
+        if jpeg_mi:
+            img.draft("RGB", yeni_boyut) # JPEG'i DCT seviyesinde küçük çöz (çok hızlı)
+        img = _beyaz_zemine_al(img)
+        img = img.resize(yeni_boyut, PILImage.LANCZOS)
+
+        os.makedirs(os.path.dirname(hedef_yol), exist_ok=True)
+        gecici_yol = f"{hedef_yol}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            if jpeg_mi:
+                img.save(gecici_yol, "JPEG", quality=jpeg_kalitesi, optimize=True)
+            else:
+                img.save(gecici_yol, "PNG")
+            os.replace(gecici_yol, hedef_yol)
+        finally:
+            if os.path.exists(gecici_yol):
+                os.remove(gecici_yol)
+
+    logger.debug(
+        f"PDF görseli küçültüldü: {os.path.basename(gorsel_path)} "
+        f"{orijinal_genislik}x{orijinal_yukseklik} -> {yeni_boyut[0]}x{yeni_boyut[1]}"
+    )
+    return hedef_yol
+
+
+def _paketi_hazirla(paket):
+    """Process havuzu işçisi. Hata olursa None döner (ana thread tekrar dener ve loglar)."""
+    try:
+        return gorsel_hazirla(*paket)
+    except Exception:
+        return None
+
+
+class GorselHazirlayici:
+    """
+    PDF çıktısı için görsel küçültme aşaması.
+
+    Metodlar:
+    - hazirla(self, gorsel_path, genislik_pt, yukseklik_pt):
+        PDF'e gömülecek yolu döndürür. Hata olursa orijinal yol döner
+        (PDF yine oluşur, sadece küçültme atlanır).
+    - toplu_hazirla(self, istekler, max_workers=None, ilerleme_callback=None, iptal_token=None):
+        [(path, genislik_pt, yukseklik_pt), ...] listesini paralel hazırlar.
+        Process havuzu açılamazsa sıralı çalışır. 'ilerleme_callback(tamamlanan, toplam)'
+        her görselde çağrılır; 'iptal_token' set edilirse kalan işler bırakılır.
+    """
+
+    def __init__(self, hedef_dpi=300, onbellek_klasoru=None, jpeg_kalitesi=JPEG_KALITESI):
+        self.hedef_dpi = hedef_dpi
+        self.onbellek_klasoru = onbellek_klasoru or varsayilan_onbellek_klasoru()
+        self.jpeg_kalitesi = jpeg_kalitesi
+        # Aynı oturumda aynı görsel tekrar özetlenmesin: {(yol, mtime, boyut, w_pt, h_pt): sonuç}
+        self._sonuclar = {}
+
+    def _anahtar(self, gorsel_path, genislik_pt, yukseklik_pt):
+        st = os.stat(gorsel_path)
+        return (os.path.abspath(gorsel_path), st.st_mtime_ns, st.st_size, round(genislik_pt, 2), round(yukseklik_pt, 2))
+
+    def hazirla(self, gorsel_path, genislik_pt, yukseklik_pt):
+        try:
+            anahtar = self._anahtar(gorsel_path, genislik_pt, yukseklik_pt)
+            sonuc = self._sonuclar.get(anahtar)
+            if sonuc is None or not os.path.exists(sonuc):
+                sonuc = gorsel_hazirla(
+                    gorsel_path, genislik_pt, yukseklik_pt,
+                    self.hedef_dpi, self.onbellek_klasoru, self.jpeg_kalitesi
+                )
+                self._sonuclar[anahtar] = sonuc
+            return sonuc
+        except Exception as e:
+            logger.warning(f"Görsel küçültülemedi, orijinali kullanılacak: {gorsel_path} -> {e}")
+            return gorsel_path
+
+    def toplu_hazirla(self, istekler, max_workers=None, ilerleme_callback=None, iptal_token=None):
+        bekleyenler = {}
+        for gorsel_path, genislik_pt, yukseklik_pt in istekler:
+            try:
+                anahtar = self._anahtar(gorsel_path, genislik_pt, yukseklik_pt)
+            except OSError:
+                continue # Çizimde 'hazirla' loglayacak
+            if anahtar in self._sonuclar or anahtar in bekleyenler:
+                continue
+            bekleyenler[anahtar] = (
+                gorsel_path, genislik_pt, yukseklik_pt,
+                self.hedef_dpi, self.onbellek_klasoru, self.jpeg_kalitesi
+            )
+
+        if not bekleyenler:
+            return
+
+        anahtarlar = list(bekleyenler)
+        paketler = [bekleyenler[a] for a in anahtarlar]
+        isci_sayisi = min(max_workers or os.cpu_count() or 1, len(paketler))
+
+        def _topla(sonuc_akisi):
+            """Sonuçları geldikçe kaydeder; iptal edilirse False döner."""
+            for tamamlanan, (anahtar, sonuc) in enumerate(zip(anahtarlar, sonuc_akisi), start=1):
+                if sonuc:
+                    self._sonuclar[anahtar] = sonuc
+                if ilerleme_callback:
+                    ilerleme_callback(tamamlanan, len(anahtarlar))
+                if iptal_token is not None and iptal_token.is_set():
+                    return False
+            return True
+
+        if isci_sayisi > 1 and len(paketler) >= PARALEL_ESIK:
+            try:
+                parca = max(1, len(paketler) // (isci_sayisi * 4))
+                havuz = ProcessPoolExecutor(max_workers=isci_sayisi)
+                try:
+                    tamamlandi = _topla(havuz.map(_paketi_hazirla, paketler, chunksize=parca))
+                finally:
+                    havuz.shutdown(wait=True, cancel_futures=True)
+                if tamamlandi:
+                    logger.info(f"{len(paketler)} görsel {isci_sayisi} process ile hazırlandı.")
+                return
+            except Exception as e:
+                logger.warning(f"Paralel görsel hazırlama başarısız, sıralı devam ediliyor: {e}")
+
+        _topla(_paketi_hazirla(paket) for paket in paketler)
@@ -0,0 +1,237 @@
+# logic/gorsel_olcer.py
+
+import os
+import json
+import struct
+import logging
+import tempfile
+import threading
+from PIL import Image as PILImage
+from logic.uygulama_klasorleri import banka_onbellek_yolu
+
+"""
+Soru Otomasyon Sistemi - Görsel Boyut Servisi
+
+Planlama ('planla_test_duzeni') ve yazılı layout'ları, her soru görselinin
+SADECE genişlik/yüksekliğini bilmek ister. Bunun için resmi açmak
+(PIL.Image.open) gereksiz derecede pahalıdır; özellikle her 'Güncelle' /
+'Sil' işleminde tüm plan yeniden hesaplanırken.
+
+Bu modül:
+- PNG / JPEG / GIF / BMP dosyalarının SADECE başlığını (header) okuyarak
+  boyutu bulur. (Diğer formatlar için PIL'e düşer.)
+- Sonuçları (yol, mtime, boyut) anahtarıyla hafızada ve APPDATA altındaki
+  'onbellek/boyutlar' klasöründe, kökün yolundan türetilen bir JSON
+  dizininde saklar. (Eski sürümler dizini bankanın köküne
+  '.gorsel_boyutlari.json' olarak yazıyordu; bu kökün mtime'ını değiştirip
+  kataloğun kökü her açılışta yeniden listelemesine yol açıyordu. Yeni
+  dizin yoksa eski dosya bir kez okunur, bankaya artık yazılmaz.)
+  Dosya değişmediği sürece tekrar okuma yapılmaz, sadece 'os.stat' çağrılır.
+- Dizin, her yazıcıya özel bir geçici dosyaya yazılıp 'os.replace' ile
+  yerine konur; dışa aktarım thread'i ile UI thread'i aynı anda
+  'kaydet()' çağırsa da yarım yazılmış dosya yayınlanmaz.
+
+Ana Sınıf:
+- GorselBoyutServisi:
+  'boyut_al(path)' ile (genişlik, yükseklik) döndürür.
+  'kaydet()' ile değişen dizini diske yazar.
+
+Yardımcı:
+- boyut_servisi_al(kok_klasor): Kök klasör başına TEK servis döndürür.
+"""
+
+logger = logging.getLogger(__name__)
+
+INDEKS_KLASORU = "boyutlar"
+ESKI_INDEKS_DOSYA_ADI = ".gorsel_boyutlari.json"
+INDEKS_SURUMU = 1
+
+_PNG_IMZA = b"\x89PNG\r\n\x1a\n"
+# SOF (Start Of Frame) marker'ları: C0-CF arası, C4 (DHT), C8 (JPG), CC (DAC) hariç
+_JPEG_SOF_MARKERLARI = {m for m in range(0xC0, 0xD0) if m not in (0xC4, 0xC8, 0xCC)}
+
+
+def _jpeg_boyutu_oku(f):
+    """JPEG segmentlerini gezer, ilk SOF segmentinden (w, h) okur."""
+    f.seek(2)
+    while True:
+        bayt = f.read(1)
+        while bayt and bayt != b"\xff":
+            bayt = f.read(1)
+        while bayt == b"\xff":
+            bayt = f.read(1)
+        if not bayt:
+            return None
+
+        marker = bayt[0]
+        if marker == 0x01 or 0xD0 <= marker <= 0xD8:
+            continue # Uzunluğu olmayan marker'lar
+        if marker in (0xD9, 0xDA):
+            return None # Görüntü verisine geldik ama SOF bulunamadı
+
+        uzunluk_baytlari = f.read(2)
+        if len(uzunluk_baytlari) < 2:
+            return None
+        segment_uzunlugu = struct.unpack(">H", uzunluk_baytlari)[0]
+
+        if marker in _JPEG_SOF_MARKERLARI:
+            veri = f.read(5)
+            if len(veri) < 5:
+                return None
+            yukseklik, genislik = struct.unpack(">HH", veri[1:5])
+            return genislik, yukseklik
+
+        f.seek(segment_uzunlugu - 2, os.SEEK_CUR)
+
+
+def baslik_boyutu_oku(gorsel_path):
+    """
+    Görselin boyutunu SADECE dosya başlığından okur.
+    Desteklenmeyen/bozuk başlıkta None döner (çağıran PIL'e düşer).
+    """
+    with open(gorsel_path, "rb") as f:
+        bas = f.read(26)
+
+        if bas.startswith(_PNG_IMZA) and bas[12:16] == b"IHDR":
+            return struct.unpack(">II", bas[16:24])
+
+        if bas[:2] == b"\xff\xd8":
+            return _jpeg_boyutu_oku(f)
+
+        if bas[:6] in (b"GIF87a", b"GIF89a"):
+            return struct.unpack("<HH", bas[6:10])
+
+        if bas[:2] == b"BM" and len(bas) >= 26:
+            genislik, yukseklik = struct.unpack("<ii", bas[18:26])
+            return genislik, abs(yukseklik) # Negatif yükseklik = yukarıdan aşağı BMP
+
+    return None
+
+
+class GorselBoyutServisi:
+    """
+    (yol, mtime, boyut) anahtarlı, diske kalıcı görsel boyut önbelleği.
+
+    Metodlar:
+    - boyut_al(self, gorsel_path):
+        (genişlik, yükseklik) döndürür. Görsel okunamazsa OSError/ValueError fırlatır
+        (çağıranlar zaten bu durumda varsayılan boyuta düşüyor).
+    - kaydet(self):
+        Dizin değiştiyse APPDATA'daki dizin dosyasına yazar (değişmediyse hiçbir şey yapmaz).
+    """
+
+    def __init__(self, kok_klasor=None):
+        self.kok_klasor = os.path.normpath(kok_klasor) if kok_klasor else None
+        self._kayitlar = {}   # {anahtar_yol: [mtime_ns, boyut, w, h]}
+        self._degisti = False
+        self._kilit = threading.Lock()
+
+        if self.kok_klasor:
+            self.indeks_yolu = banka_onbellek_yolu(self.kok_klasor, INDEKS_KLASORU, ".json")
+            self._yukle()
+        else:
+            self.indeks_yolu = None # Sadece hafızada çalışır
+
+    def _anahtar(self, gorsel_path):
+        """Kök içindeki yolları taşınabilir olsun diye göreli ('/' ayraçlı) tutar."""
+        tam_yol = os.path.normpath(os.path.abspath(gorsel_path))
+        if self.kok_klasor:
+            try:
+                goreli = os.path.relpath(tam_yol, self.kok_klasor)
+                if not goreli.startswith(".."):
+                    return goreli.replace(os.sep, "/")
+            except ValueError:
+                pass # Windows: farklı sürücü
+        return tam_yol
+
+    def _yukle(self):
+        yol = self.indeks_yolu
+        if not os.path.exists(yol):
+            # Eski sürümün bankaya yazdığı dizin (yalnızca okunur)
+            yol = os.path.join(self.kok_klasor, ESKI_INDEKS_DOSYA_ADI)
+            if not os.path.exists(yol):
+                return
+            self._degisti = True # İlk 'kaydet()' yeni yere taşısın
+        try:
+            with open(yol, "r", encoding="utf-8") as f:
+                veri = json.load(f)
+            if veri.get("surum") != INDEKS_SURUMU:
+                logger.info(f"Boyut dizini sürümü farklı, yeniden oluşturulacak: {yol}")
+                return
+            self._kayitlar = veri.get("gorseller", {})
+            logger.info(f"Görsel boyut dizini yüklendi: {len(self._kayitlar)} kayıt")
+        except Exception as e:
+            logger.warning(f"Görsel boyut dizini okunamadı, yok sayılıyor: {yol} -> {e}")
+            self._kayitlar = {}
+
+    def boyut_al(self, gorsel_path):
+        st = os.stat(gorsel_path)
+        anahtar = self._anahtar(gorsel_path)
+
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+        if kayit and kayit[0] == st.st_mtime_ns and kayit[1] == st.st_size:
+            return kayit[2], kayit[3]
+
+        boyut = None
+        try:
+            boyut = baslik_boyutu_oku(gorsel_path)
+        except (OSError, struct.error) as e:
+            logger.debug(f"Başlıktan boyut okunamadı, PIL deneniyor: {gorsel_path} -> {e}")
+
+        if not boyut or boyut[0] <= 0 or boyut[1] <= 0:
+            # Desteklenmeyen format (webp, tiff vb.): PIL de sadece başlığı okur
+            with PILImage.open(gorsel_path) as img:
+                boyut = (img.width, img.height)
+
+        genislik, yukseklik = int(boyut[0]), int(boyut[1])
+        if genislik <= 0 or yukseklik <= 0:
+            raise ValueError(f"Geçersiz görsel boyutu: {gorsel_path} ({genislik}x{yukseklik})")
+
+        with self._kilit:
+            self._kayitlar[anahtar] = [st.st_mtime_ns, st.st_size, genislik, yukseklik]
+            self._degisti = True
+        return genislik, yukseklik
+
+    def kaydet(self):
+        """
+        Değişiklik varsa dizini atomik olarak yazar: her çağrı aynı klasörde
+        kendine özel bir geçici dosya ('mkstemp') açar, sonra 'os.replace'.
+        """
+        if not self.indeks_yolu or not self._degisti:
+            return
+        with self._kilit:
+            veri = {"surum": INDEKS_SURUMU, "gorseller": dict(self._kayitlar)}
+            self._degisti = False
+        gecici_yol = None
+        try:
+            klasor = os.path.dirname(self.indeks_yolu)
+            os.makedirs(klasor, exist_ok=True)
+            fd, gecici_yol = tempfile.mkstemp(dir=klasor, prefix=".boyutlar.", suffix=".tmp")
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(veri, f, ensure_ascii=False, separators=(",", ":"))
+            os.replace(gecici_yol, self.indeks_yolu)
+            gecici_yol = None
+            logger.debug(f"Görsel boyut dizini kaydedildi: {len(veri['gorseller'])} kayıt")
+        except Exception as e:
+            # Yazılamayan APPDATA vb. -> sadece hafızada devam et
+            logger.warning(f"Görsel boyut dizini kaydedilemedi: {self.indeks_yolu} -> {e}")
+        finally:
+            if gecici_yol is not None:
+                try:
+                    os.remove(gecici_yol)
+                except OSError:
+                    pass
+
+
+_servisler = {}
+_servisler_kilit = threading.Lock()
+
+
+def boyut_servisi_al(kok_klasor=None):
+    """Aynı soru bankası için her yerden AYNI servisi (ve önbelleği) döndürür."""
+    anahtar = os.path.normpath(kok_klasor) if kok_klasor else None
+    with _servisler_kilit:
+        if anahtar not in _servisler:
+            _servisler[anahtar] = GorselBoyutServisi(anahtar)
+        return _servisler[anahtar]
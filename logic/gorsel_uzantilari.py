@@ -0,0 +1,11 @@
+# logic/gorsel_uzantilari.py
+
+"""
+Soru Otomasyon Sistemi - Görsel Uzantıları
+
+Resim Yönetimi ekranının (beyin, toplu yükleyici) görsel saydığı dosya
+uzantıları. Başka hiçbir modülü import etmez; sabit hangi modülün
+içinde tanımlı olduğuna bağlı kalmadan her iki yerde de kullanılır.
+"""
+
+IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp')
@@ -0,0 +1,269 @@
+# logic/icerik_dizini.py
+
+import os
+import time
+import sqlite3
+import logging
+import threading
+from logic.gorsel_hazirlayici import icerik_ozeti
+from logic.soru_katalogu import katalog_al
+
+"""
+Soru Otomasyon Sistemi - İçerik Özeti Dizini (Kopya Tespiti)
+
+'resim_yukle' yalnızca bekleyen listede dosya ADINA göre tekrarı
+engelliyordu. Aynı soru iki kez fotoğraflanıp farklı adla yüklenince ya da
+iki zorluk klasörüne kopyalanınca, 'secili_gorselleri_al' aynı soruyu bir
+sınavda iki kez seçebiliyordu.
+
+Bu modül soru bankasının tamamı için içerik özeti (BLAKE2b, 'icerik_ozeti'
+ile aynı) dizini tutar:
+- {yol: (boyut, mtime_ns, özet)} ve ters dizin {özet: {yollar}}; kopya
+  sorgusu O(1)'dir.
+- 'guncelle()' katalogdaki (boyut, mtime_ns) bilgisiyle SADECE yeni veya
+  değişmiş dosyaları özetler; ilk açılıştan sonra banka yeniden okunmaz.
+  Aynı anda gelen çağrılar sıraya girer (ders ekranı ve resim yönetimi
+  ekranı aynı bankayı birlikte eşitlemeye çalışabilir).
+- 'esitle()' dizin bu oturumda hiç eşitlenmediyse 'guncelle()'yi çalıştırır,
+  eşitleme sürüyorsa bitmesini bekler; kopya sorgusundan önce çağrılır.
+- 'ekle' / 'sil' ile 'kopyala_resim' / 'sil_resim' sonrası artımlı güncellenir
+  (yükleme sırasında hesaplanan özet varsa dosya tekrar okunmaz).
+- Dizin, katalog anlık görüntüsüyle aynı SQLite dosyasında ('ozetler'
+  tablosu) kalıcı tutulur.
+
+Ana Sınıf:
+- IcerikDizini:
+  'ozet(yol)', 'kopyalari(ozet, haric=None)', 'ekle(yol, ozet=None)',
+  'sil(yol)', 'guncelle()', 'esitle()', 'kaydet()'.
+
+Yardımcı:
+- icerik_dizini_al(kok_klasor): Kök klasör başına TEK dizin döndürür.
+"""
+
+logger = logging.getLogger(__name__)
+
+
+class IcerikDizini:
+    """
+    Soru bankası içerik özeti dizini (thread-safe).
+
+    Metodlar:
+    - ozet(self, yol): Dizindeki özet (henüz özetlenmediyse None). Dosyaya dokunmaz.
+    - kopyalari(self, ozet, haric=None): Aynı özete sahip yollar (set).
+    - ekle(self, yol, ozet=None): Dosyayı dizine ekler/günceller.
+    - sil(self, yol): Dosyayı (klasörse altındakileri) dizinden çıkarır.
+    - guncelle(self, iptal_token=None): Katalogla eşitler; değişen dosyaları özetler.
+    - esitle(self): Bu oturumda eşitlenmediyse 'guncelle()' (thread'de çalışmalıdır).
+    - esitlendi: Bu oturumda en az bir 'guncelle()' tamamlandıysa True.
+    - kaydet(self): Değişiklikleri SQLite'a yazar.
+    """
+
+    def __init__(self, katalog):
+        self.katalog = katalog
+        self.kok = katalog.kok
+        self._yollar = {}   # {mutlak yol: (boyut, mtime_ns, özet)}
+        self._ozetler = {}  # {özet: {mutlak yol, ...}}
+        self._kilit = threading.RLock()
+        self._yuklendi = False
+        self._kirli = set()
+        self._silinen = set()
+        self._guncelleme_kilidi = threading.Lock() # Eşitlemeler sırayla çalışır
+        self.esitlendi = False
+
+    # --- Hafıza içi dizin ---
+
+    def _koy(self, yol, boyut, mtime_ns, ozet):
+        self._cikar(yol)
+        self._yollar[yol] = (boyut, mtime_ns, ozet)
+        self._ozetler.setdefault(ozet, set()).add(yol)
+
+    def _cikar(self, yol):
+        eski = self._yollar.pop(yol, None)
+        if eski is not None:
+            yollar = self._ozetler.get(eski[2])
+            if yollar is not None:
+                yollar.discard(yol)
+                if not yollar:
+                    del self._ozetler[eski[2]]
+        return eski
+
+    @staticmethod
+    def _normal(yol):
+        return os.path.normcase(os.path.normpath(os.path.abspath(yol)))
+
+    # --- Sorgular ---
+
+    def ozet(self, yol):
+        self._yukle()
+        with self._kilit:
+            kayit = self._yollar.get(self._normal(yol))
+            return kayit[2] if kayit else None
+
+    def kopyalari(self, ozet, haric=None):
+        if not ozet:
+            return set()
+        self._yukle()
+        with self._kilit:
+            yollar = set(self._ozetler.get(ozet, ()))
+        if haric is not None:
+            yollar.discard(self._normal(haric))
+        return yollar
+
+    # --- Artımlı güncelleme ---
+
+    def ekle(self, yol, ozet=None):
+        self._yukle()
+        yol = self._normal(yol)
+        try:
+            st = os.stat(yol)
+        except OSError:
+            self.sil(yol)
+            return None
+        with self._kilit:
+            kayit = self._yollar.get(yol)
+            if kayit is not None and kayit[:2] == (st.st_size, st.st_mtime_ns):
+                return kayit[2] # Değişmemiş
+        if ozet is None:
+            try:
+                ozet = icerik_ozeti(yol)
+            except OSError as e:
+                logger.warning(f"İçerik özeti hesaplanamadı: {yol} -> {e}")
+                return None
+        with self._kilit:
+            self._koy(yol, st.st_size, st.st_mtime_ns, ozet)
+            self._kirli.add(yol)
+            self._silinen.discard(yol)
+        return ozet
+
+    def sil(self, yol):
+        self._yukle()
+        yol = self._normal(yol)
+        alt_onek = yol + os.sep
+        with self._kilit:
+            hedefler = [yol] if yol in self._yollar else [y for y in self._yollar if y.startswith(alt_onek)]
+            for hedef in hedefler:
+                self._cikar(hedef)
+                self._kirli.discard(hedef)
+                self._silinen.add(hedef)
+
+    def guncelle(self, iptal_token=None):
+        """Katalogdaki tüm soru görsellerini dizinle eşitler (thread'de çalışmalıdır)."""
+        with self._guncelleme_kilidi:
+            self._guncelle(iptal_token)
+
+    def esitle(self):
+        """Dizin bu oturumda eşitlenmediyse eşitler; başka thread eşitliyorsa onu bekler."""
+        if self.esitlendi:
+            return
+        with self._guncelleme_kilidi:
+            if not self.esitlendi:
+                self._guncelle(None)
+
+    def _guncelle(self, iptal_token):
+        self._yukle()
+        baslangic = time.perf_counter()
+        gorulen = set()
+        ozetlenen = 0
+        for klasor in self.katalog.gorsel_klasorleri():
+            for ad, (boyut, mtime_ns) in self.katalog.klasor_dosyalari(klasor).items():
+                if iptal_token is not None and iptal_token.is_set():
+                    self.kaydet()
+                    return
+                yol = self._normal(os.path.join(klasor, ad))
+                gorulen.add(yol)
+                with self._kilit:
+                    kayit = self._yollar.get(yol)
+                if kayit is not None and kayit[:2] == (boyut, mtime_ns):
+                    continue
+                try:
+                    ozet = icerik_ozeti(yol)
+                except OSError:
+                    continue
+                with self._kilit:
+                    self._koy(yol, boyut, mtime_ns, ozet)
+                    self._kirli.add(yol)
+                ozetlenen += 1
+
+        with self._kilit:
+            for yol in [y for y in self._yollar if y not in gorulen]:
+                self._cikar(yol)
+                self._kirli.discard(yol)
+                self._silinen.add(yol)
+            kopya_gruplari = sum(1 for yollar in self._ozetler.values() if len(yollar) > 1)
+        self.kaydet()
+        self.esitlendi = True
+        logger.info(
+            f"İçerik dizini güncellendi: {len(gorulen)} görsel, {ozetlenen} yeni özet, "
+            f"{kopya_gruplari} kopya grubu, {time.perf_counter() - baslangic:.2f} sn"
+        )
+
+    # --- Kalıcılık ---
+
+    def _baglan(self):
+        baglanti = self.katalog.anlik_goruntu_baglantisi()
+        baglanti.execute(
+            "CREATE TABLE IF NOT EXISTS ozetler ("
+            "yol TEXT PRIMARY KEY, boyut INTEGER, mtime_ns INTEGER, ozet TEXT) WITHOUT ROWID"
+        )
+        return baglanti
+
+    def _yukle(self):
+        if self._yuklendi:
+            return
+        with self._kilit:
+            if self._yuklendi:
+                return
+            self._yuklendi = True
+            if not os.path.exists(self.katalog.anlik_goruntu_yolu):
+                return
+            try:
+                baglanti = self._baglan()
+                try:
+                    for goreli, boyut, mtime_ns, ozet in baglanti.execute(
+                            "SELECT yol, boyut, mtime_ns, ozet FROM ozetler"):
+                        self._koy(self._normal(self.katalog._mutlak(goreli)), boyut, mtime_ns, ozet)
+                finally:
+                    baglanti.close()
+            except sqlite3.Error as e:
+                logger.warning(f"İçerik dizini okunamadı, yeniden oluşturulacak: {e}")
+
+    def kaydet(self):
+        with self._kilit:
+            kirli = {yol: self._yollar[yol] for yol in self._kirli if yol in self._yollar}
+            silinen = set(self._silinen)
+            self._kirli.clear()
+            self._silinen.clear()
+        if not kirli and not silinen:
+            return
+        try:
+            baglanti = self._baglan()
+            try:
+                with baglanti:
+                    baglanti.executemany(
+                        "DELETE FROM ozetler WHERE yol = ?",
+                        [(g,) for g in map(self.katalog._goreli, silinen) if g is not None]
+                    )
+                    baglanti.executemany(
+                        "INSERT OR REPLACE INTO ozetler (yol, boyut, mtime_ns, ozet) VALUES (?, ?, ?, ?)",
+                        [(g, boyut, mtime_ns, ozet)
+                         for g, (boyut, mtime_ns, ozet) in
+                         ((self.katalog._goreli(yol), kayit) for yol, kayit in kirli.items())
+                         if g is not None]
+                    )
+            finally:
+                baglanti.close()
+        except sqlite3.Error as e:
+            logger.warning(f"İçerik dizini kaydedilemedi: {e}")
+
+
+_dizinler = {}
+_dizinler_kilit = threading.Lock()
+
+
+def icerik_dizini_al(kok_klasor):
+    """Aynı soru bankası için her yerden AYNI dizini döndürür."""
+    katalog = katalog_al(kok_klasor)
+    with _dizinler_kilit:
+        if katalog.kok not in _dizinler:
+            _dizinler[katalog.kok] = IcerikDizini(katalog)
+        return _dizinler[katalog.kok]
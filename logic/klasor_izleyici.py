@@ -0,0 +1,335 @@
+# logic/klasor_izleyici.py
+
+import os
+import sys
+import errno
+import time
+import select
+import struct
+import logging
+import threading
+import ctypes
+import ctypes.util
+
+"""
+Soru Otomasyon Sistemi - Klasör İzleyici
+
+Soru bankası klasör ağacını izler ve dosya ekleme / silme / değiştirme
+olaylarını bir geri çağırım fonksiyonuna iletir. Önbellekler (sayım, boyut,
+thumbnail, soru kataloğu) böylece tüm ağacı yeniden taramadan, yalnızca
+değişen klasör ve üst klasörleri için geçersiz kılınabilir.
+
+İki arka uç vardır:
+- inotify (Linux): 'ctypes' ile doğrudan libc üzerinden; ek paket gerekmez.
+  Ağaçtaki her klasöre bir izleme eklenir, yeni oluşturulan klasörler
+  otomatik olarak izlemeye alınır.
+- Yoklama (diğer platformlar veya inotify kullanılamadığında): klasörlerin
+  mtime değerleri karşılaştırılır; mtime'ı değişen klasörün içeriği yeniden
+  listelenir. Tur arası 'aralik' saniyeden başlar, değişiklik bulunmayan
+  her turda iki katına çıkar ('YOKLAMA_MAKS_ARALIGI'na kadar) ve bir
+  değişiklik görülünce tekrar 'aralik'a döner; büyük bir SMB bankası boşta
+  iken her iki saniyede baştan sona stat'lanmaz. Yerinde değiştirilen
+  dosyalar klasör mtime'ını değiştirmediği için dosya boyut/mtime
+  karşılaştırması yalnızca 'TAM_TARAMA_ARALIGI' saniyede bir yapılır.
+
+Nokta ile başlayan dosya ve klasörler (toplu yüklemenin '.tmp' dosyaları,
+eski sürümlerin bankaya yazdığı '.gorsel_boyutlari.json' ve
+'.soru_katalogu.sqlite' / '-journal' dosyaları, '.git' vb.) izlenmez ve
+olay üretmez: uygulamanın kendi yazdıkları önbellekleri boşuna geçersiz
+kılmaz.
+
+Olaylar '(olay, yol)' çiftlerinden oluşan bir liste olarak, izleyici
+thread'inden iletilir. 'olay' şunlardan biridir:
+'eklendi', 'silindi', 'degisti', 'tasma' (olay kuyruğu taştı; 'yol' kök
+klasördür ve tüm önbellek geçersiz sayılmalıdır).
+
+Ana Sınıf:
+- KlasorIzleyici:
+  'baslat()' ile izleme thread'ini başlatır, 'durdur()' ile durdurur.
+  'arka_uc' özelliği kullanılan yöntemi ('inotify' / 'yoklama') verir.
+"""
+
+logger = logging.getLogger(__name__)
+
+YOKLAMA_ARALIGI = 2.0
+# Değişiklik görülmeyen turlarda yoklama aralığı bu sınıra kadar büyür (saniye)
+YOKLAMA_MAKS_ARALIGI = 30.0
+# Dosya boyut/mtime karşılaştırmalı tam tarama aralığı (saniye)
+TAM_TARAMA_ARALIGI = 120.0
+
+# --- inotify sabitleri (linux/inotify.h) ---
+IN_MODIFY = 0x00000002
+IN_ATTRIB = 0x00000004
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_MOVE_SELF = 0x00000800
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ONLYDIR = 0x01000000
+IN_ISDIR = 0x40000000
+IN_NONBLOCK = os.O_NONBLOCK
+IN_CLOEXEC = getattr(os, "O_CLOEXEC", 0o2000000)
+
+# IN_MODIFY her yazma parçasında gelir; kopyalama bitince gelen
+# IN_CLOSE_WRITE tek bir 'degisti' olayı için yeterlidir.
+IZLEME_MASKESI = (IN_CLOSE_WRITE | IN_ATTRIB | IN_MOVED_FROM | IN_MOVED_TO |
+                  IN_CREATE | IN_DELETE | IN_DELETE_SELF | IN_ONLYDIR)
+_OLAY_BASLIGI = struct.Struct("iIII")
+
+try:
+    if not sys.platform.startswith("linux"):
+        raise OSError("inotify yalnızca Linux'ta var")
+    _libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+    _libc.inotify_init1.argtypes = [ctypes.c_int]
+    _libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    _libc.inotify_rm_watch.argtypes = [ctypes.c_int, ctypes.c_int]
+    INOTIFY_AVAILABLE = True
+except (OSError, AttributeError):
+    _libc = None
+    INOTIFY_AVAILABLE = False
+
+
+def yoksayilir_mi(ad):
+    """Nokta ile başlayan (gizli / uygulamanın kendi) dosya ve klasörler izlenmez."""
+    return ad.startswith(".")
+
+
+class KlasorIzleyici:
+    """
+    Bir klasör ağacındaki dosya değişikliklerini izler.
+
+    Metodlar:
+    - __init__(self, kok, geri_cagirim, aralik=YOKLAMA_ARALIGI, maks_aralik=YOKLAMA_MAKS_ARALIGI):
+        'geri_cagirim(olaylar)' izleyici thread'inden çağrılır.
+    - baslat(self): inotify'ı dener, olmazsa yoklamaya düşer.
+    - durdur(self): Thread'i durdurur, inotify tanıtıcısını kapatır.
+    """
+
+    def __init__(self, kok, geri_cagirim, aralik=YOKLAMA_ARALIGI, maks_aralik=YOKLAMA_MAKS_ARALIGI):
+        self.kok = os.path.normpath(os.path.abspath(kok))
+        self.geri_cagirim = geri_cagirim
+        self.aralik = aralik
+        self.maks_aralik = max(aralik, maks_aralik)
+        self.arka_uc = None
+        self._dur = threading.Event()
+        self._thread = None
+        self._fd = None
+        self._izlemeler = {} # inotify: {wd: klasör_yolu}
+
+    def baslat(self):
+        if self._thread is not None:
+            return
+        if INOTIFY_AVAILABLE and self._inotify_hazirla():
+            self.arka_uc = "inotify"
+            hedef = self._inotify_dongusu
+        else:
+            self.arka_uc = "yoklama"
+            hedef = self._yoklama_dongusu
+        self._thread = threading.Thread(target=hedef, name="KlasorIzleyici", daemon=True)
+        self._thread.start()
+        logger.info(f"Klasör izleyici başlatıldı ({self.arka_uc}): {self.kok}")
+
+    def durdur(self):
+        self._dur.set()
+        if self._thread is not None and self._thread is not threading.current_thread():
+            self._thread.join(timeout=2.0)
+        self._thread = None
+        if self._fd is not None:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+            self._fd = None
+        self._izlemeler.clear()
+        logger.debug(f"Klasör izleyici durduruldu: {self.kok}")
+
+    def _bildir(self, olaylar):
+        if not olaylar or self._dur.is_set():
+            return
+        try:
+            self.geri_cagirim(olaylar)
+        except Exception as e:
+            logger.error(f"Klasör izleyici geri çağırımı hata verdi: {e}")
+
+    # --- inotify ---
+
+    def _inotify_hazirla(self):
+        fd = _libc.inotify_init1(IN_NONBLOCK | IN_CLOEXEC)
+        if fd < 0:
+            logger.warning(f"inotify başlatılamadı ({os.strerror(ctypes.get_errno())}), yoklamaya geçiliyor.")
+            return False
+        self._fd = fd
+        if not self._agaci_izle(self.kok):
+            logger.warning("inotify ağacın tamamını izleyemiyor, yoklamaya geçiliyor.")
+            os.close(fd)
+            self._fd = None
+            self._izlemeler.clear()
+            return False
+        return True
+
+    def _izleme_ekle(self, klasor):
+        wd = _libc.inotify_add_watch(self._fd, os.fsencode(klasor), IZLEME_MASKESI)
+        if wd < 0:
+            hata = ctypes.get_errno()
+            if hata == errno.ENOSPC:
+                # fs.inotify.max_user_watches sınırı: bu ağaç için inotify yetmez
+                raise OSError(hata, "inotify izleme sınırına ulaşıldı")
+            return # Klasör bu arada silinmiş / erişilemiyor
+        self._izlemeler[wd] = klasor
+
+    def _agaci_izle(self, kok, eklenenler=None):
+        """'kok' ve altındaki tüm klasörlere izleme ekler. 'eklenenler' verilirse
+        izleme kurulmadan önce oluşmuş dosyalar buraya 'eklendi' olarak yazılır."""
+        yigin = [kok]
+        try:
+            while yigin:
+                klasor = yigin.pop()
+                self._izleme_ekle(klasor)
+                try:
+                    with os.scandir(klasor) as girdiler:
+                        for girdi in girdiler:
+                            if yoksayilir_mi(girdi.name):
+                                continue
+                            if girdi.is_dir(follow_symlinks=False):
+                                yigin.append(girdi.path)
+                            elif eklenenler is not None:
+                                eklenenler.append(("eklendi", girdi.path))
+                except OSError:
+                    continue
+        except OSError as e:
+            logger.warning(f"inotify izlemesi eklenemedi: {kok} -> {e}")
+            return False
+        return True
+
+    def _inotify_dongusu(self):
+        while not self._dur.is_set():
+            try:
+                hazir, _, _ = select.select([self._fd], [], [], 0.5)
+                if not hazir:
+                    continue
+                veri = os.read(self._fd, 64 * 1024)
+            except (OSError, ValueError, TypeError):
+                if self._dur.is_set():
+                    return
+                continue
+            olaylar = self._inotify_coz(veri)
+            if olaylar is None:
+                # Çekirdek kuyruğu taştı: hangi dosyaların değiştiği bilinmiyor
+                self._bildir([("tasma", self.kok)])
+                continue
+            # Aynı dosya için art arda gelen olayları tekilleştir
+            self._bildir(list(dict.fromkeys(olaylar)))
+
+    def _inotify_coz(self, veri):
+        olaylar = []
+        konum = 0
+        while konum + _OLAY_BASLIGI.size <= len(veri):
+            wd, maske, _, uzunluk = _OLAY_BASLIGI.unpack_from(veri, konum)
+            konum += _OLAY_BASLIGI.size
+            ad = veri[konum:konum + uzunluk].rstrip(b"\0")
+            konum += uzunluk
+
+            if maske & IN_Q_OVERFLOW:
+                return None
+            klasor = self._izlemeler.get(wd)
+            if maske & IN_IGNORED:
+                self._izlemeler.pop(wd, None)
+                continue
+            if klasor is None:
+                continue
+            if maske & (IN_DELETE_SELF | IN_MOVE_SELF):
+                olaylar.append(("silindi", klasor))
+                continue
+
+            if ad and yoksayilir_mi(os.fsdecode(ad)):
+                continue
+            yol = os.path.join(klasor, os.fsdecode(ad)) if ad else klasor
+            if maske & (IN_CREATE | IN_MOVED_TO):
+                if maske & IN_ISDIR:
+                    self._agaci_izle(yol, olaylar)
+                olaylar.append(("eklendi", yol))
+            elif maske & (IN_DELETE | IN_MOVED_FROM):
+                olaylar.append(("silindi", yol))
+            elif maske & (IN_CLOSE_WRITE | IN_ATTRIB):
+                olaylar.append(("degisti", yol))
+        return olaylar
+
+    # --- Yoklama ---
+
+    def _yoklama_dongusu(self):
+        anlik = {} # {klasör: (mtime_ns, {ad: (boyut, mtime_ns)}, [alt klasörler])}
+        self._yokla(anlik, tam=True)
+        son_tam_tarama = time.monotonic()
+        bekleme = self.aralik
+        while not self._dur.wait(bekleme):
+            tam = time.monotonic() - son_tam_tarama >= TAM_TARAMA_ARALIGI
+            try:
+                olaylar = self._yokla(anlik, tam=tam)
+            except Exception as e:
+                logger.warning(f"Klasör yoklaması başarısız: {e}")
+                continue
+            if tam:
+                son_tam_tarama = time.monotonic()
+            # Değişiklik varsa sık, yoksa giderek seyrek yokla
+            bekleme = self.aralik if olaylar else min(bekleme * 2, self.maks_aralik)
+            self._bildir(olaylar)
+
+    def _yokla(self, anlik, tam):
+        """Anlık görüntüyü günceller, önceki tura göre farkları döndürür."""
+        ilk = not anlik
+        olaylar = []
+        gorulen = set()
+        yigin = [self.kok]
+        while yigin:
+            klasor = yigin.pop()
+            try:
+                mtime_ns = os.stat(klasor).st_mtime_ns
+            except OSError:
+                continue
+            gorulen.add(klasor)
+            onceki = anlik.get(klasor)
+            if onceki is not None and onceki[0] == mtime_ns and not tam:
+                # Liste değişmedi: yalnızca bilinen alt klasörlere in
+                yigin.extend(onceki[2])
+                continue
+
+            dosyalar, altlar = {}, []
+            try:
+                with os.scandir(klasor) as girdiler:
+                    for girdi in girdiler:
+                        if yoksayilir_mi(girdi.name):
+                            continue
+                        try:
+                            if girdi.is_dir(follow_symlinks=False):
+                                altlar.append(girdi.path)
+                            else:
+                                st = girdi.stat()
+                                dosyalar[girdi.name] = (st.st_size, st.st_mtime_ns)
+                        except OSError:
+                            continue
+            except OSError:
+                continue
+            yigin.extend(altlar)
+
+            if onceki is not None:
+                eski = onceki[1]
+                for ad, bilgi in dosyalar.items():
+                    if ad not in eski:
+                        olaylar.append(("eklendi", os.path.join(klasor, ad)))
+                    elif eski[ad] != bilgi:
+                        olaylar.append(("degisti", os.path.join(klasor, ad)))
+                for ad in eski.keys() - dosyalar.keys():
+                    olaylar.append(("silindi", os.path.join(klasor, ad)))
+            elif not ilk:
+                olaylar.append(("eklendi", klasor))
+            anlik[klasor] = (mtime_ns, dosyalar, altlar)
+
+        for klasor in [k for k in anlik if k not in gorulen]:
+            if os.path.dirname(klasor) in gorulen:
+                olaylar.append(("silindi", klasor))
+            del anlik[klasor]
+        return olaylar
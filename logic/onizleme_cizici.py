@@ -1,7 +1,11 @@
 # logic/onizleme_cizici.py
 
 import os
+import math
 import logging
+import threading
+from functools import lru_cache
+from collections import OrderedDict
 from PIL import Image, ImageDraw, ImageFont, ImageTk
 
 """
@@ -19,8 +23,261 @@ Ana Sınıf:
   Gerekli verileri ('soru_tipi', 'baslik_text' vb.) alır
   ve 'generate_preview_image' metodu aracılığıyla
   hazır bir önizleme resmi döndürür.
+
+Önbellek:
+- OnizlemeOnbellegi: Çizilmiş önizleme sayfalarını (sayfa içeriği imzası,
+  başlık, soru tipi) anahtarıyla tutan, bellek sınırlı LRU önbellek.
+  Modül seviyesindeki 'onizleme_onbellegi' tüm çiziciler tarafından
+  paylaşılır; anahtar sayfanın İÇERİĞİNDEN üretildiği için yalnızca
+  içeriği değişen sayfalar yeniden çizilir, sayfalar arası gidip gelmek
+  anında olur. İlk sayfanın başlıksız "gövde" katmanı ayrıca tutulur;
+  başlık yazılırken sadece başlık şeridi yeniden çizilip gövdenin üzerine
+  yapıştırılır. Şerit, sayfa düzeninin hiç çizmediği üst marjinle sınırlıdır;
+  başlık oraya sığmazsa (sorularla çakışabilirse) sayfa eski sırayla
+  (şablon, başlık, sorular) baştan çizilir.
+
+Paylaşılan Kaynaklar:
+- sablon_al(soru_tipi, ilk_sayfa, boyut=None): Çözülmüş RGB şablonu (istenirse
+  önizleme boyutuna küçültülmüş halini) process genelinde bir kez hazırlar;
+  çiziciler bunun kopyası üzerine çizer.
+- soru_gorseli_olcekle(img, hedef_boyut): Soru görselini 'draft'/'reduce'
+  ile doğrudan küçük boyuta çözüp LANCZOS ile son boyuta getirir.
+- font_al(yollar, pt): 'ImageFont.truetype' nesnelerini (yol, boyut)
+  başına process genelinde önbellekler (ön yükleme thread'leri ile Tk
+  thread'i aynı fontları paylaşır).
+- font_yollari(): Arial/Calibri font yolu kontrolünü bir kez yapar.
 """
 
+logger = logging.getLogger(__name__)
+
+_KOK_DIZIN = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+_SABLON_KLASORU = os.path.join(_KOK_DIZIN, "templates")
+_FONT_KLASORU = os.path.join(_KOK_DIZIN, "resources", "fonts")
+
+# Önizleme çıktısının boyutu (A4 oranı)
+SABLON_GENISLIK, SABLON_YUKSEKLIK = 1414, 2000 # templates/*.png
+ONIZLEME_GENISLIK = 600
+ONIZLEME_YUKSEKLIK = int(SABLON_YUKSEKLIK * ONIZLEME_GENISLIK / SABLON_GENISLIK)
+
+# İlk sayfada sorular A4'ün bu kadar altından (pt) başlar (layout fonksiyonlarıyla aynı)
+A4_YUKSEKLIK_PT = 841.89
+ILK_SAYFA_UST_MARJIN_PT = 50
+
+# Önbelleğin kullanabileceği yaklaşık en fazla bellek (~25 sayfa)
+ONIZLEME_ONBELLEK_BAYT = 96 * 1024 * 1024
+
+
+class OnizlemeOnbellegi:
+    """
+    Bellek sınırlı LRU önizleme önbelleği (thread-safe).
+
+    Her kayıt çizilmiş PIL görselini ve (Tk thread'inde bir kez
+    oluşturulduysa) ondan üretilen 'PhotoImage'ı tutar. Boyut hesabı
+    piksel başına PIL için 3, PhotoImage için 4 bayttır.
+
+    Metodlar:
+    - al(self, anahtar): Kaydı (dict) döndürür ve en yeni yapar; yoksa None.
+    - koy(self, anahtar, pil_gorsel): PIL görselini ekler, sınır aşılırsa
+        en eski kayıtları atar.
+    - photo_ekle(self, anahtar, photo): Kayda PhotoImage ekler.
+    - temizle(self): Tüm kayıtları siler.
+    """
+
+    def __init__(self, max_bayt=ONIZLEME_ONBELLEK_BAYT):
+        self.max_bayt = max_bayt
+        self._kayitlar = OrderedDict()
+        self._toplam_bayt = 0
+        self._kilit = threading.Lock()
+
+    @staticmethod
+    def _kayit_boyutu(kayit):
+        w, h = kayit['pil'].size
+        return w * h * (3 + (4 if kayit.get('photo') is not None else 0))
+
+    def al(self, anahtar):
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+            if kayit is not None:
+                self._kayitlar.move_to_end(anahtar)
+            return kayit
+
+    def koy(self, anahtar, pil_gorsel):
+        with self._kilit:
+            eski = self._kayitlar.pop(anahtar, None)
+            if eski is not None:
+                self._toplam_bayt -= self._kayit_boyutu(eski)
+            kayit = {'pil': pil_gorsel, 'photo': None}
+            self._kayitlar[anahtar] = kayit
+            self._toplam_bayt += self._kayit_boyutu(kayit)
+            self._tasmayi_at()
+            return kayit
+
+    def photo_ekle(self, anahtar, photo):
+        with self._kilit:
+            kayit = self._kayitlar.get(anahtar)
+            if kayit is None or kayit.get('photo') is not None:
+                return
+            self._toplam_bayt -= self._kayit_boyutu(kayit)
+            kayit['photo'] = photo
+            self._toplam_bayt += self._kayit_boyutu(kayit)
+            self._tasmayi_at()
+
+    def _tasmayi_at(self):
+        # En son eklenen kayıt her zaman kalır (tek sayfa sınırdan büyük olsa bile)
+        while self._toplam_bayt > self.max_bayt and len(self._kayitlar) > 1:
+            _, atilan = self._kayitlar.popitem(last=False)
+            self._toplam_bayt -= self._kayit_boyutu(atilan)
+
+    def temizle(self):
+        with self._kilit:
+            self._kayitlar.clear()
+            self._toplam_bayt = 0
+
+    def __len__(self):
+        return len(self._kayitlar)
+
+
+onizleme_onbellegi = OnizlemeOnbellegi()
+
+
+# --- PAYLAŞILAN ŞABLON / FONT ÖNBELLEĞİ ---
+
+@lru_cache(maxsize=1)
+def font_yollari():
+    """
+    (regular, bold, regular_yedek, bold_yedek) font yolları.
+    Arial bulunamazsa Calibri kullanılır; kontrol process başına bir kez yapılır.
+    """
+    regular = os.path.join(_FONT_KLASORU, "arial.ttf")
+    bold = os.path.join(_FONT_KLASORU, "arialbd.ttf")
+    regular_yedek = os.path.join(_FONT_KLASORU, "calibri.ttf")
+    bold_yedek = os.path.join(_FONT_KLASORU, "calibrib.ttf")
+
+    if not os.path.exists(regular):
+        logger.warning(f"Arial font not found at {regular}. Using Calibri fallback.")
+        regular = regular_yedek
+    if not os.path.exists(bold):
+        logger.warning(f"Arial Bold font not found at {bold}. Using Calibri Bold fallback.")
+        bold = bold_yedek
+    return regular, bold, regular_yedek, bold_yedek
+
+
+_font_onbellegi = {}  # {(yol, pt): ImageFont.FreeTypeFont}
+_font_kilidi = threading.Lock()
+
+
+def font_al(yollar, pt):
+    """
+    'yollar'daki ilk yüklenebilen fontu 'pt' boyutunda döndürür; hiçbiri
+    yüklenemezse varsayılan PIL fontu. Sonuç (yol, pt) başına process
+    genelinde önbelleklenir: ön yükleyici her 'baslat'ta yeni thread açtığı
+    için thread'e özel bir önbellek hiç isabet etmiyordu. Pillow FreeType
+    çağrılarını GIL'i bırakmadan yaptığı için aynı font nesnesi thread'ler
+    arasında paylaşılabilir; kilit yalnızca aynı fontun iki kez
+    yüklenmesini önler.
+    """
+    with _font_kilidi:
+        for yol in yollar:
+            anahtar = (yol, pt)
+            font = _font_onbellegi.get(anahtar)
+            if font is not None:
+                return font
+            try:
+                font = ImageFont.truetype(yol, pt)
+            except Exception:
+                continue
+            _font_onbellegi[anahtar] = font
+            return font
+
+    logger.error("Hem Arial hem de Calibri fontları yüklenemedi. Varsayılan font kullanılıyor.")
+    return ImageFont.load_default()
+
+
+def sablon_yolu(soru_tipi, ilk_sayfa):
+    """Soru tipine ve sayfaya göre şablon yolu (yoksa yedeği; o da yoksa None)."""
+    soru_tipi = (soru_tipi or "").lower()
+    if ilk_sayfa:
+        template_name = "template2.png" if soru_tipi == "yazili" else "template.png"
+        template_name_fallback = template_name
+    else:
+        template_name = "template4.png" if soru_tipi == "yazili" else "template3.png"
+        template_name_fallback = "template2.png" if soru_tipi == "yazili" else "template.png"
+
+    template_path = os.path.join(_SABLON_KLASORU, template_name)
+    if not os.path.exists(template_path):
+        logger.warning(f"Onizleme: Dinamik şablon '{template_name}' bulunamadı. Fallback '{template_name_fallback}' kullanılıyor.")
+        template_path = os.path.join(_SABLON_KLASORU, template_name_fallback)
+        if not os.path.exists(template_path):
+            logger.error(f"Fallback şablon '{template_name_fallback}' dahi bulunamadı!")
+            return None
+    return template_path
+
+
+_sablon_onbellegi = {}  # {(soru_tipi, ilk_sayfa, boyut): (yol, mtime_ns, RGB görsel)}
+_sablon_kilidi = threading.Lock()
+
+
+def _lanczos():
+    return Image.Resampling.LANCZOS if hasattr(Image, "Resampling") else Image.ANTIALIAS
+
+
+def sablon_al(soru_tipi, ilk_sayfa, boyut=None):
+    """
+    Çözülmüş RGB şablonu döndürür (yoksa None). 'boyut' verilirse şablonun
+    o boyuta küçültülmüş hali döner. Dönen görsel PAYLAŞILIR: üzerine
+    çizmeden önce '.copy()' alınmalıdır. Şablon dosyası değişirse (mtime)
+    yeniden okunur.
+    """
+    template_path = sablon_yolu(soru_tipi, ilk_sayfa)
+    if template_path is None:
+        return None
+    mtime = os.stat(template_path).st_mtime_ns
+    anahtar = ((soru_tipi or "").lower(), bool(ilk_sayfa), tuple(boyut) if boyut else None)
+
+    with _sablon_kilidi:
+        kayit = _sablon_onbellegi.get(anahtar)
+        if kayit is not None and kayit[0] == template_path and kayit[1] == mtime:
+            return kayit[2]
+        with Image.open(template_path) as img:
+            sablon = img.convert("RGB")
+        if boyut and sablon.size != tuple(boyut):
+            sablon = sablon.resize(tuple(boyut), _lanczos())
+        _sablon_onbellegi[anahtar] = (template_path, mtime, sablon)
+        logger.debug(f"Şablon önbelleğe alındı: {os.path.basename(template_path)} {sablon.size}")
+        return sablon
+
+
+def soru_gorseli_olcekle(img, hedef_boyut):
+    """
+    Açık (henüz çözülmemiş) soru görselini 'hedef_boyut'a getirir. JPEG'ler
+    'draft' ile DCT seviyesinde, diğerleri 'reduce' ile tam sayı katına
+    kadar ucuzca küçültülür; son adım LANCZOS'tur.
+    """
+    hedef_boyut = (max(1, int(hedef_boyut[0])), max(1, int(hedef_boyut[1])))
+    if img.format == "JPEG":
+        img.draft("RGB", hedef_boyut)
+    if img.mode == "P":
+        img = img.convert("RGBA" if "transparency" in img.info else "RGB")
+    carpan = min(img.width // hedef_boyut[0], img.height // hedef_boyut[1])
+    if carpan >= 2:
+        img = img.reduce(carpan)
+    return img.resize(hedef_boyut, _lanczos())
+
+
+def _soru_imzasi(soru_info):
+    """Sorunun önizlemeyi etkileyen içeriği: yol, dosya sürümü ve basılacağı boyut."""
+    path = soru_info.get('path')
+    try:
+        st = os.stat(path)
+        surum = (st.st_mtime_ns, st.st_size)
+    except (OSError, TypeError):
+        surum = None
+    final_size = soru_info.get('final_size')
+    if final_size:
+        final_size = tuple(round(float(v), 2) for v in final_size)
+    return (path, surum, final_size)
+
+
 class OnizlemeCizici:
     """
     Tüm PDF önizleme çizim (PIL) işlemlerini yönetir.
@@ -30,11 +287,22 @@ class OnizlemeCizici:
         Çizim için gerekli olan tüm verileri ve ayarları alır.
         
     - generate_preview_image(self, bu_sayfanin_sutunlari, ...):
-        Ana giriş noktası. Şablonu yükler, başlığı çizer ve
-        doğru layout fonksiyonunu (_create_test_preview...) çağırır.
+        Ana giriş noktası. Önce önbelleğe bakar; yoksa
+        'sayfa_onizlemesi_ciz' ile çizip önbelleğe koyar.
+
+    - sayfa_onizlemesi_ciz(self, bu_sayfanin_sutunlari, ...):
+        Şablonu yükler, başlığı çizer, doğru layout fonksiyonunu
+        (_create_test_preview...) çağırır ve PIL görseli döndürür.
+
+    - onizleme_anahtari(self, bu_sayfanin_sutunlari, ...):
+        Sayfanın içerik imzasından önbellek anahtarı üretir.
+
+    - _basligi_birlestir(self, govde):
+        İlk sayfanın gövde katmanına başlık şeridini yapıştırır (başlık
+        şeride sığmazsa None).
         
     - _draw_title_on_image(self, image):
-        Başlığı PIL kullanarak resmin üzerine çizer.
+        Başlığı PIL kullanarak resmin üzerine çizer, kapladığı kutuyu döndürür.
         
     - _create_yazili_preview(self, template_copy, ...):
         Yazılı sınav layout'unu çizer.
@@ -43,7 +311,7 @@ class OnizlemeCizici:
         Test sınavı layout'unu (BestFit) çizer.
     """
     
-    def __init__(self, soru_tipi, baslik_text, logger, constants_dict):
+    def __init__(self, soru_tipi, baslik_text, logger, constants_dict, tam_cozunurluk=False):
         """
         Çiziciyi başlatır.
         
@@ -53,71 +321,171 @@ class OnizlemeCizici:
             logger (logging.Logger): Ana controller'dan gelen logger.
             constants_dict (dict): Ana controller'dan gelen sabitler
                                    (örn: 'BASLIK_PT_MAX').
+            tam_cozunurluk (bool): True ise sayfa tam şablon boyutunda
+                                   (1414x2000) çizilip sonra küçültülür
+                                   (eski yöntem). Varsayılan: doğrudan
+                                   önizleme boyutunda çizilir.
         """
         self.soru_tipi = soru_tipi
         self.baslik_text = baslik_text
         self.logger = logger
         self.constants = constants_dict
+        self.tam_cozunurluk = tam_cozunurluk
+        # Şablon pikseli cinsinden yazılmış sabitlerin (başlık pt'si, marjinler) çarpanı
+        self.olcek = 1.0
         
-        self.base_dir = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-        
-        font_dir = os.path.join(self.base_dir, "resources", "fonts")
-        
-        # Ana Fontlar (Arial)
-        self.font_path_regular = os.path.join(font_dir, "arial.ttf")
-        self.font_path_bold = os.path.join(font_dir, "arialbd.ttf")
-        
-        # Yedek Fontlar (Calibri)
-        self.font_path_regular_fallback = os.path.join(font_dir, "calibri.ttf")
-        self.font_path_bold_fallback = os.path.join(font_dir, "calibrib.ttf")
-
-        # Kontrol (Eğer arial.ttf bulunamazsa Calibri'yi kullan)
-        if not os.path.exists(self.font_path_regular):
-            self.logger.warning(f"Arial font not found at {self.font_path_regular}. Using Calibri fallback.")
-            self.font_path_regular = self.font_path_regular_fallback
-            
-        if not os.path.exists(self.font_path_bold):
-            self.logger.warning(f"Arial Bold font not found at {self.font_path_bold}. Using Calibri Bold fallback.")
-            self.font_path_bold = self.font_path_bold_fallback
+        self.base_dir = _KOK_DIZIN
         
+        # GÜNCELLENDİ: Font yolu kontrolü her çizicide değil, process başına bir kez
+        # (başlık yazılırken her tuşta yeni çizici oluşturuluyor)
+        (self.font_path_regular, self.font_path_bold,
+         self.font_path_regular_fallback, self.font_path_bold_fallback) = font_yollari()
 
 
+    def onizleme_anahtari(self, bu_sayfanin_sutunlari, global_offset, page_index, baslik_dahil=True):
+        """
+        Sayfanın önbellek anahtarı. Sayfa içeriği (sütunlardaki sorular),
+        numaralandırma başlangıcı, soru tipi ve (yalnızca ilk sayfada görünen)
+        başlıktan oluşur; bunlardan biri değişmedikçe sayfa yeniden çizilmez.
+        'baslik_dahil=False' ilk sayfanın başlıksız gövde katmanının anahtarıdır.
+        """
+        icerik = tuple(
+            tuple(_soru_imzasi(soru_info) for soru_info in sutun)
+            for sutun in bu_sayfanin_sutunlari
+        )
+        ilk_sayfa = page_index == 0
+        baslik = None
+        if ilk_sayfa and baslik_dahil:
+            baslik = (
+                (self.baslik_text or "").strip(),
+                self.constants.get('BASLIK_PT_MAX'),
+                self.constants.get('BASLIK_PT_MIN'),
+                self.constants.get('TITLE_MAX_W_RATIO'),
+            )
+        return ((self.soru_tipi or "").lower(), ilk_sayfa, global_offset, baslik, icerik, self.tam_cozunurluk)
+
     def generate_preview_image(self, bu_sayfanin_sutunlari, global_offset, page_index):
         """
         Bir sayfa için PDF önizlemesi oluşturur.
         Bu, 'create_page_preview' fonksiyonunun yeni yeridir.
+
+        GÜNCELLENDİ: Sonuç 'onizleme_onbellegi'nde tutulur; aynı içerikli
+        sayfa tekrar istendiğinde şablon, başlık ve sorular yeniden çizilmez,
+        hazır 'PhotoImage' döner.
+        """
+        try:
+            anahtar = self.onizleme_anahtari(bu_sayfanin_sutunlari, global_offset, page_index)
+        except Exception as e:
+            self.logger.warning(f"Önizleme anahtarı üretilemedi, önbellek atlanıyor: {e}")
+            anahtar = None
+
+        kayit = onizleme_onbellegi.al(anahtar) if anahtar is not None else None
+        if kayit is not None:
+            self.logger.debug(f"Sayfa önizlemesi önbellekten - Sayfa İndeksi: {page_index}")
+            photo = kayit.get('photo')
+            if photo is None:
+                photo = ImageTk.PhotoImage(kayit['pil'])
+                onizleme_onbellegi.photo_ekle(anahtar, photo)
+            return photo
+
+        pil_gorsel = self.sayfa_onizlemesi_ciz(bu_sayfanin_sutunlari, global_offset, page_index)
+        if pil_gorsel is None:
+            return None
+
+        try:
+            photo = ImageTk.PhotoImage(pil_gorsel)
+        except Exception as e:
+            self.logger.error(f"Sayfa önizleme hatası: {e}", exc_info=True)
+            return None
+
+        if anahtar is not None:
+            onizleme_onbellegi.koy(anahtar, pil_gorsel)
+            onizleme_onbellegi.photo_ekle(anahtar, photo)
+        return photo
+
+    def sayfa_onizlemesi_ciz(self, bu_sayfanin_sutunlari, global_offset, page_index):
+        """
+        Sayfayı önizleme boyutunda bir PIL görseli olarak çizer (Tk
+        gerektirmez). Hata olursa None döner.
+
+        YENİ: İlk sayfada başlıksız gövde katmanı önbellekten alınır (yoksa
+        çizilip önbelleğe konur) ve başlık şeridi üzerine yapıştırılır;
+        başlık değiştiğinde sorular yeniden çizilmez. Başlık soruların
+        başladığı satırın üstüne sığmıyorsa sayfa tümden çizilir.
+        """
+        if page_index != 0 or self.tam_cozunurluk:
+            return self._sayfayi_ciz(bu_sayfanin_sutunlari, global_offset, page_index)
+
+        try:
+            govde_anahtari = self.onizleme_anahtari(bu_sayfanin_sutunlari, global_offset, page_index, baslik_dahil=False)
+        except Exception as e:
+            self.logger.warning(f"Gövde anahtarı üretilemedi, sayfa tümden çiziliyor: {e}")
+            return self._sayfayi_ciz(bu_sayfanin_sutunlari, global_offset, page_index)
+
+        kayit = onizleme_onbellegi.al(govde_anahtari)
+        if kayit is not None:
+            govde = kayit['pil']
+            self.logger.debug("İlk sayfa gövdesi önbellekten; sadece başlık çiziliyor")
+        else:
+            govde = self._sayfayi_ciz(bu_sayfanin_sutunlari, global_offset, page_index, baslik_ciz=False)
+            if govde is None:
+                return None
+            onizleme_onbellegi.koy(govde_anahtari, govde)
+
+        try:
+            sayfa = self._basligi_birlestir(govde)
+        except Exception as e:
+            self.logger.error(f"Başlık şeridi çizilemedi: {e}", exc_info=True)
+            return None
+        if sayfa is None:
+            self.logger.debug("Başlık soruların üstüne sığmıyor; sayfa tümden çiziliyor")
+            return self._sayfayi_ciz(bu_sayfanin_sutunlari, global_offset, page_index)
+        return sayfa
+
+    def _basligi_birlestir(self, govde):
         """
+        Gövdenin, soruların başladığı satırın üstünde kalan şeridini kesip
+        başlığı onun üzerine çizer ve gövdenin bir kopyasına yapıştırır.
+        Layout fonksiyonları bu şeride hiç çizmediği için şerit şablonun
+        kendisidir; başlık şeride tamamen sığıyorsa sonuç, başlığın sorulardan
+        önce çizildiği tam çizimle piksel piksel aynıdır. Sığmıyorsa None
+        döner. Önbellekteki gövde değiştirilmez.
+        """
+        W, H = govde.size
+        self.olcek = H / SABLON_YUKSEKLIK
+        serit_yuksekligi = math.floor(ILK_SAYFA_UST_MARJIN_PT * H / A4_YUKSEKLIK_PT)
+        serit = govde.crop((0, 0, W, serit_yuksekligi))
+        x0, y0, x1, y1 = self._draw_title_on_image(serit)
+        if x0 < 0 or y0 < 0 or x1 > W or y1 > serit_yuksekligi:
+            return None
+
+        sayfa = govde.copy()
+        sayfa.paste(serit, (0, 0))
+        return sayfa
+
+    def _sayfayi_ciz(self, bu_sayfanin_sutunlari, global_offset, page_index, baslik_ciz=True):
+        """Şablonu yükler, (istenirse) başlığı ve soruları çizip önizleme boyutunda döndürür."""
         self.logger.debug(f"Sayfa önizlemesi oluşturuluyor - Sayfa İndeksi: {page_index}, Offset: {global_offset}")
 
         try:
             # Soru tipine göre şablon seç
-            templates_dir = os.path.join(self.base_dir, "templates")
             soru_tipi = self.soru_tipi.lower()
             sayfa_no = page_index + 1 # 1'den başlayan sayfa no
             
             self.logger.debug(f"Şablon seçimi - Soru tipi: {soru_tipi}, Sayfa No: {sayfa_no}")
 
-            if sayfa_no == 1:
-                template_name = "template2.png" if soru_tipi == "yazili" else "template.png"
-                template_name_fallback = template_name
-            else:
-                template_name = "template4.png" if soru_tipi == "yazili" else "template3.png"
-                template_name_fallback = "template2.png" if soru_tipi == "yazili" else "template.png"
-            
-            template_path = os.path.join(templates_dir, template_name)
-            
-            if not os.path.exists(template_path):
-                self.logger.warning(f"Onizleme: Dinamik şablon '{template_name}' bulunamadı. Fallback '{template_name_fallback}' kullanılıyor.")
-                template_path = os.path.join(templates_dir, template_name_fallback)
-                
-                if not os.path.exists(template_path):
-                     self.logger.error(f"Fallback şablon '{template_name_fallback}' dahi bulunamadı!")
-                     return None
-
-            template = Image.open(template_path).convert("RGB")
+            # GÜNCELLENDİ: Şablon process genelinde bir kez çözülür; burada sadece kopyalanır.
+            # YENİ: Varsayılan olarak sayfa doğrudan önizleme boyutunda (600px) çizilir;
+            # layout fonksiyonları 'scale_factor'ı tuval yüksekliğinden hesapladığı için
+            # tüm ölçüler kendiliğinden bu boyuta ölçeklenir.
+            onizleme_boyutu = (ONIZLEME_GENISLIK, ONIZLEME_YUKSEKLIK)
+            template = sablon_al(soru_tipi, sayfa_no == 1, None if self.tam_cozunurluk else onizleme_boyutu)
+            if template is None:
+                return None
             template_copy = template.copy()
+            self.olcek = template_copy.size[1] / SABLON_YUKSEKLIK
             
-            if page_index == 0:
+            if page_index == 0 and baslik_ciz:
                 self._draw_title_on_image(template_copy)
             
             self.logger.debug(f"Şablon yüklendi - Boyut: {template_copy.size}")
@@ -132,29 +500,29 @@ class OnizlemeCizici:
             else:
                 self._create_test_preview_BestFit(template_copy, bu_sayfanin_sutunlari, template_width, template_height, global_offset, page_index)
 
-            # Önizleme için boyutlandır (oranı koru)
-            preview_width = 600
-            preview_height = int(2000 * preview_width / 1414) # A4 Oranı
-            
-            resampling_filter = Image.Resampling.LANCZOS if hasattr(Image.Resampling, "LANCZOS") else Image.ANTIALIAS
-            template_copy = template_copy.resize((preview_width, preview_height), resampling_filter)
+            # Önizleme için boyutlandır (oranı koru) - sadece tam çözünürlükte çizildiyse
+            if template_copy.size != onizleme_boyutu:
+                template_copy = template_copy.resize(onizleme_boyutu, _lanczos())
 
             self.logger.debug("Sayfa önizlemesi başarıyla oluşturuldu")
-            return ImageTk.PhotoImage(template_copy)
+            return template_copy
 
         except Exception as e:
             self.logger.error(f"Sayfa önizleme hatası: {e}", exc_info=True)
             return None
 
     def _draw_title_on_image(self, image):
-        """Şablon imajının üst-ortasına başlığı çizer (tek font, tek marjin)."""
+        """
+        Şablon imajının üst-ortasına başlığı çizer (tek font, tek marjin).
+        Başlığın (gölgesiyle) kapladığı (x0, y0, x1, y1) kutusunu döndürür.
+        """
         if image is None:
-            return
+            return None
         
         # DİKKAT: 'self.baslik_text_var.get()' yerine 'self.baslik_text'
         text_raw = (self.baslik_text or "").strip()
         text = text_raw.replace('i', 'İ').upper() or "QUIZ"
-        TOP_MARGIN = 50
+        TOP_MARGIN = round(50 * self.olcek)
         W, H = image.size
         
         # DİKKAT: Sabitleri 'self.constants' dict'inden al
@@ -163,25 +531,18 @@ class OnizlemeCizici:
         draw = ImageDraw.Draw(image)
 
         def try_font(pt):
-            try:
-                # Ana fontu (Arial) yükle
-                return ImageFont.truetype(self.font_path_regular, pt)
-            except Exception:
-                try:
-                    # Başarısız olursa yedek fontu (Calibri) yükle
-                    return ImageFont.truetype(self.font_path_regular_fallback, pt)
-                except Exception:
-                    self.logger.error("Hem Arial hem de Calibri fontları yüklenemedi. Varsayılan font kullanılıyor.")
-                    return ImageFont.load_default()
-                
+            # Ana font (Arial), başarısız olursa yedek (Calibri); önbellekten
+            return font_al((self.font_path_regular, self.font_path_regular_fallback), pt)
 
         # DİKKAT: Sabitleri 'self.constants' dict'inden al
-        pt = self.constants['BASLIK_PT_MAX']
+        # Punto değerleri tam şablon (2000px) içindir; tuval ölçeğine çevir
+        pt = max(1, round(self.constants['BASLIK_PT_MAX'] * self.olcek))
+        pt_min = max(1, round(self.constants['BASLIK_PT_MIN'] * self.olcek))
         font = try_font(pt)
         w = draw.textbbox((0, 0), text, font=font)[2]
         
         # DİKKAT: Sabitleri 'self.constants' dict'inden al
-        while pt > self.constants['BASLIK_PT_MIN'] and w > max_w:
+        while pt > pt_min and w > max_w:
             pt -= 1
             font = try_font(pt)
             w = draw.textbbox((0, 0), text, font=font)[2]
@@ -200,8 +561,13 @@ class OnizlemeCizici:
         x = (W - tw) // 2
         y = TOP_MARGIN
 
-        draw.text((x + 1, y + 1), text, font=font, fill=(0, 0, 0))
+        # 1px'lik gölge küçültülmüş sayfada pikselin altına düşer; önizleme boyutunda çizilmez
+        golge = round(self.olcek)
+        if golge:
+            draw.text((x + golge, y + golge), text, font=font, fill=(0, 0, 0))
         draw.text((x, y), text, font=font, fill="darkred")
+        kutu = draw.textbbox((x, y), text, font=font)
+        return (kutu[0], kutu[1], kutu[2] + golge, kutu[3] + golge)
 
     def _create_yazili_preview(self, template_copy, sayfa_gorselleri_bilgileri_duz, template_width, template_height, global_offset, page_index):
         """Yazılı şablonu önizleme layout'u (Hiçbir değişiklik gerekmedi)"""
@@ -241,7 +607,7 @@ class OnizlemeCizici:
                 x_sol_kenar = left_margin 
                 y_tavan = top_margin_pixel + i * soru_ve_cevap_yuksekligi
 
-                soru_img = Image.open(gorsel_path)
+                soru_img = Image.open(gorsel_path) # Sadece başlık okunur; çözme 'soru_gorseli_olcekle'de
                 
                 img_ratio = soru_img.width / soru_img.height
                 final_width = yazili_soru_width
@@ -253,27 +619,19 @@ class OnizlemeCizici:
                 
                 paste_x = x_sol_kenar + (yazili_soru_width - final_width) // 2
                 
-                resampling_filter = Image.Resampling.LANCZOS if hasattr(Image.Resampling, "LANCZOS") else Image.ANTIALIAS
-                soru_img = soru_img.resize((final_width, final_height), resampling_filter)
+                soru_img = soru_gorseli_olcekle(soru_img, (final_width, final_height))
                 template_copy.paste(soru_img, (int(paste_x), int(y_tavan)))
 
                 draw = ImageDraw.Draw(template_copy)
                 
-                try:
-                    # Ana BOLD fontu (Arial Bold) yükle
-                    font = ImageFont.truetype(self.font_path_bold, 24) 
-                except Exception:
-                    try:
-                        # Yedek BOLD fontu (Calibri Bold) yükle
-                        font = ImageFont.truetype(self.font_path_bold_fallback, 24)
-                    except:
-                        font = ImageFont.load_default()
+                # Ana BOLD font (Arial Bold), yoksa yedek (Calibri Bold)
+                font = font_al((self.font_path_bold, self.font_path_bold_fallback), max(1, round(24 * self.olcek)))
                 
                 numara_x = x_sol_kenar
                 if soru_no >= 10:
                     numara_x -= (10 * scale_factor) 
                 
-                draw.text((numara_x - 20, y_tavan), f"{soru_no}.", fill="#000000", font=font)
+                draw.text((numara_x - 20 * self.olcek, y_tavan), f"{soru_no}.", fill="#000000", font=font)
                 
                 self.logger.debug(f"Yazılı soru {soru_no} yerleştirildi - Boyut: {final_width}x{final_height}")
 
@@ -314,15 +672,8 @@ class OnizlemeCizici:
         yerlestirildi_sayaci = 0 
         
         draw = ImageDraw.Draw(template_copy)
-        try:
-            # Ana BOLD fontu (Arial Bold) yükle
-            numara_font = ImageFont.truetype(self.font_path_bold, soru_numara_font_size)
-        except Exception:
-            try:
-                # Yedek BOLD fontu (Calibri Bold) yükle
-                numara_font = ImageFont.truetype(self.font_path_bold_fallback, soru_numara_font_size)
-            except:
-                numara_font = ImageFont.load_default()
+        # Ana BOLD font (Arial Bold), yoksa yedek (Calibri Bold)
+        numara_font = font_al((self.font_path_bold, self.font_path_bold_fallback), soru_numara_font_size)
 
         for sutun_index in range(cols):
             sutun_sorulari = bu_sayfanin_sutunlari[sutun_index]
@@ -336,9 +687,9 @@ class OnizlemeCizici:
                 pil_y_top = current_y_positions_tepe[sutun_index] + soru_spacing
                 
                 try:
-                    soru_img = Image.open(soru_info['path'])
-                    resampling_filter = Image.Resampling.LANCZOS if hasattr(Image.Resampling, "LANCZOS") else Image.ANTIALIAS
-                    soru_img = soru_img.resize((int(scaled_width), int(scaled_height)), resampling_filter)
+                    soru_img = soru_gorseli_olcekle(
+                        Image.open(soru_info['path']), (int(scaled_width), int(scaled_height))
+                    )
                     
                     template_copy.paste(soru_img, (int(img_x), int(pil_y_top)))
                     
@@ -349,7 +700,7 @@ class OnizlemeCizici:
                     if soru_no >= 10:
                         numara_x -= (5 * scale_factor) 
                         
-                    draw.text((numara_x + 10, numara_y), f"{soru_no}.", fill="#333333", font=numara_font)
+                    draw.text((numara_x + 10 * self.olcek, numara_y), f"{soru_no}.", fill="#333333", font=numara_font)
 
                 except Exception as e:
                     self.logger.error(f"PIL Gorsel cizim hatasi: {soru_info['path']}", exc_info=True)
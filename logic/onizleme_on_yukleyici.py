@@ -0,0 +1,118 @@
+# logic/onizleme_on_yukleyici.py
+
+import logging
+import threading
+from PIL import ImageTk
+from logic.onizleme_cizici import onizleme_onbellegi
+
+"""
+Soru Otomasyon Sistemi - Önizleme Ön Yükleyici
+
+Sayfa değiştirme ('change_page_pdf_only' / 'change_page_new') önizlemeyi
+Tk thread'inde senkron çizer. Bu modül, mevcut sayfa gösterildikten sonra
+komşu sayfaları (N+1, N-1, N+2, N-2) bir worker thread'de PIL görseli olarak
+çizip 'onizleme_onbellegi'ne koyar. Tk thread'ine yalnızca ucuz
+'PhotoImage' dönüşümü kalır ('tk_after(0, ...)' ile).
+
+'sayfa_haritasi' değiştiğinde (soru güncelle/kaldır, yeniden planlama) UI
+'baslat'ı tekrar çağırır; önceki iş iptal edilir ve sonuçları atılır.
+
+Ana Sınıf:
+- OnizlemeOnYukleyici:
+  'baslat(cizici, sayfa_haritasi, current_page)' ile arka planda ön yükleme
+  başlatır, 'iptal()' ile bekleyen işi bırakır.
+"""
+
+logger = logging.getLogger(__name__)
+
+# Mevcut sayfaya göre ön yüklenecek sayfalar (öncelik sırasıyla)
+ON_YUKLEME_SIRASI = (1, -1, 2, -2)
+
+
+class OnizlemeOnYukleyici:
+    """
+    Komşu önizleme sayfalarını arka planda hazırlar.
+
+    Metodlar:
+    - __init__(self, tk_after, logger=None):
+        'tk_after' Tk thread'ine iş göndermek için kullanılır (örn: 'self.after').
+    - baslat(self, cizici, sayfa_haritasi, current_page):
+        Önceki işi iptal eder, komşu sayfaları yeni bir worker thread'de çizer.
+    - iptal(self):
+        Çalışan işi iptal eder (bir sonraki sayfa sınırında durur).
+    """
+
+    def __init__(self, tk_after, logger=None):
+        self.tk_after = tk_after
+        self.logger = logger or logging.getLogger(__name__)
+        self._iptal_token = None
+        self._kilit = threading.Lock()
+
+    def iptal(self):
+        with self._kilit:
+            if self._iptal_token is not None:
+                self._iptal_token.set()
+                self._iptal_token = None
+
+    def baslat(self, cizici, sayfa_haritasi, current_page):
+        # 1. İşleri Tk thread'inde, haritanın o anki halinden çıkar (worker
+        #    haritanın kendisine dokunmaz; harita bu sırada değişebilir)
+        isler = []
+        toplam_sayfa = len(sayfa_haritasi)
+        for fark in ON_YUKLEME_SIRASI:
+            page_index = current_page + fark
+            if not 0 <= page_index < toplam_sayfa:
+                continue
+            global_offset = sum(
+                len(sutun) for onceki in sayfa_haritasi[:page_index] for sutun in onceki
+            )
+            sutunlar = [list(sutun) for sutun in sayfa_haritasi[page_index]]
+            try:
+                anahtar = cizici.onizleme_anahtari(sutunlar, global_offset, page_index)
+            except Exception:
+                continue
+            if onizleme_onbellegi.al(anahtar) is not None:
+                continue # Zaten hazır
+            isler.append((anahtar, sutunlar, global_offset, page_index))
+
+        # 2. Eski işi iptal et, yenisini kaydet
+        iptal_token = threading.Event()
+        with self._kilit:
+            if self._iptal_token is not None:
+                self._iptal_token.set()
+            self._iptal_token = iptal_token
+
+        if not isler:
+            return
+
+        def _worker():
+            for anahtar, sutunlar, global_offset, page_index in isler:
+                if iptal_token.is_set():
+                    self.logger.debug("Önizleme ön yüklemesi iptal edildi (harita/sayfa değişti).")
+                    return
+                pil_gorsel = cizici.sayfa_onizlemesi_ciz(sutunlar, global_offset, page_index)
+                if pil_gorsel is None or iptal_token.is_set():
+                    continue
+                onizleme_onbellegi.koy(anahtar, pil_gorsel)
+                self._tk_de_calistir(self._photo_hazirla, anahtar, iptal_token)
+            self.logger.debug(f"Önizleme ön yüklemesi tamamlandı - {len(isler)} sayfa")
+
+        threading.Thread(target=_worker, name="OnizlemeOnYukleme", daemon=True).start()
+
+    def _tk_de_calistir(self, fonksiyon, *args):
+        try:
+            self.tk_after(0, fonksiyon, *args)
+        except Exception:
+            pass # Pencere kapatılmış (TclError)
+
+    def _photo_hazirla(self, anahtar, iptal_token):
+        """Tk thread'inde: önbellekteki PIL görselinden 'PhotoImage' üretir."""
+        if iptal_token.is_set():
+            return
+        kayit = onizleme_onbellegi.al(anahtar)
+        if kayit is None or kayit.get('photo') is not None:
+            return
+        try:
+            onizleme_onbellegi.photo_ekle(anahtar, ImageTk.PhotoImage(kayit['pil']))
+        except Exception as e:
+            self.logger.warning(f"Ön yüklenen önizleme PhotoImage'a dönüştürülemedi: {e}")
@@ -2,11 +2,14 @@
 
 import os
 import logging
-from logic.answer_utils import get_answer_for_image
+from logic.soru_katalogu import cevap_anahtari
 from logic.pdf_generator import PDFCreator
+from logic.gorsel_olcer import boyut_servisi_al
+from logic.soru_secici import gorselleri_sec, klasordeki_gorseller
 from tkinter import filedialog
 import random
 import sys
+import threading
 
 # PDFCreator import kontrolü için
 try:
@@ -15,6 +18,9 @@ try:
 except ImportError:
     PDF_CREATOR_MEVCUT = False
 
+# PDF'e gömülen soru görsellerinin hedef çözünürlüğü (None: orijinal çözünürlük)
+PDF_CIKTI_DPI = 300
+
 # Fallback (basit) PDF için
 try:
     from reportlab.lib.pagesizes import letter
@@ -71,6 +77,8 @@ class OturumYoneticisi:
         # Gerekli yardımcıları 'controller'dan al
         self.logger = self.controller.logger
         self.dialog_yoneticisi = self.controller.dialog_yoneticisi
+        self.eksik_konular = {} # YENİ: {konu_adi: (istenen, secilen)} (son seçimde)
+        self._pdf_kaydediliyor = False # Arka plan PDF kaydetme devam ediyor mu?
         
     
     def _havuzu_sifirla(self):
@@ -91,36 +99,17 @@ class OturumYoneticisi:
             self._havuzu_sifirla()
             self.logger.info("Yeni PDF oluşturma başlıyor - Havuz sıfırlandı")
             
-            tum_gorseller = []
-            
             # DİKKAT: 'self.controller' üzerindeki state'i okur
-            konu_dagilimi = self.controller.konu_soru_dagilimi
-            secilen_konular = self.controller.secilen_konular
-            kullanilan_sorular_ref = self.controller.kullanilan_sorular
-
-            for konu_adi, sayi in konu_dagilimi.items():
-                konu_path = secilen_konular[konu_adi]
-                klasor_yolu = os.path.join(konu_path, soru_tipi.lower(), zorluk.lower())
-
-                if os.path.exists(klasor_yolu):
-                    gorseller = [f for f in os.listdir(klasor_yolu) 
-                               if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))]
-
-                    if len(gorseller) >= sayi:
-                        secilen = random.sample(gorseller, sayi)
-                    else:
-                        secilen = gorseller
-
-                    # *** Seçilen soruları kullanılan listesine ekle ***
-                    for gorsel in secilen:
-                        kullanilan_sorular_ref[konu_adi].add(gorsel)
-                        # Tam yol ile ekle
-                        tum_gorseller.append(os.path.join(klasor_yolu, gorsel))
-
-                    self.logger.debug(f"{konu_adi}: {len(secilen)} görsel seçildi ve kullanılan listesine eklendi")
-
-            random.shuffle(tum_gorseller)
-            self.logger.info(f"Toplam {len(tum_gorseller)} görsel seçildi ve karıştırıldı")
+            # (Seçim mantığı UI'dan bağımsız 'soru_secici'de; CLI de aynısını kullanır)
+            # YENİ: Kopyalar elendiği için istenen sayıya ulaşamayan konular
+            self.eksik_konular.clear()
+            tum_gorseller = gorselleri_sec(
+                self.controller.konu_soru_dagilimi,
+                self.controller.secilen_konular,
+                soru_tipi, zorluk,
+                kullanilan_sorular=self.controller.kullanilan_sorular,
+                eksikler=self.eksik_konular
+            )
             
             # DİKKAT: 'self.controller' üzerindeki state'i GÜNCELLER
             self.controller.secilen_gorseller = tum_gorseller
@@ -147,23 +136,14 @@ class OturumYoneticisi:
             # 2. PLANLAMA ADIMI
             self.logger.info("Planlama başlatılıyor...")
             pdf_planner = PDFCreator()
+            pdf_planner.boyut_servisi = self._boyut_servisi()
             pdf_planner.gorsel_listesi = secilen_gorseller
             
             if soru_tipi.lower() == "test":
                 sayfa_haritasi = pdf_planner.planla_test_duzeni()
             else:
                 self.logger.info("Yazılı (basit) planlaması başlatılıyor...")
-                soru_listesi = []
-                for i, path in enumerate(secilen_gorseller):
-                    soru_listesi.append({
-                        'index': i, 'path': path, 'total_height': 500, 
-                        'final_size': (500, 400) # Tahmini boyut
-                    })
-                sayfa_listesi = []
-                for i in range(0, len(soru_listesi), 2): # Sayfa başına 2 soru
-                    sayfa_sorulari = soru_listesi[i:i+2]
-                    sayfa_listesi.append([ sayfa_sorulari, [] ]) 
-                sayfa_haritasi = sayfa_listesi
+                sayfa_haritasi = pdf_planner.planla_yazili_duzeni()
             
             # 3. STATE'İ GÜNCELLE
             self.controller.sayfa_haritasi = sayfa_haritasi
@@ -173,6 +153,7 @@ class OturumYoneticisi:
                 self.logger.info(f"{len(secilen_gorseller)} görsel {len(sayfa_haritasi)} sayfaya planlandı.")
                 self.controller.current_page = 0 # Sayfayı sıfırla
                 self.controller.gorsel_onizleme_alani_olustur() # UI Controller'daki UI fonksiyonunu çağır
+                self._eksik_konulari_bildir()
             else:
                 self.logger.error("Hiç görsel seçilemedi (planlama sonucu boş)")
                 self.dialog_yoneticisi.show_error("Seçilen konularda görsel bulunamadı!")
@@ -181,11 +162,28 @@ class OturumYoneticisi:
             self.logger.error(f"Önizleme akışında hata: {e}", exc_info=True)
             self.dialog_yoneticisi.show_error(f"Önizleme oluşturulurken hata oluştu: {e}")
 
-    def _replan_and_refresh_ui(self):
+    def _eksik_konulari_bildir(self):
+        """YENİ: Seçim bazı konularda istenen sayıya ulaşamadıysa kullanıcıyı uyarır."""
+        eksikler = self.eksik_konular
+        if not eksikler:
+            return
+        satirlar = [f"• {konu}: {istenen} istendi, {secilen} seçildi" for konu, (istenen, secilen) in eksikler.items()]
+        toplam_eksik = sum(istenen - secilen for istenen, secilen in eksikler.values())
+        self.dialog_yoneticisi.show_notification(
+            "Eksik Soru",
+            f"Aynı / çok benzer sorular elendiği için sınavda {toplam_eksik} soru eksik:\n\n"
+            + "\n".join(satirlar)
+            + "\n\nBu konulara yeni soru ekleyebilir veya soru sayısını azaltabilirsiniz."
+        )
+
+    def _replan_and_refresh_ui(self, degisen_index=None, kaldirildi=False):
         """
         'secilen_gorseller' değiştiğinde çağrılır.
         'sayfa_haritasi'nı yeniden hesaplar ve UI'ın yenilenmesini tetikler.
-       
+        GÜNCELLENDİ (Artımlı Planlama):
+        'degisen_index' verilirse (tek soru güncellendi/silindi) test planı
+        mevcut 'sayfa_haritasi' üzerinden SADECE etkilenen sayfalardan itibaren
+        yeniden paketlenir.
         """
         try:
             self.logger.info("'secilen_gorseller' değişti, plan yeniden hesaplanıyor...")
@@ -196,22 +194,17 @@ class OturumYoneticisi:
 
             # 2. YENİDEN PLANLA
             pdf_planner = PDFCreator()
+            pdf_planner.boyut_servisi = self._boyut_servisi()
             pdf_planner.gorsel_listesi = secilen_gorseller
             
-            if soru_tipi == "test":
+            if soru_tipi == "test" and degisen_index is not None:
+                yeni_harita = pdf_planner.planla_test_duzeni_artimli(
+                    self.controller.sayfa_haritasi, degisen_index, kaldirildi=kaldirildi
+                )
+            elif soru_tipi == "test":
                 yeni_harita = pdf_planner.planla_test_duzeni() 
             else:
-                soru_listesi = []
-                for i, path in enumerate(secilen_gorseller):
-                    soru_listesi.append({
-                        'index': i, 'path': path, 'total_height': 500, 
-                        'final_size': (500, 400) # Tahmini boyut
-                    })
-                sayfa_listesi = []
-                for i in range(0, len(soru_listesi), 2):
-                    sayfa_sorulari = soru_listesi[i:i+2]
-                    sayfa_listesi.append([ sayfa_sorulari, [] ]) 
-                yeni_harita = sayfa_listesi
+                yeni_harita = pdf_planner.planla_yazili_duzeni()
             
             # 3. STATE'İ GÜNCELLE
             self.controller.sayfa_haritasi = yeni_harita
@@ -259,8 +252,8 @@ class OturumYoneticisi:
                 konu_path = self.controller.secilen_konular[mevcut_konu]
                 klasor_yolu = os.path.join(konu_path, soru_tipi.lower(), zorluk.lower())
     
-                tum_gorseller = [f for f in os.listdir(klasor_yolu) 
-                               if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))]
+                # GÜNCELLENDİ: Klasör her 'Güncelle'de listelenmez, paylaşılan katalogdan gelir
+                tum_gorseller = klasordeki_gorseller(klasor_yolu)
     
                 if not tum_gorseller:
                     self.dialog_yoneticisi.show_error("Güncellenecek görsel bulunamadı!")
@@ -319,7 +312,7 @@ class OturumYoneticisi:
                 self.logger.info(f"Görsel güncellendi: {eski_gorsel_dosya} -> {yeni_gorsel_dosya}")
     
                 # UI'I TETİKLE
-                self._replan_and_refresh_ui()
+                self._replan_and_refresh_ui(degisen_index=index)
     
         except Exception as e:
             self.logger.error(f"Görsel güncelleme hatası: {e}")
@@ -350,12 +343,28 @@ class OturumYoneticisi:
                     )
                 
                 # UI'I TETİKLE
-                self._replan_and_refresh_ui()
+                self._replan_and_refresh_ui(degisen_index=index, kaldirildi=True)
 
         except Exception as e:
             self.logger.error(f"Görsel kaldırma hatası: {e}")
             self.dialog_yoneticisi.show_error("Görsel kaldırılırken bir hata oluştu!")
                
+    def _soru_bankasi_koku(self):
+        """
+        Seçili konuların yolundan soru bankası kök klasörünü bulur.
+        Yapı: <kök>/<ders>/<konu>  ->  konu yolunun iki üstü.
+        """
+        try:
+            for konu_path in self.controller.secilen_konular.values():
+                return os.path.dirname(os.path.dirname(os.path.normpath(konu_path)))
+        except Exception as e:
+            self.logger.error(f"Soru bankası kökü bulunamadı: {e}")
+        return None
+
+    def _boyut_servisi(self):
+        """Soru bankasına ait (diske kalıcı) görsel boyut servisini döndürür."""
+        return boyut_servisi_al(self._soru_bankasi_koku())
+
     def find_topic_from_path(self, gorsel_path):
         """Görsel yolundan hangi konudan geldiğini bul"""
         try:
@@ -370,7 +379,16 @@ class OturumYoneticisi:
             return None
     
     def get_answer_for_image(self, image_path):
-        return get_answer_for_image(image_path)
+        # GÜNCELLENDİ: Cevap, klasör okunurken çözülüp katalogda tutuluyor
+        return cevap_anahtari([image_path])[0]
+
+    def resolve_answers(self, image_paths):
+        """YENİ: Cevapları katalogdan toplu çözer ('image_paths' ile aynı sırada)."""
+        return cevap_anahtari(image_paths)
+
+    def cevapsiz_sayisi(self, image_paths):
+        """YENİ: Seçimdeki cevabı bilinmeyen ("?") soru sayısı (katalogdan, dosya okumaz)."""
+        return sum(1 for cevap in cevap_anahtari(image_paths) if str(cevap).strip() == "?")
     
     def _get_sorular_per_sayfa(self):
         """Soru tipine göre sayfa başı soru sayısını döndür"""
@@ -394,6 +412,8 @@ class OturumYoneticisi:
             
             # 2. HAZIRLIK (STATE'İ OKU)
             pdf = PDFCreator()
+            pdf.boyut_servisi = self._boyut_servisi()
+            pdf.cikti_dpi = PDF_CIKTI_DPI
             pdf.soru_tipi = self.controller.soru_tipi_var.get()
             baslik = (self.controller.baslik_text_var.get() or "").strip() or "QUIZ"
             pdf.baslik_ekle(baslik)
@@ -403,12 +423,11 @@ class OturumYoneticisi:
             sayfa_haritasi = self.controller.sayfa_haritasi
             
             self.logger.info("PDF Cevap Anahtarı için 'sayfa_haritasi' okunuyor...")
-            cevaplar = []
-            for sayfa_sutunlari in sayfa_haritasi:
-                for sutun in sayfa_sutunlari:
-                    for soru_info in sutun:
-                        cevap = get_answer_for_image(soru_info['path'])
-                        cevaplar.append(cevap)
+            # Cevaplar katalogda hazır: dışa aktarımda dosya sistemine gidilmez
+            cevaplar = cevap_anahtari(
+                soru_info['path']
+                for sayfa_sutunlari in sayfa_haritasi for sutun in sayfa_sutunlari for soru_info in sutun
+            )
             self.logger.info(f"PDF Cevap Anahtarı {len(cevaplar)} cevap ile oluşturuldu (Planlanmış Sıra).")
             
             cevap_anahtari_isteniyor = self.controller.cevap_anahtari_var.get() == "Evet"
@@ -429,18 +448,8 @@ class OturumYoneticisi:
                     if cikti_dosya:
                         self.logger.info(f"PDF kaydediliyor: {cikti_dosya}")
                         
-                        # STATE'İ GÖNDER
-                        if pdf.kaydet(cikti_dosya, self.controller.sayfa_haritasi):
-                            kayit_yeri = f"{os.path.basename(os.path.dirname(cikti_dosya))}/{os.path.basename(cikti_dosya)}"
-                            self.logger.info(f"PDF başarıyla oluşturuldu: {os.path.basename(cikti_dosya)}")
-                            self.dialog_yoneticisi.show_notification(
-                                "PDF Başarıyla Oluşturuldu!",
-                                f"Kayıt Yeri: {kayit_yeri}\n\n{len(self.controller.secilen_gorseller)} soru PDF formatında kaydedildi\n\nKonu Dağılımı:\n" + 
-                                "\n".join([f"• {konu}: {sayi} soru" for konu, sayi in self.controller.konu_soru_dagilimi.items()])
-                            )
-                        else:
-                            self.logger.error("PDF kaydedilemedi")
-                            self.dialog_yoneticisi.show_notification("PDF Oluşturulamadı", "PDF oluşturulurken bir hata oluştu.")
+                        # STATE'İ GÖNDER (Arka planda; UI donmaz)
+                        self._pdf_arka_planda_kaydet(pdf, cikti_dosya, self.controller.sayfa_haritasi)
                     else:
                         self.logger.info("Kullanıcı PDF kaydetmeyi iptal etti")
                 except Exception as e:
@@ -467,6 +476,66 @@ class OturumYoneticisi:
                 f"Beklenmeyen bir hata oluştu:\n{str(e)}\n\Lütfen konsolu kontrol edin."
             )
                          
+    def _pdf_arka_planda_kaydet(self, pdf, cikti_dosya, sayfa_haritasi):
+        """
+        YENİ: 'pdf.kaydet'i worker thread'de çalıştırır.
+        İlerleme ve sonuç UI'a SADECE 'controller.after(0, ...)' ile döner.
+        'İptal' butonu 'iptal_token'ı set eder; kaydet bir sonraki sayfada durur.
+        """
+        if self._pdf_kaydediliyor:
+            self.logger.warning("Zaten devam eden bir PDF kaydetme işlemi var, yeni istek yok sayıldı.")
+            return
+        self._pdf_kaydediliyor = True
+
+        iptal_token = threading.Event()
+        ilerleme_dialogu = self.dialog_yoneticisi.show_ilerleme_dialog(
+            "PDF Oluşturuluyor", on_cancel=iptal_token.set
+        )
+        secilen_sayisi = len(self.controller.secilen_gorseller)
+        konu_dagilimi = dict(self.controller.konu_soru_dagilimi)
+
+        def _ui_thread_e_gonder(fonksiyon, *args):
+            try:
+                self.controller.after(0, fonksiyon, *args)
+            except Exception:
+                pass # Pencere kapatılmış (TclError); gösterecek UI yok
+
+        def _ilerleme(tamamlanan, toplam, asama):
+            _ui_thread_e_gonder(ilerleme_dialogu.guncelle, tamamlanan, toplam, asama)
+
+        def _bitti(basarili, iptal_edildi):
+            self._pdf_kaydediliyor = False
+            ilerleme_dialogu.kapat()
+
+            if iptal_edildi:
+                self.logger.info("PDF kaydetme iptal edildi, dosya yazılmadı.")
+                self.dialog_yoneticisi.show_notification("PDF Oluşturulmadı", "PDF kaydetme işlemi iptal edildi.")
+            elif basarili:
+                kayit_yeri = f"{os.path.basename(os.path.dirname(cikti_dosya))}/{os.path.basename(cikti_dosya)}"
+                self.logger.info(f"PDF başarıyla oluşturuldu: {os.path.basename(cikti_dosya)}")
+                self.dialog_yoneticisi.show_notification(
+                    "PDF Başarıyla Oluşturuldu!",
+                    f"Kayıt Yeri: {kayit_yeri}\n\n{secilen_sayisi} soru PDF formatında kaydedildi\n\nKonu Dağılımı:\n" + 
+                    "\n".join([f"• {konu}: {sayi} soru" for konu, sayi in konu_dagilimi.items()])
+                )
+            else:
+                self.logger.error("PDF kaydedilemedi")
+                self.dialog_yoneticisi.show_notification("PDF Oluşturulamadı", "PDF oluşturulurken bir hata oluştu.")
+
+        def _worker():
+            basarili = False
+            try:
+                basarili = pdf.kaydet(
+                    cikti_dosya, sayfa_haritasi,
+                    ilerleme_callback=_ilerleme, iptal_token=iptal_token
+                )
+            except Exception as e:
+                self.logger.error(f"PDF kaydetme worker hatası: {e}", exc_info=True)
+            finally:
+                _ui_thread_e_gonder(_bitti, basarili, iptal_token.is_set() and not basarili)
+
+        threading.Thread(target=_worker, name="PDFKaydetme", daemon=True).start()
+
     def basit_pdf_olustur(self):
         """Basit PDF oluşturma - PDFCreator sınıfı import edilemediğinde."""
         self.logger.warning("Basit PDF oluşturma moduna geçildi")
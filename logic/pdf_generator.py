@@ -10,11 +10,17 @@ import os
 import json
 import math
 import logging
+import time
+import random
+from bisect import bisect_left, bisect_right
 from datetime import datetime
 from logging.handlers import RotatingFileHandler
 from reportlab.pdfbase import pdfmetrics
 from reportlab.pdfbase.ttfonts import TTFont
 import sys
+from logic.gorsel_olcer import boyut_servisi_al
+from logic.gorsel_hazirlayici import GorselHazirlayici
+from logic.soru_katalogu import cevap_anahtari as katalog_cevap_anahtari
 
 
 # Fontları 'resources/fonts' klasöründen yükle
@@ -66,13 +72,166 @@ DEFAULT_FONT = DEFAULT_FONT_REGULAR
 # Adı otomatik olarak 'logic.pdf_generator' olacaktır.
 logger = logging.getLogger(__name__)
 
+# BestFit planlama motoru: "bisect" (sıralı havuz, O(n log n)) veya
+# "klasik" (her yerleştirmede tüm soruları tarayan eski yöntem, O(n²)).
+PLANLAMA_MOTORU = "bisect"
+
+# Test düzeni planlama ölçüleri (pt). '_create_working_test_layout' ile uyumlu olmalı.
+TEST_TOP_MARGIN_SAYFA_1 = 50 # Başlıklı sayfa boşluğu
+TEST_TOP_MARGIN_DIGER = 35   # Başlıksız sayfa boşluğu (Daha az boşluk)
+TEST_SUTUN_SAYISI = 2
+TEST_GORSEL_ARALIGI = 10
+TEST_MIN_SIGMA_PAYI = 50     # Sütunda bundan az boşluk kaldıysa sütun kapanır
+
+# Varyant (kitapçık) üretiminde 'cikti_dpi' verilmemişse kullanılacak DPI.
+# Görseller bir kez küçültülüp TÜM varyantlarda paylaşılır.
+VARYANT_CIKTI_DPI = 300
+
+# 'kaydet' ilerleme aşamaları ('ilerleme_callback'in 3. argümanı)
+ASAMA_HAZIRLIK = "Görseller hazırlanıyor"
+ASAMA_SAYFALAR = "Sayfalar çiziliyor"
+ASAMA_CEVAP_ANAHTARI = "Cevap anahtarı ekleniyor"
+ASAMA_YAZMA = "PDF dosyası yazılıyor"
+
+
+class _DogrusalSoruHavuzu:
+    """
+    ESKİ (klasik) BestFit seçimi: Her çağrıda kalan TÜM soruları tarar.
+    Karşılaştırma / doğrulama için korunuyor.
+    """
+    def __init__(self, tum_soru_analizi):
+        self.sorular = tum_soru_analizi
+        self.kullanilan = set()
+
+    def __len__(self):
+        return len(self.sorular) - len(self.kullanilan)
+
+    def en_uygununu_al(self, kalan_bosluk):
+        uygun_sorular = []
+        for soru in self.sorular:
+            if soru['index'] not in self.kullanilan:
+                if soru['total_height'] <= kalan_bosluk:
+                    uygun_sorular.append(soru)
+
+        if not uygun_sorular:
+            return None
+
+        secilen_soru = min(uygun_sorular, key=lambda s: (kalan_bosluk - s['total_height']))
+        self.kullanilan.add(secilen_soru['index'])
+        return secilen_soru
+
+
+class _SiraliSoruHavuzu:
+    """
+    YENİ BestFit seçimi: Sorular (total_height, index) sırasına göre
+    'bisect'lenebilir, DEĞİŞMEYEN bir dizide tutulur; alınan sorular diziden
+    çıkarılmaz, bir Fenwick ağacında (ikili indeksli ağaç) "alındı" olarak
+    işaretlenir (tembel silme). Böylece hem "kalan_bosluk'a sığan en büyük
+    soru" araması hem de sorunun havuzdan çıkarılması O(log n)'dir; planlama
+    toplamda O(n log n) olur. ('list.pop' ile çıkarma her seçimde dizinin
+    kalanını kaydırıyordu: O(n) eleman taşıma, toplamda O(n²).)
+
+    Eşitlik kuralı klasik motorla BİREBİR aynıdır: 'kalan_bosluk - yükseklik'
+    değeri eşit olan adaylardan listede ÖNCE gelen (küçük index) seçilir.
+    """
+    def __init__(self, tum_soru_analizi):
+        sirali = sorted(tum_soru_analizi, key=lambda s: (s['total_height'], s['index']))
+        self.anahtarlar = [(s['total_height'], s['index']) for s in sirali]
+        self.sorular = sirali
+        self._n = len(sirali)
+        self._kalan = self._n
+        # Fenwick ağacı: konum başına 1 (havuzda) / 0 (alındı); O(n) kurulum
+        self._agac = [0] * (self._n + 1)
+        for i in range(1, self._n + 1):
+            self._agac[i] += 1
+            ust = i + (i & -i)
+            if ust <= self._n:
+                self._agac[ust] += self._agac[i]
+        self._en_buyuk_adim = 1 << self._n.bit_length() if self._n else 0
+
+    def __len__(self):
+        return self._kalan
+
+    def _cikar(self, konum):
+        i = konum + 1
+        while i <= self._n:
+            self._agac[i] -= 1
+            i += i & -i
+        self._kalan -= 1
+
+    def _onek(self, konum):
+        """[0, konum) aralığında havuzda kalan soru sayısı."""
+        toplam = 0
+        while konum > 0:
+            toplam += self._agac[konum]
+            konum -= konum & -konum
+        return toplam
+
+    def _kinci(self, k):
+        """Havuzda kalan k'ıncı (1'den başlayan) sorunun dizideki konumu."""
+        konum = 0
+        adim = self._en_buyuk_adim
+        while adim:
+            if konum + adim <= self._n and self._agac[konum + adim] < k:
+                konum += adim
+                k -= self._agac[konum]
+            adim >>= 1
+        return konum
+
+    def _oncekini_bul(self, konum):
+        """'konum'dan önceki, havuzda kalan son sorunun konumu (yoksa -1)."""
+        sayi = self._onek(konum)
+        return self._kinci(sayi) if sayi else -1
+
+    def _grup_basi(self, yukseklik):
+        """Aynı yükseklikteki, havuzda kalan soru grubunun (en küçük index) konumu."""
+        sayi = self._onek(bisect_left(self.anahtarlar, (yukseklik, -math.inf)))
+        return self._kinci(sayi + 1)
+
+    def en_uygununu_al(self, kalan_bosluk):
+        son = self._oncekini_bul(bisect_right(self.anahtarlar, (kalan_bosluk, math.inf)))
+        if son < 0:
+            return None
+
+        # En büyük sığan yüksekliğin grubundaki ilk (en küçük index) soru
+        en_iyi = self._grup_basi(self.anahtarlar[son][0])
+        en_iyi_fark = kalan_bosluk - self.anahtarlar[en_iyi][0]
+
+        # Float yuvarlaması: farklı yükseklikler aynı 'kalan - yükseklik' farkını
+        # verebilir. Klasik motor bu durumda küçük index'i seçer; biz de öyle yapıyoruz.
+        onceki = self._oncekini_bul(en_iyi)
+        while onceki >= 0 and kalan_bosluk - self.anahtarlar[onceki][0] == en_iyi_fark:
+            grup = self._grup_basi(self.anahtarlar[onceki][0])
+            if self.anahtarlar[grup][1] < self.anahtarlar[en_iyi][1]:
+                en_iyi = grup
+            onceki = self._oncekini_bul(grup)
+
+        self._cikar(en_iyi)
+        return self.sorular[en_iyi]
+
+
 class PDFCreator:
     def __init__(self):
         self.gorsel_listesi = []
         self.baslik_metni = ""
         self.cevap_listesi = []
         self.soru_tipi = "test"
+        # Görsel boyutları (w, h) için başlık-okuyan, kalıcı önbellekli servis.
+        # Soru bankası kökü biliniyorsa çağıran 'boyut_servisi_al(kok)' ile değiştirir.
+        self.boyut_servisi = boyut_servisi_al()
+        self._sablon_formlari = {} # {template_path: form_adi} ('kaydet' başına)
+        # Soru görselleri için hedef çıktı DPI'ı (örn: 200/300).
+        # None: görseller orijinal çözünürlükte gömülür.
+        self.cikti_dpi = None
+        self.gorsel_hazirlayici = None
+        self._sabit_boyutlar = None # Varyant modunda bir kez ölçülen boyutlar {path: (w, h)}
     
+    def _gorsel_boyutu(self, gorsel_path):
+        """Görseli AÇMADAN (sadece başlığından / önbellekten) (genişlik, yükseklik) döndürür."""
+        if self._sabit_boyutlar is not None and gorsel_path in self._sabit_boyutlar:
+            return self._sabit_boyutlar[gorsel_path] # Varyant modu: tekrar 'stat' bile yok
+        return self.boyut_servisi.boyut_al(gorsel_path)
+
     def baslik_ekle(self, baslik):
         """PDF basligini ayarla"""
         self.baslik_metni = baslik
@@ -84,53 +243,43 @@ class PDFCreator:
         if cevap:
             self.cevap_listesi.append(cevap)
     
-    def planla_test_duzeni(self):
+    def _soru_havuzu_olustur(self, sorular, motor=None):
+        """Planlama motoruna göre BestFit soru havuzunu oluşturur."""
+        motor = motor or PLANLAMA_MOTORU
+        if motor == "klasik":
+            return _DogrusalSoruHavuzu(sorular)
+        return _SiraliSoruHavuzu(sorular)
+
+    def _test_soru_analizi(self):
         """
-        GÜNCELLENDİ (Dinamik Boşluk):
-        Artık Sayfa 1 için farklı (daha büyük) 'top_margin',
-        diğer sayfalar için farklı (daha küçük) 'top_margin' hesaplar.
+        'gorsel_listesi'ndeki TÜM soruların sütun genişliğine göre
+        'total_height' ve 'final_size' değerlerini BİR KERE hesaplar.
         """
-        logger.info(f"BestFit DÜZEN PLANLAMASI (Sütunlu + Dinamik Boşluk) başlıyor - {len(self.gorsel_listesi)} soru")
-
-        # --- 1. Gerekli Sabitleri Al ---
-        page_width, page_height = A4
-        
-        # MARJİN SABİTLERİ (Dinamik olarak kullanılacak)
-        TOP_MARGIN_SAYFA_1 = 50 # Başlıklı sayfa boşluğu (Senin dosyadaki değer)
-        TOP_MARGIN_DIGER = 35   # Başlıksız sayfa boşluğu (Daha az boşluk)
-        
-        bottom_margin = 5
+        page_width, _ = A4
         left_margin = 20
         right_margin = 20
         col_gap = 40
-        cols = 2
-        soru_font_size = 10
         soru_spacing = 8
-        image_spacing = 10
 
         usable_width = page_width - left_margin - right_margin
-        col_width = (usable_width - col_gap) / cols
-        # usable_height artık DİNAMİK
+        col_width = (usable_width - col_gap) / TEST_SUTUN_SAYISI
 
-        # --- 2. TÜM Soruları BİR KERE Analiz Et ---
         tum_soru_analizi = []
         for i, gorsel_path in enumerate(self.gorsel_listesi):
             try:
-                with PILImage.open(gorsel_path) as img:
-                    original_width = img.width
-                    original_height = img.height
-                    img_ratio = original_width / original_height
-                    final_width = col_width * 0.98
-                    final_height = final_width / img_ratio
-                    total_height = final_height + soru_spacing + image_spacing
-                    
-                    soru_info = {
-                        'index': i, 
-                        'path': gorsel_path,
-                        'total_height': total_height,
-                        'final_size': (final_width, final_height)
-                    }
-                    tum_soru_analizi.append(soru_info)
+                original_width, original_height = self._gorsel_boyutu(gorsel_path)
+                img_ratio = original_width / original_height
+                final_width = col_width * 0.98
+                final_height = final_width / img_ratio
+                total_height = final_height + soru_spacing + TEST_GORSEL_ARALIGI
+                
+                soru_info = {
+                    'index': i, 
+                    'path': gorsel_path,
+                    'total_height': total_height,
+                    'final_size': (final_width, final_height)
+                }
+                tum_soru_analizi.append(soru_info)
             except Exception as e:
                 logger.error(f"PLANLAMA - Soru {i} analiz hatası: {gorsel_path}", exc_info=True)
                 tum_soru_analizi.append({
@@ -140,48 +289,90 @@ class PDFCreator:
                     'final_size': (col_width * 0.98, 250)
                 })
 
-        # --- 3. 'BestFit' Simülasyonu (Dinamik Boşlukla) ---
-        sayfa_haritasi = []
-        kullanilan_global_indices = set()
-        toplam_soru_sayisi = len(self.gorsel_listesi)
+        # Yeni ölçülen boyutları soru bankasındaki dizine yaz (değişiklik yoksa no-op)
+        self.boyut_servisi.kaydet()
+        return tum_soru_analizi
+
+    def _test_sayfasi_doldur(self, havuz, sayfa_no):
+        """
+        TEK bir sayfanın sütunlarını havuzdan BestFit ile doldurur.
+        Seçilen sorular havuzdan çıkarılır.
+        """
+        _, page_height = A4
+
+        # --- DİNAMİK BOŞLUK HESAPLAMASI ---
+        current_top_margin = TEST_TOP_MARGIN_SAYFA_1 if sayfa_no == 1 else TEST_TOP_MARGIN_DIGER
         
-        sayfa_no = 1 # Sayfa sayacını başlat
+        bu_sayfa_sutunlari = [[] for _ in range(TEST_SUTUN_SAYISI)] 
+        
+        # Y pozisyonları (Dipten Yukarı)
+        current_y_positions = [page_height - current_top_margin for _ in range(TEST_SUTUN_SAYISI)] 
 
-        while len(kullanilan_global_indices) < toplam_soru_sayisi:
-            
-            # --- DİNAMİK BOŞLUK HESAPLAMASI (Loop içinde) ---
-            current_top_margin = TOP_MARGIN_SAYFA_1 if sayfa_no == 1 else TOP_MARGIN_DIGER
-            usable_height = page_height - current_top_margin - bottom_margin
-            
-            bu_sayfa_sutunlari = [[] for _ in range(cols)] 
-            
-            # Y pozisyonları (Dipten Yukarı) HESAPLAMASI (Loop içinde)
-            current_y_positions = [page_height - current_top_margin for _ in range(cols)] 
+        for sutun_index in range(TEST_SUTUN_SAYISI):
+            while True:
+                kalan_bosluk = current_y_positions[sutun_index] - (current_top_margin)
+                
+                if kalan_bosluk < TEST_MIN_SIGMA_PAYI:
+                    break
 
-            for sutun_index in range(cols):
-                while True:
-                    kalan_bosluk = current_y_positions[sutun_index] - (current_top_margin)
-                    
-                    if kalan_bosluk < 50: # Minimum sığma payı
-                        break
+                # Boşluğa sığan EN BÜYÜK soruyu (en az boşluk bırakanı) havuzdan çek
+                secilen_soru = havuz.en_uygununu_al(kalan_bosluk)
 
-                    uygun_sorular = []
-                    for soru in tum_soru_analizi:
-                        if soru['index'] not in kullanilan_global_indices:
-                            if soru['total_height'] <= kalan_bosluk:
-                                uygun_sorular.append(soru)
+                if secilen_soru is None:
+                    break 
+                
+                bu_sayfa_sutunlari[sutun_index].append(secilen_soru)
+                current_y_positions[sutun_index] -= (secilen_soru['total_height'] + TEST_GORSEL_ARALIGI)
 
-                    if not uygun_sorular:
-                        break 
+        return bu_sayfa_sutunlari
 
-                    secilen_soru = min(uygun_sorular, key=lambda s: (kalan_bosluk - s['total_height']))
-                    
-                    bu_sayfa_sutunlari[sutun_index].append(secilen_soru)
-                    kullanilan_global_indices.add(secilen_soru['index'])
-                    current_y_positions[sutun_index] -= (secilen_soru['total_height'] + image_spacing)
+    def _test_sayfasi_adimlari(self, bu_sayfa_sutunlari, sayfa_no):
+        """
+        Planlanmış bir sayfanın BestFit adımlarını yeniden oynatır.
+        Her adım için (kalan_bosluk, secilen_soru) verir. Sütun, havuzda
+        sığan soru kalmadığı için kapandıysa son adım (kalan_bosluk, None) olur.
+        ('_test_sayfasi_doldur' ile AYNI float aritmetiğini kullanır.)
+        """
+        _, page_height = A4
+        current_top_margin = TEST_TOP_MARGIN_SAYFA_1 if sayfa_no == 1 else TEST_TOP_MARGIN_DIGER
+
+        for sutun in bu_sayfa_sutunlari:
+            current_y = page_height - current_top_margin
+            for soru in sutun:
+                yield current_y - current_top_margin, soru
+                current_y -= (soru['total_height'] + TEST_GORSEL_ARALIGI)
+
+            kalan_bosluk = current_y - current_top_margin
+            if kalan_bosluk >= TEST_MIN_SIGMA_PAYI:
+                yield kalan_bosluk, None
+
+    def planla_test_duzeni(self, motor=None):
+        """
+        GÜNCELLENDİ (Dinamik Boşluk):
+        Artık Sayfa 1 için farklı (daha büyük) 'top_margin',
+        diğer sayfalar için farklı (daha küçük) 'top_margin' hesaplar.
+        GÜNCELLENDİ (Hızlı Motor):
+        'motor' verilmezse 'PLANLAMA_MOTORU' kullanılır. 'bisect' motoru
+        soruları 'total_height'a göre sıralı tutar, her seçim O(log n) olur.
+        'klasik' motor eski tam taramayı (O(n²)) yapar; sonuçlar aynıdır.
+        """
+        logger.info(f"BestFit DÜZEN PLANLAMASI (Sütunlu + Dinamik Boşluk) başlıyor - {len(self.gorsel_listesi)} soru")
+
+        # --- 1. TÜM Soruları BİR KERE Analiz Et ---
+        tum_soru_analizi = self._test_soru_analizi()
+
+        # --- 2. 'BestFit' Simülasyonu (Dinamik Boşlukla) ---
+        motor = motor or PLANLAMA_MOTORU
+        havuz = self._soru_havuzu_olustur(tum_soru_analizi, motor)
+
+        sayfa_haritasi = []
+        sayfa_no = 1 # Sayfa sayacını başlat
+
+        while len(havuz) > 0:
+            bu_sayfa_sutunlari = self._test_sayfasi_doldur(havuz, sayfa_no)
 
             total_placed_this_page = sum(len(col) for col in bu_sayfa_sutunlari)
-            if total_placed_this_page == 0 and len(kullanilan_global_indices) < toplam_soru_sayisi:
+            if total_placed_this_page == 0 and len(havuz) > 0:
                 logger.error("PLANLAMA - Sonsuz döngü tespit edildi! Kalan sorular sığmıyor.")
                 break 
             
@@ -190,9 +381,138 @@ class PDFCreator:
 
             sayfa_no += 1 # Bir sonraki sayfa için sayacı artır
 
-        logger.info(f"PLANLAMA (Sütunlu+Dinamik) tamamlandı. {len(sayfa_haritasi)} sayfa oluşturulacak.")
+        logger.info(f"PLANLAMA (Sütunlu+Dinamik, motor={motor}) tamamlandı. {len(sayfa_haritasi)} sayfa oluşturulacak.")
+        return sayfa_haritasi
+
+    def planla_test_duzeni_artimli(self, eski_harita, degisen_index, kaldirildi=False):
+        """
+        YENİ (Artımlı Planlama):
+        'gorsel_listesi'nde TEK bir soru değiştirildiğinde ('kaldirildi=False')
+        veya silindiğinde ('kaldirildi=True') önceki 'sayfa_haritasi'nı kullanır.
+
+        - Değişiklikten etkilenmeyen baştaki sayfalar aynen korunur. (Değişen
+          soru, önceki bir sayfada BestFit'in seçimini değiştirecek miydi?
+          Bu, o sayfaların adımları yeniden oynatılarak kontrol edilir.)
+        - İlk etkilenen sayfadan itibaren sayfalar yeniden paketlenir.
+        - Her sayfadan sonra kalan havuz eski plandaki kalan havuzla
+          karşılaştırılır; AYNI olduğu anda eski planın geri kalanı
+          (index'leri kaydırılarak) olduğu gibi eklenir.
+
+        Sonuç, 'planla_test_duzeni()' ile BİREBİR aynıdır. Eski harita bu
+        listeye ait görünmüyorsa tam planlamaya düşülür.
+        """
+        eski_index_sayisi = len(self.gorsel_listesi) + (1 if kaldirildi else 0)
+        if (not eski_harita or not 0 <= degisen_index < eski_index_sayisi
+                or any(sum(len(sutun) for sutun in sayfa) == 0 for sayfa in eski_harita)):
+            logger.info("ARTIMLI PLANLAMA - Eski plan kullanılamıyor, tam planlama yapılıyor.")
+            return self.planla_test_duzeni()
+
+        tum_soru_analizi = self._test_soru_analizi()
+
+        def yeni_index(eski_idx):
+            """Eski plandaki index'in yeni listedeki karşılığı (silinen soru için None)."""
+            if kaldirildi and eski_idx >= degisen_index:
+                return None if eski_idx == degisen_index else eski_idx - 1
+            return eski_idx
+
+        def eski_anahtar(soru):
+            return (yeni_index(soru['index']), soru['path'], soru['total_height'])
+
+        def yeni_anahtar(soru):
+            return (soru['index'], soru['path'], soru['total_height'])
+
+        # --- 1. Eski plan bu listeye mi ait? (Değişen soru dışında her şey aynı olmalı) ---
+        degisen_sayfa = None
+        eski_soru = None
+        for sayfa_idx, sayfa in enumerate(eski_harita):
+            for sutun in sayfa:
+                for soru in sutun:
+                    if soru['index'] == degisen_index:
+                        degisen_sayfa, eski_soru = sayfa_idx, soru
+                        continue
+                    idx = yeni_index(soru['index'])
+                    if (idx is None or idx >= len(tum_soru_analizi)
+                            or yeni_anahtar(tum_soru_analizi[idx]) != eski_anahtar(soru)):
+                        logger.warning("ARTIMLI PLANLAMA - Eski plan güncel listeyle uyuşmuyor, tam planlama yapılıyor.")
+                        return self.planla_test_duzeni()
+
+        # --- 2. İlk etkilenen sayfayı bul ---
+        ilk_sayfa = degisen_sayfa if degisen_sayfa is not None else len(eski_harita)
+        fark = set() # Yeni ve eski kalan havuzların simetrik farkı (anahtar kümesi)
+        if eski_soru is not None:
+            fark.add(eski_anahtar(eski_soru))
+
+        if not kaldirildi:
+            yeni_soru = tum_soru_analizi[degisen_index]
+            fark ^= {yeni_anahtar(yeni_soru)}
+            yeni_yukseklik = yeni_soru['total_height']
+
+            # Yeni soru, daha önceki bir sayfada BestFit'in seçimini değiştirir miydi?
+            for sayfa_idx in range(ilk_sayfa):
+                for kalan_bosluk, secilen in self._test_sayfasi_adimlari(eski_harita[sayfa_idx], sayfa_idx + 1):
+                    if yeni_yukseklik > kalan_bosluk:
+                        continue
+                    if secilen is None:
+                        break # Boş kalan sütun sonuna sığıyor
+                    secilen_fark = kalan_bosluk - secilen['total_height']
+                    yeni_fark = kalan_bosluk - yeni_yukseklik
+                    if yeni_fark < secilen_fark or (yeni_fark == secilen_fark and degisen_index < secilen['index']):
+                        break # Mevcut seçimin yerine geçerdi
+                else:
+                    continue
+                ilk_sayfa = sayfa_idx
+                break
+
+        def eski_sayfayi_aktar(sayfa):
+            return [[tum_soru_analizi[yeni_index(soru['index'])] for soru in sutun] for sutun in sayfa]
+
+        # --- 3. Etkilenmeyen sayfaları koru, kalanları yeniden paketle ---
+        sayfa_haritasi = [eski_sayfayi_aktar(sayfa) for sayfa in eski_harita[:ilk_sayfa]]
+        kullanilan = {soru['index'] for sayfa in sayfa_haritasi for sutun in sayfa for soru in sutun}
+        havuz = self._soru_havuzu_olustur([s for s in tum_soru_analizi if s['index'] not in kullanilan])
+
+        sayfa_idx = ilk_sayfa
+        yeniden_paketlenen = 0
+        while len(havuz) > 0:
+            bu_sayfa_sutunlari = self._test_sayfasi_doldur(havuz, sayfa_idx + 1)
+
+            if sum(len(col) for col in bu_sayfa_sutunlari) == 0:
+                logger.error("PLANLAMA - Sonsuz döngü tespit edildi! Kalan sorular sığmıyor.")
+                break
+
+            sayfa_haritasi.append(bu_sayfa_sutunlari)
+            yeniden_paketlenen += 1
+
+            fark ^= {yeni_anahtar(soru) for sutun in bu_sayfa_sutunlari for soru in sutun}
+            if sayfa_idx < len(eski_harita):
+                fark ^= {eski_anahtar(soru) for sutun in eski_harita[sayfa_idx] for soru in sutun}
+            sayfa_idx += 1
+
+            if not fark and sayfa_idx <= len(eski_harita):
+                # Kalan havuz eski planla aynı -> geri kalan sayfalar da aynı olur
+                sayfa_haritasi.extend(eski_sayfayi_aktar(sayfa) for sayfa in eski_harita[sayfa_idx:])
+                break
+
+        logger.info(
+            f"ARTIMLI PLANLAMA tamamlandı. Sayfa {ilk_sayfa + 1}'den itibaren {yeniden_paketlenen} sayfa "
+            f"yeniden paketlendi, toplam {len(sayfa_haritasi)} sayfa."
+        )
         return sayfa_haritasi
-     
+
+    def planla_yazili_duzeni(self):
+        """
+        Yazılı için basit planlama: Sayfa başına 2 soru, tek sütun.
+        ('total_height'/'final_size' tahminidir; gerçek boyut çizimde hesaplanır.)
+        """
+        soru_listesi = [
+            {'index': i, 'path': path, 'total_height': 500, 'final_size': (500, 400)}
+            for i, path in enumerate(self.gorsel_listesi)
+        ]
+        sayfa_listesi = []
+        for i in range(0, len(soru_listesi), 2): # Sayfa başına 2 soru
+            sayfa_listesi.append([ soru_listesi[i:i+2], [] ])
+        return sayfa_listesi
+
     def cevap_anahtari_ekle(self, cevaplar):
         """Cevap listesini ayarla"""
         self.cevap_listesi = cevaplar
@@ -275,39 +595,37 @@ class PDFCreator:
         
         for i, gorsel_path in enumerate(gorseller[:max_questions]):
             try:
-                with PILImage.open(gorsel_path) as img:
-                    img_ratio = img.width / img.height
-                    original_width = img.width
-                    original_height = img.height
-                    
-                    max_width = usable_width * 0.95
-                    max_height = usable_height * 0.45
-                    
-                    if original_width <= max_width and original_height <= max_height:
+                original_width, original_height = self._gorsel_boyutu(gorsel_path)
+                img_ratio = original_width / original_height
+                
+                max_width = usable_width * 0.95
+                max_height = usable_height * 0.45
+                
+                if original_width <= max_width and original_height <= max_height:
+                    final_width = original_width
+                    final_height = original_height
+                else:
+                    if original_width > max_width:
+                        scale_factor = max_width / original_width
+                        final_width = max_width
+                        final_height = original_height * scale_factor
+                    else:
                         final_width = original_width
                         final_height = original_height
-                    else:
-                        if original_width > max_width:
-                            scale_factor = max_width / original_width
-                            final_width = max_width
-                            final_height = original_height * scale_factor
-                        else:
-                            final_width = original_width
-                            final_height = original_height
-                        
-                        if final_height > max_height:
-                            scale_factor = max_height / final_height
-                            final_height = max_height
-                            final_width = final_width * scale_factor
-                    
-                    gorsel_info.append({
-                        'path': gorsel_path,
-                        'optimal_height': final_height,
-                        'width': final_width,
-                        'ratio': img_ratio,
-                        'is_small': original_width <= max_width and original_height <= max_height
-                    })
                     
+                    if final_height > max_height:
+                        scale_factor = max_height / final_height
+                        final_height = max_height
+                        final_width = final_width * scale_factor
+                
+                gorsel_info.append({
+                    'path': gorsel_path,
+                    'optimal_height': final_height,
+                    'width': final_width,
+                    'ratio': img_ratio,
+                    'is_small': original_width <= max_width and original_height <= max_height
+                })
+                
             except Exception as e:
                 logger.error(f"Gorsel analiz hatasi: {gorsel_path}", exc_info=True)
                 gorsel_info.append({
@@ -432,7 +750,7 @@ class PDFCreator:
                 
                 try:
                     canvas_obj.drawImage(
-                        soru_info['path'],
+                        self._pdf_gorsel_yolu(soru_info['path'], img_w, img_h),
                         img_x, pdf_y_bottom, # (x, y_sol_alt)
                         width=img_w,
                         height=img_h
@@ -462,14 +780,32 @@ class PDFCreator:
         # sadece yerleşen sayısını dönmemiz yeterli.
         return yerlestirildi_sayisi, set()
     
-    def kaydet(self, dosya_yolu, sayfa_haritasi=None):
+    def kaydet(self, dosya_yolu, sayfa_haritasi=None, ilerleme_callback=None, iptal_token=None):
         """
         GÜNCELLENDİ (DİNAMİK ŞABLON):
         Artık 'sayfa_haritasi'nı (Önizlemenin kullandığı planı) parametre olarak alır.
         Başlığı SADECE 1. SAYFAYA çizer.
         Şablonu SADECE 1. SAYFA için 'template.png'/'template2.png',
         diğer sayfalar için 'template3.png'/'template4.png' olarak seçer.
+        GÜNCELLENDİ (Arka Plan Kaydetme):
+        'ilerleme_callback(tamamlanan, toplam, asama)' her aşamada/sayfada çağrılır.
+        'iptal_token' (threading.Event) sayfalar arasında kontrol edilir; iptal
+        edilirse dosya YAZILMAZ ve False döner. (Worker thread'den çağrılabilir;
+        callback'in UI'a 'after()' ile dönmesi çağıranın sorumluluğundadır.)
         """
+        def _ilerleme(tamamlanan, toplam, asama):
+            if ilerleme_callback:
+                try:
+                    ilerleme_callback(tamamlanan, toplam, asama)
+                except Exception as e:
+                    logger.debug(f"İlerleme callback hatası (yok sayıldı): {e}")
+
+        def _iptal_edildi():
+            if iptal_token is not None and iptal_token.is_set():
+                logger.info(f"PDF kaydetme kullanıcı tarafından iptal edildi: {os.path.basename(dosya_yolu)}")
+                return True
+            return False
+
         try:
             logger.info(f"PDF oluşturma başlıyor: Tip={self.soru_tipi}, Dosya={os.path.basename(dosya_yolu)}")
             self.global_soru_sayaci = 0
@@ -478,6 +814,10 @@ class PDFCreator:
             templates_dir = os.path.join(current_dir, "templates")
 
             c = canvas.Canvas(dosya_yolu, pagesize=A4)
+            self._sablon_formlari = {} # Her yeni PDF için form listesi sıfırlanır
+            if self.cikti_dpi and (self.gorsel_hazirlayici is None or self.gorsel_hazirlayici.hedef_dpi != self.cikti_dpi):
+                self.gorsel_hazirlayici = GorselHazirlayici(self.cikti_dpi)
+                logger.info(f"Soru görselleri {self.cikti_dpi} DPI'a küçültülerek gömülecek.")
 
             # --- YENİ MANTIK (TEK BEYİN) ---
             
@@ -490,17 +830,27 @@ class PDFCreator:
                 if self.soru_tipi.lower() == "test":
                     sayfa_haritasi = self.planla_test_duzeni()
                 else: # Yazılı için basit planlama
-                    soru_listesi = [
-                        {'index': i, 'path': path, 'total_height': 500, 'final_size': (500, 400)}
-                        for i, path in enumerate(self.gorsel_listesi)
-                    ]
-                    sayfa_listesi = []
-                    for i in range(0, len(soru_listesi), 2):
-                        sayfa_listesi.append([ soru_listesi[i:i+2], [] ])
-                    sayfa_haritasi = sayfa_listesi
+                    sayfa_haritasi = self.planla_yazili_duzeni()
             
+            # --- GÖRSEL HAZIRLIK AŞAMASI (Çok çekirdekli) ---
+            # Küçültme/yeniden sıkıştırma işleri canvas'tan ÖNCE process havuzunda yapılır.
+            # Canvas montajı aşağıda tek thread'de kalır.
+            if self.cikti_dpi and self.gorsel_hazirlayici is not None:
+                self._gorselleri_hazirla(
+                    sayfa_haritasi,
+                    ilerleme_callback=lambda tamamlanan, toplam: _ilerleme(tamamlanan, toplam, ASAMA_HAZIRLIK),
+                    iptal_token=iptal_token
+                )
+            if _iptal_edildi():
+                return False
+
+            toplam_sayfa = len(sayfa_haritasi)
+            _ilerleme(0, toplam_sayfa, ASAMA_SAYFALAR)
+
             # --- GÜNCELLEME: 'enumerate' KULLANARAK SAYFA İNDEKSİNİ (i) AL ---
             for i, bu_sayfanin_sutunlari in enumerate(sayfa_haritasi):
+                if _iptal_edildi():
+                    return False
                 sayfa_no = i + 1 # Sayfa 1 (i=0), Sayfa 2 (i=1)
                 soru_tipi_lower = self.soru_tipi.lower()
                 
@@ -527,8 +877,8 @@ class PDFCreator:
                          return False # Kritik hata
                 # --- DİNAMİK ŞABLON BİTTİ ---
 
-                # 1. Şablonu çiz
-                c.drawImage(template_path, 0, 0, width=A4[0], height=A4[1])
+                # 1. Şablonu çiz (Her şablon PDF'e BİR KERE form XObject olarak gömülür)
+                c.doForm(self._sablon_formu(c, template_path))
                 
                 # 2. Başlığı SADECE 1. SAYFADA ÇİZ
                 if sayfa_no == 1:
@@ -557,16 +907,26 @@ class PDFCreator:
                 
                 if sayfa_no < len(sayfa_haritasi): # Son sayfa değilse
                     c.showPage()
+
+                _ilerleme(sayfa_no, toplam_sayfa, ASAMA_SAYFALAR)
             
             # --- YENİ MANTIK BİTTİ ---
 
+            if _iptal_edildi():
+                return False
+
             if self.cevap_listesi and len(self.cevap_listesi) > 0:
+                _ilerleme(toplam_sayfa, toplam_sayfa, ASAMA_CEVAP_ANAHTARI)
                 c.showPage()
                 self.create_answer_key_page(c)
                 logger.info("Cevap anahtarı sayfası eklendi")
             else:
                 logger.info("Cevap anahtarı eklenmedi - liste boş veya istenmiyor")
 
+            if _iptal_edildi():
+                return False
+
+            _ilerleme(toplam_sayfa, toplam_sayfa, ASAMA_YAZMA)
             c.save()
             logger.info(f"PDF başarıyla kaydedildi: {dosya_yolu}")
             return True
@@ -576,18 +936,227 @@ class PDFCreator:
             logger.error(f"PDF kaydetme işleminde kritik hata", exc_info=True)
             return False
          
-    def _create_yazili_layout_simple(self, canvas_obj, gorseller, sayfa_no, page_width, page_height, global_offset):
+    def _varyant_duzeni(self, sayfa_haritasi, rastgele):
         """
-        Yazılı için basit layout - sayfa başına maksimum 2 soru
-        GÜNCELLENDİ: 'sayfa_no'ya göre dinamik 'top_margin' kullanır (Boşluk sorunu çözümü).
-        GÜNCELLENDİ: 'drawString' X pozisyonu 'img_x' (resim kenarı) DEĞİL, 'left_margin' (sayfa kenarı) kullanır (Numara hizalama çözümü).
-        GÜNCELLENDİ: Renk siyah, font boyutu küçültüldü (Stil çözümü).
-        GÜNCELLENDİ: Çift haneli sayılar için X pozisyonu ayarlandı (İç içe girme sorunu çözümü).
+        Geçerli bir test planından, yerleşimi bozmadan farklı bir soru sırası üretir:
+        - Son sayfa dışındaki sütunlar sayfalar arasında karıştırılır.
+          (1. sayfanın üst boşluğu büyük; oraya SADECE sığan sütunlar gelir.)
+        - Son sayfanın (kısmen dolu olabilir) sütunları sonda kalır.
+        - Her sütunun içindeki soru sırası karıştırılır (sütun yüksekliği değişmez).
+        'index' alanları yeni sıraya göre yeniden verilir (orijinal dict'ler değişmez).
         """
-        logger.info(f"Yazılı basit layout - Sayfa {sayfa_no}, {len(gorseller)} soru")
-        max_soru_sayisi = min(len(gorseller), 2)
+        _, page_height = A4
+
+        def kapasite(sayfa_no):
+            top_margin = TEST_TOP_MARGIN_SAYFA_1 if sayfa_no == 1 else TEST_TOP_MARGIN_DIGER
+            return page_height - 2 * top_margin
+
+        def sutun_yuksekligi(sutun):
+            return sum(s['total_height'] for s in sutun) + TEST_GORSEL_ARALIGI * max(0, len(sutun) - 1)
+
+        if not sayfa_haritasi:
+            return []
+
+        govde = [list(sutun) for sayfa in sayfa_haritasi[:-1] for sutun in sayfa]
+        son_sayfa = [list(sutun) for sutun in sayfa_haritasi[-1]]
+        rastgele.shuffle(govde)
+        if len(sayfa_haritasi) == 1:
+            rastgele.shuffle(son_sayfa)
+
+        sutunlar = []
+        if govde:
+            # 1. sayfaya sığan ilk sütunları öne al (orijinal 1. sayfa sütunları her zaman sığar)
+            ilk_sayfa = []
+            for sutun in list(govde):
+                if len(ilk_sayfa) == TEST_SUTUN_SAYISI:
+                    break
+                if sutun_yuksekligi(sutun) <= kapasite(1):
+                    ilk_sayfa.append(sutun)
+                    govde.remove(sutun)
+            sutunlar = ilk_sayfa + govde
+        sutunlar += son_sayfa
+
+        yeni_harita = []
+        sira_no = 0
+        for sayfa_basi in range(0, len(sutunlar), TEST_SUTUN_SAYISI):
+            sayfa = []
+            for sutun in sutunlar[sayfa_basi:sayfa_basi + TEST_SUTUN_SAYISI]:
+                rastgele.shuffle(sutun)
+                yeni_sutun = []
+                for soru_info in sutun:
+                    yeni_sutun.append(dict(soru_info, index=sira_no))
+                    sira_no += 1
+                sayfa.append(yeni_sutun)
+            yeni_harita.append(sayfa)
+        return yeni_harita
+
+    def varyantlari_kaydet(self, dosya_yollari, tohumlar, cevap_anahtari=False, baslik_etiketleri=None,
+                           ilerleme_callback=None, iptal_token=None):
+        """
+        YENİ (Çoklu Varyant / Kitapçık):
+        AYNI soru setinden ('gorsel_listesi') her tohum için soru sırası
+        karıştırılmış ayrı bir PDF üretir (A/B/C/D kitapçıkları).
+
+        - Görsel boyutları TÜM varyantlar için BİR KERE ölçülür.
+        - Görseller BİR KERE küçültülür ('GorselHazirlayici' tüm varyantlarda
+          ortaktır); ek varyantlar sadece düzen + canvas süresine mal olur.
+        - Test: BestFit yerleşimi yüksekliğe göre yaptığı için sadece listeyi
+          karıştırıp yeniden planlamak hemen hemen AYNI sırayı verir. Bu yüzden
+          'planla_test_duzeni' bir kez çalışır, her varyant bu planın sütunlarını
+          ve sütun içi sırasını karıştırır ('_varyant_duzeni'). Sayfa sayısı aynı kalır.
+        - Yazılı: Liste karıştırılır ve 'planla_yazili_duzeni' ile yeniden eşlenir.
+
+        Args:
+            dosya_yollari (list): Her varyantın çıktı yolu.
+            tohumlar (list): Her varyantın karıştırma tohumu (aynı uzunlukta).
+            cevap_anahtari (bool): Varyantın KENDİ sırasına göre cevap anahtarı ekle.
+            baslik_etiketleri (list, opsiyonel): Başlığa eklenecek etiket ("A", "B", ...).
+            ilerleme_callback(tamamlanan, toplam, asama): Varyant seviyesinde ilerleme.
+            iptal_token (threading.Event): Varyantlar (ve sayfalar) arasında kontrol edilir.
+
+        Returns:
+            list[dict]: Her varyant için {'dosya', 'tohum', 'gorsel_listesi',
+            'sayfa_haritasi', 'cevaplar', 'basarili'}
+        """
+        if len(dosya_yollari) != len(tohumlar):
+            raise ValueError("'dosya_yollari' ve 'tohumlar' aynı uzunlukta olmalı")
+
+        orijinal_liste = list(self.gorsel_listesi)
+        orijinal_baslik = self.baslik_metni
+        orijinal_cevaplar = self.cevap_listesi
+        orijinal_dpi = self.cikti_dpi
+        if not self.cikti_dpi:
+            self.cikti_dpi = VARYANT_CIKTI_DPI
+
+        logger.info(f"VARYANT ÜRETİMİ başlıyor: {len(tohumlar)} varyant, {len(orijinal_liste)} soru")
+
+        # 1. Ortak ölçümler (her görsel BİR KERE)
+        self._sabit_boyutlar = {}
+        for gorsel_path in dict.fromkeys(orijinal_liste):
+            try:
+                self._sabit_boyutlar[gorsel_path] = self.boyut_servisi.boyut_al(gorsel_path)
+            except Exception as e:
+                logger.warning(f"VARYANT - Görsel ölçülemedi (planlamada varsayılan boyut): {gorsel_path} -> {e}")
+        self.boyut_servisi.kaydet()
+
+        cevap_onbellegi = {}
+        sonuclar = []
+        try:
+            # Test: BestFit planı TÜM varyantlar için bir kez
+            temel_harita = self.planla_test_duzeni() if self.soru_tipi.lower() == "test" else None
+
+            for varyant_no, (dosya_yolu, tohum) in enumerate(zip(dosya_yollari, tohumlar)):
+                if iptal_token is not None and iptal_token.is_set():
+                    logger.info("VARYANT ÜRETİMİ iptal edildi.")
+                    break
+                if ilerleme_callback:
+                    ilerleme_callback(varyant_no, len(tohumlar), f"Varyant {varyant_no + 1}/{len(tohumlar)}")
+
+                # 2. Varyantın düzenini oluştur
+                rastgele = random.Random(tohum)
+                if temel_harita is not None:
+                    sayfa_haritasi = self._varyant_duzeni(temel_harita, rastgele)
+                    sira = [soru_info['path'] for sayfa in sayfa_haritasi for sutun in sayfa for soru_info in sutun]
+                    self.gorsel_listesi = sira
+                else:
+                    sira = list(orijinal_liste)
+                    rastgele.shuffle(sira)
+                    self.gorsel_listesi = sira
+                    sayfa_haritasi = self.planla_yazili_duzeni()
+
+                # 3. Cevap anahtarı (varyantın planlanmış sırasına göre)
+                yollar = [soru_info['path'] for sayfa in sayfa_haritasi for sutun in sayfa for soru_info in sutun]
+                eksikler = [yol for yol in dict.fromkeys(yollar) if yol not in cevap_onbellegi]
+                if eksikler:
+                    # Cevaplar soru kataloğunda hazır (dosya sistemine gidilmez)
+                    cevap_onbellegi.update(zip(eksikler, katalog_cevap_anahtari(eksikler)))
+                cevaplar = [cevap_onbellegi[yol] for yol in yollar]
+                self.cevap_listesi = cevaplar if cevap_anahtari else []
+
+                if baslik_etiketleri:
+                    self.baslik_metni = f"{orijinal_baslik} ({baslik_etiketleri[varyant_no]})".strip()
+
+                # 4. Kaydet (görsel hazırlayıcı varyantlar arasında ORTAK)
+                basarili = self.kaydet(dosya_yolu, sayfa_haritasi, iptal_token=iptal_token)
+                sonuclar.append({
+                    'dosya': dosya_yolu,
+                    'tohum': tohum,
+                    'gorsel_listesi': sira,
+                    'sayfa_haritasi': sayfa_haritasi,
+                    'cevaplar': cevaplar,
+                    'basarili': basarili,
+                })
+        finally:
+            self.gorsel_listesi = orijinal_liste
+            self.baslik_metni = orijinal_baslik
+            self.cevap_listesi = orijinal_cevaplar
+            self.cikti_dpi = orijinal_dpi
+            self._sabit_boyutlar = None
+
+        if ilerleme_callback:
+            ilerleme_callback(len(sonuclar), len(tohumlar), "Varyantlar tamamlandı")
+        logger.info(f"VARYANT ÜRETİMİ tamamlandı: {sum(1 for v in sonuclar if v['basarili'])}/{len(tohumlar)} başarılı")
+        return sonuclar
+
+    def _gorselleri_hazirla(self, sayfa_haritasi, ilerleme_callback=None, iptal_token=None):
+        """
+        Haritadaki TÜM soru görsellerinin, PDF'te basılacakları boyutları
+        çıkarır ve 'GorselHazirlayici.toplu_hazirla' ile paralel hazırlar.
+        Çizim sırasında '_pdf_gorsel_yolu' bu sonuçları hazır bulur.
+        """
+        page_width, page_height = A4
+        istekler = []
+        for sayfa_idx, bu_sayfanin_sutunlari in enumerate(sayfa_haritasi):
+            if self.soru_tipi.lower() == "yazili":
+                gorseller = [info['path'] for sutun in bu_sayfanin_sutunlari for info in sutun]
+                max_soru_sayisi = min(len(gorseller), 2)
+                if max_soru_sayisi == 0:
+                    continue
+                _, _, usable_width, soru_area_height = self._yazili_basit_olculer(
+                    sayfa_idx + 1, max_soru_sayisi, page_width, page_height
+                )
+                for gorsel_path in gorseller[:max_soru_sayisi]:
+                    try:
+                        istekler.append((gorsel_path, *self._yazili_basit_gorsel_boyutu(gorsel_path, usable_width, soru_area_height)))
+                    except Exception as e:
+                        logger.debug(f"Hazırlık - yazılı görsel boyutu alınamadı: {gorsel_path} -> {e}")
+            else:
+                for sutun in bu_sayfanin_sutunlari:
+                    for soru_info in sutun:
+                        istekler.append((soru_info['path'], *soru_info['final_size']))
+
+        baslangic = time.perf_counter()
+        self.gorsel_hazirlayici.toplu_hazirla(istekler, ilerleme_callback=ilerleme_callback, iptal_token=iptal_token)
+        logger.info(f"Görsel hazırlık aşaması: {len(istekler)} görsel, {time.perf_counter() - baslangic:.2f} sn")
+
+    def _pdf_gorsel_yolu(self, gorsel_path, genislik_pt, yukseklik_pt):
+        """
+        PDF'e gömülecek görsel yolunu döndürür. 'cikti_dpi' ayarlıysa görsel
+        basılacağı boyuta göre küçültülmüş (önbellekteki) kopyadır.
+        """
+        if not self.cikti_dpi or self.gorsel_hazirlayici is None:
+            return gorsel_path
+        return self.gorsel_hazirlayici.hazirla(gorsel_path, genislik_pt, yukseklik_pt)
 
-        # --- 1. DİNAMİK BOŞLUK ÇÖZÜMÜ (PDF/ReportLab pt) ---
+    def _sablon_formu(self, canvas_obj, template_path):
+        """
+        YENİ: Şablon sayfasını (template*.png) bu PDF için SADECE BİR KERE
+        form XObject olarak çizer ve adını döndürür. Sonraki sayfalar aynı
+        formu 'doForm' ile referans alır; görsel tekrar okunmaz/kodlanmaz.
+        """
+        form_adi = self._sablon_formlari.get(template_path)
+        if form_adi is None:
+            form_adi = f"Sablon{len(self._sablon_formlari) + 1}"
+            canvas_obj.beginForm(form_adi, 0, 0, A4[0], A4[1])
+            canvas_obj.drawImage(template_path, 0, 0, width=A4[0], height=A4[1])
+            canvas_obj.endForm()
+            self._sablon_formlari[template_path] = form_adi
+            logger.debug(f"Şablon formu oluşturuldu: {form_adi} <- {os.path.basename(template_path)}")
+        return form_adi
+
+    def _yazili_basit_olculer(self, sayfa_no, max_soru_sayisi, page_width, page_height):
+        """'_create_yazili_layout_simple' ölçüleri: (top_margin, left_margin, usable_width, soru_area_height)"""
+        # --- DİNAMİK BOŞLUK ÇÖZÜMÜ (PDF/ReportLab pt) ---
         if sayfa_no == 1:
             top_margin = 50 # Başlıklı (50pt - senin ayarın)
         else:
@@ -601,6 +1170,37 @@ class PDFCreator:
         usable_height = page_height - top_margin - bottom_margin
 
         soru_area_height = usable_height / max_soru_sayisi
+        return top_margin, left_margin, usable_width, soru_area_height
+
+    def _yazili_basit_gorsel_boyutu(self, gorsel_path, usable_width, soru_area_height):
+        """Yazılı sorunun, soru alanına sığdırılmış (final_width, final_height) boyutu (pt)."""
+        original_width, original_height = self._gorsel_boyutu(gorsel_path)
+        img_ratio = original_width / original_height
+        max_img_width = usable_width * 0.95
+        max_img_height = soru_area_height * 0.8 # Soru alanı
+
+        if img_ratio > (max_img_width / max_img_height):
+            final_width = max_img_width
+            final_height = max_img_width / img_ratio
+        else:
+            final_height = max_img_height
+            final_width = max_img_height * img_ratio
+        return final_width, final_height
+
+    def _create_yazili_layout_simple(self, canvas_obj, gorseller, sayfa_no, page_width, page_height, global_offset):
+        """
+        Yazılı için basit layout - sayfa başına maksimum 2 soru
+        GÜNCELLENDİ: 'sayfa_no'ya göre dinamik 'top_margin' kullanır (Boşluk sorunu çözümü).
+        GÜNCELLENDİ: 'drawString' X pozisyonu 'img_x' (resim kenarı) DEĞİL, 'left_margin' (sayfa kenarı) kullanır (Numara hizalama çözümü).
+        GÜNCELLENDİ: Renk siyah, font boyutu küçültüldü (Stil çözümü).
+        GÜNCELLENDİ: Çift haneli sayılar için X pozisyonu ayarlandı (İç içe girme sorunu çözümü).
+        """
+        logger.info(f"Yazılı basit layout - Sayfa {sayfa_no}, {len(gorseller)} soru")
+        max_soru_sayisi = min(len(gorseller), 2)
+
+        top_margin, left_margin, usable_width, soru_area_height = self._yazili_basit_olculer(
+            sayfa_no, max_soru_sayisi, page_width, page_height
+        )
         yerlestirildi_sayisi = 0
 
         for i in range(max_soru_sayisi):
@@ -610,54 +1210,46 @@ class PDFCreator:
                 gorsel_path = gorseller[i]
                 soru_start_y = top_margin + i * soru_area_height # Tepeden DİNAMİK boşluk
                 
-                with PILImage.open(gorsel_path) as img:
-                    original_width, original_height = img.width, img.height
-                    img_ratio = original_width / original_height
-                    max_img_width = usable_width * 0.95
-                    max_img_height = soru_area_height * 0.8 # Soru alanı
+                final_width, final_height = self._yazili_basit_gorsel_boyutu(gorsel_path, usable_width, soru_area_height)
 
-                    if img_ratio > (max_img_width / max_img_height):
-                        final_width = max_img_width
-                        final_height = max_img_width / img_ratio
-                    else:
-                        final_height = max_img_height
-                        final_width = max_img_height * img_ratio
-
-                    # Ortalanmış X pozisyonu
-                    img_x = left_margin + (usable_width - final_width) / 2
-                    
-                    # Y pozisyonu (ReportLab: Dipten Yukarı)
-                    img_y_sol_alt = (page_height - soru_start_y) - final_height
-                    
-                    canvas_obj.drawImage(gorsel_path, img_x, img_y_sol_alt, width=final_width, height=final_height)
+                # Ortalanmış X pozisyonu
+                img_x = left_margin + (usable_width - final_width) / 2
+                
+                # Y pozisyonu (ReportLab: Dipten Yukarı)
+                img_y_sol_alt = (page_height - soru_start_y) - final_height
+                
+                canvas_obj.drawImage(
+                    self._pdf_gorsel_yolu(gorsel_path, final_width, final_height),
+                    img_x, img_y_sol_alt, width=final_width, height=final_height
+                )
 
-                    soru_no = global_offset + i + 1
-                    
-                    # --- 2. STİL GÜNCELLEMESİ (BOYUT VE RENK) ---
-                    # ESKİ: canvas_obj.setFont("Helvetica-Bold", 16)
-                    # YENİ: Daha küçük font
-                    canvas_obj.setFont("Helvetica-Bold", 14) 
-                    
-                    # ESKİ: canvas_obj.setFillColor("#666666")
-                    # YENİ: Siyah renk
-                    canvas_obj.setFillColorRGB(0, 0, 0)
-                    
-                    # --- 3. STİL GÜNCELLEMESİ (HİZALAMA) ---
-                    
-                    # --- ÇİFT HANE SORUNU ÇÖZÜMÜ ---
-                    # Numarayı 'left_margin' (sayfa kenarı) koordinatına çiz.
-                    numara_x = left_margin
-                    if soru_no >= 10:
-                        # Eğer sayı 10 veya üstüyse, '14pt' fontun genişliği kadar
-                        # (yaklaşık 7-8pt) sola kaydır ki '0' rakamı metne girmesin.
-                        numara_x -= 8 
-                    # --- BİTTİ ---
-                    
-                    numara_y_tepe = (img_y_sol_alt - 10) + final_height
-                    canvas_obj.drawString(numara_x, numara_y_tepe, f"{soru_no}.")
-                    
-                    yerlestirildi_sayisi += 1
-                    logger.info(f"✅ Yazılı soru {soru_no} yerleştirildi")
+                soru_no = global_offset + i + 1
+                
+                # --- 2. STİL GÜNCELLEMESİ (BOYUT VE RENK) ---
+                # ESKİ: canvas_obj.setFont("Helvetica-Bold", 16)
+                # YENİ: Daha küçük font
+                canvas_obj.setFont("Helvetica-Bold", 14) 
+                
+                # ESKİ: canvas_obj.setFillColor("#666666")
+                # YENİ: Siyah renk
+                canvas_obj.setFillColorRGB(0, 0, 0)
+                
+                # --- 3. STİL GÜNCELLEMESİ (HİZALAMA) ---
+                
+                # --- ÇİFT HANE SORUNU ÇÖZÜMÜ ---
+                # Numarayı 'left_margin' (sayfa kenarı) koordinatına çiz.
+                numara_x = left_margin
+                if soru_no >= 10:
+                    # Eğer sayı 10 veya üstüyse, '14pt' fontun genişliği kadar
+                    # (yaklaşık 7-8pt) sola kaydır ki '0' rakamı metne girmesin.
+                    numara_x -= 8 
+                # --- BİTTİ ---
+                
+                numara_y_tepe = (img_y_sol_alt - 10) + final_height
+                canvas_obj.drawString(numara_x, numara_y_tepe, f"{soru_no}.")
+                
+                yerlestirildi_sayisi += 1
+                logger.info(f"✅ Yazılı soru {soru_no} yerleştirildi")
             except Exception as e:
                 logger.error(f"❌ Yazılı soru {i+1} yerleştirme hatası", exc_info=True)
         return yerlestirildi_sayisi
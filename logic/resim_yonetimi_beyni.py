@@ -2,12 +2,21 @@
 
 import os
 import logging
-from PIL import Image
 import shutil  
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime 
+from logic.klasor_izleyici import KlasorIzleyici
+from logic.soru_katalogu import GORSEL_UZANTILARI, katalog_al
+from logic.icerik_dizini import icerik_dizini_al
+from logic.benzerlik_dizini import benzerlik_dizini_al
+from logic.thumbnail_onbellegi import ThumbnailOnbellegi
+from logic.gorsel_uzantilari import IMAGE_EXTS
+from logic.toplu_yukleyici import TopluYukleyici
 
 logger = logging.getLogger(__name__)
-IMAGE_EXTS = ('.png', '.jpg', '.jpeg', '.gif', '.bmp', '.tiff', '.webp')
+# Thumbnail çözme işçileri (PIL çözme sırasında GIL'i bırakır)
+THUMBNAIL_ISCI_SAYISI = min(4, os.cpu_count() or 1)
 
 class ResimYonetimiBeyni:
     
@@ -17,15 +26,150 @@ class ResimYonetimiBeyni:
         # --- ÖNBELLEKLER ARTIK BURADA ---
         self._count_cache = {}
         self._size_cache = {}
+        self._mtime_cache = {}        # YENİ: alt ağaçtaki en yeni mtime
+        self._direct_count_cache = {} # YENİ: klasörün kendi (recursive olmayan) resim sayısı
         self.ana_klasor_yolu = None
-        self._thumb_cache = {} # PIL Thumbnail cache (PIL.Image nesneleri tutar)
+        # GÜNCELLENDİ: Bellek sınırlı LRU + disk katmanı; anahtar mtime/boyut içerir
+        self._thumb_cache = ThumbnailOnbellegi()
+        threading.Thread(target=self._thumb_cache.diski_buda, name="ThumbnailBudama", daemon=True).start()
+        self._thumb_havuzu = None # İlk toplu istekte oluşturulur
+
+        # YENİ: Seçimde doğrulanan dosyaların özetleri kopyalamada tekrar kullanılır
+        self.yukleyici = TopluYukleyici()
+
+        # YENİ: Önbellekler hem detay thread'lerinden hem izleyici thread'inden
+        # değiştirilir. '_nesil' her geçersiz kılmada artar; hesaplama sürerken
+        # geçersiz kılınan bir değer önbelleğe yazılmaz.
+        self._cache_lock = threading.RLock()
+        self._nesil = 0
+        self._izleyici = None
+        self._esitleme_thread = None
 
 
     def set_ana_klasor(self, path: str):
-        """Beynin ana klasörü bilmesini sağlar ve önbelleği temizler."""
+        """
+        Beynin ana klasörü bilmesini sağlar, önbelleği temizler, klasörü izlemeye
+        başlar ve içerik / benzerlik dizinlerini arka planda eşitler.
+        """
+        self.izlemeyi_durdur()
         self.ana_klasor_yolu = path
         self._clear_caches()
         logger.info(f"Beyin için ana klasör ayarlandı: {path}")
+        try:
+            self._izleyici = KlasorIzleyici(path, self._izleyici_olaylari)
+            self._izleyici.baslat()
+        except Exception as e:
+            self._izleyici = None
+            logger.warning(f"Klasör izleyici başlatılamadı, önbellekler yalnızca bu uygulamanın değişikliklerini görecek: {e}")
+        # YENİ: Banka ders ekranından geçmeden açıldıysa kopya dizinleri boş kalmasın
+        self._esitleme_thread = threading.Thread(
+            target=self._dizinleri_esitle, args=(path,), name="DizinEsitleme", daemon=True
+        )
+        self._esitleme_thread.start()
+
+    def izlemeyi_durdur(self):
+        """Klasör izleyiciyi durdurur (ana klasör değişirken / kapanışta)."""
+        if self._izleyici is not None:
+            self._izleyici.durdur()
+            self._izleyici = None
+        self._esitleme_thread = None
+
+    # --- Hedefli önbellek geçersiz kılma ---
+
+    def _izleyici_olaylari(self, olaylar):
+        """KlasorIzleyici thread'inden gelen '(olay, yol)' listesini işler."""
+        for olay, yol in olaylar:
+            if olay == "tasma":
+                logger.warning("Klasör izleyici olay kuyruğu taştı, tüm önbellekler temizleniyor.")
+                self._clear_caches()
+                try:
+                    katalog_al(self.ana_klasor_yolu).gecersiz_kil()
+                except Exception:
+                    pass
+                return
+            self.yolu_gecersiz_kil(yol)
+            self._icerik_dizinini_guncelle(olay, yol)
+        logger.debug(f"Klasör izleyici: {len(olaylar)} değişiklik önbelleklere işlendi.")
+
+    def _dizinleri_esitle(self, path):
+        """
+        Arka planda: ana klasörün içerik dizinini, ardından yakın kopya
+        kümelerini ('Benzer Sorular') katalogla eşitler.
+        """
+        try:
+            icerik_dizini_al(path).esitle()
+        except Exception as e:
+            logger.warning(f"İçerik dizini eşitlenemedi: {path} -> {e}")
+        try:
+            benzerlik_dizini_al(path).guncelle()
+        except Exception as e:
+            logger.warning(f"Benzerlik dizini güncellenemedi: {path} -> {e}")
+
+    def icerik_dizinini_esitle(self):
+        """
+        Kopya sorgusundan önce çağrılır (thread'de): dizin henüz eşitlenmediyse
+        eşitler, arka plandaki eşitleme sürüyorsa bitmesini bekler.
+        """
+        dizin = self.icerik_dizini()
+        if dizin is not None:
+            dizin.esitle()
+        return dizin
+
+    def icerik_dizini(self):
+        """Ana klasörün içerik özeti dizini (kopya tespiti); klasör seçilmediyse None."""
+        if not self.ana_klasor_yolu:
+            return None
+        return icerik_dizini_al(self.ana_klasor_yolu)
+
+    def benzerlik_dizini(self):
+        """Ana klasörün yakın kopya (algısal özet) dizini; klasör seçilmediyse None."""
+        if not self.ana_klasor_yolu:
+            return None
+        return benzerlik_dizini_al(self.ana_klasor_yolu)
+
+    def _icerik_dizinini_guncelle(self, olay, yol, ozet=None):
+        """Dosya değişikliğini içerik dizinine işler (hata UI akışını bozmaz)."""
+        dizin = self.icerik_dizini()
+        if dizin is None:
+            return
+        try:
+            if olay == "silindi":
+                dizin.sil(yol)
+            elif yol.lower().endswith(GORSEL_UZANTILARI):
+                dizin.ekle(yol, ozet) # Boyut/mtime değişmediyse tekrar özetlenmez
+        except Exception as e:
+            logger.warning(f"İçerik dizini güncellenemedi: {yol} -> {e}")
+
+    def yolu_gecersiz_kil(self, yol: str):
+        """
+        Bir dosya/klasör eklendiğinde, silindiğinde veya değiştiğinde YALNIZCA
+        etkilenen önbellek girdilerini siler:
+        - Sayım/boyut: yolun kendisi, altındaki klasörler (klasör silindiyse)
+          ve kök klasöre kadar tüm üst klasörler (toplamları değişti).
+        - Thumbnail: yolun kendisi ve (klasörse) altındaki dosyalar.
+        - Soru kataloğu: yolun kendisi ve içinde bulunduğu klasör.
+        """
+        hedef = os.path.normpath(os.path.abspath(yol))
+        alt_onek = hedef + os.sep
+
+        def _etkilenir(anahtar):
+            k = os.path.normpath(os.path.abspath(anahtar))
+            return k == hedef or hedef.startswith(k + os.sep) or k.startswith(alt_onek)
+
+        with self._cache_lock:
+            self._nesil += 1
+            for cache in self._stat_caches():
+                for anahtar in [a for a in cache if _etkilenir(a)]:
+                    del cache[anahtar]
+        self._thumb_cache.kaldir(hedef)
+
+        if self.ana_klasor_yolu:
+            try:
+                katalog = katalog_al(self.ana_klasor_yolu)
+                katalog.gecersiz_kil(hedef)
+                katalog.gecersiz_kil(os.path.dirname(hedef))
+            except Exception as e:
+                logger.debug(f"Katalog geçersiz kılınamadı: {hedef} -> {e}")
     
     def get_folder_level(self, folder_path):
         """Klasörün hangi seviyede olduğunu belirle"""
@@ -66,9 +210,11 @@ class ResimYonetimiBeyni:
             
     def _clear_caches(self):
         """Tüm istatistik önbelleklerini temizler."""
-        self._count_cache.clear()
-        self._size_cache.clear()
-        self._thumb_cache.clear()
+        with self._cache_lock:
+            self._nesil += 1
+            for cache in self._stat_caches():
+                cache.clear()
+            self._thumb_cache.temizle()
         logger.debug("Beyin önbellekleri (sayım, boyut) temizlendi.")
 
     def _find_folder_insensitive(self, parent_path, target_name):
@@ -139,21 +285,44 @@ class ResimYonetimiBeyni:
             'relative_path': self.get_relative_path(folder_path),
             'total_images': 0,
             'total_size': 0,
-            'last_modified': "Bilinmiyor"
+            'last_modified': "Bilinmiyor",
+            'benzer_sorular': []
         }
         try:
             # Bu fonksiyon 'count_images' kullanıyor (recursive değil)
             data['total_images'] = self.count_images(folder_path)
             data['total_size'] = self.get_folder_size_cached(folder_path)
             data['last_modified'] = self.get_last_modified(folder_path)
+            data['benzer_sorular'] = self.benzer_sorular(folder_path)
         except Exception as e:
             logger.error(f"Zorluk detay verisi alınamadı: {folder_path} -> {e}")
         return data
+
+    def benzer_sorular(self, folder_path):
+        """
+        YENİ: Klasördeki görsellerin bankadaki yakın kopyaları.
+        [(dosya_adi, [diğer kopyaların ana klasöre göreli yolları]), ...] döndürür.
+        Kümeler ders seçiminde veya 'set_ana_klasor'da başlatılan toplu işte
+        kurulur; dizine dokunur, görselleri okumaz.
+        """
+        dizin = self.benzerlik_dizini()
+        if dizin is None:
+            return []
+        sonuc = []
+        with os.scandir(folder_path) as girdiler:
+            for girdi in sorted(girdiler, key=lambda g: g.name):
+                if not girdi.name.lower().endswith(IMAGE_EXTS) or not girdi.is_file():
+                    continue
+                digerleri = dizin.kume(girdi.path)
+                if digerleri:
+                    sonuc.append((girdi.name, sorted(os.path.relpath(y, self.ana_klasor_yolu) for y in digerleri)))
+        return sonuc
     
     def get_ders_details_data(self, folder_path):
         """
         'show_ders_details' için gereken TÜM verileri toplar.
-        Bu, 'os.walk' kullandığı için ağırdır ve thread'de çalışmalıdır.
+        Ders alt ağacı tek geçişte taranır (konu sayıları da aynı geçişten
+        önbelleğe gelir); yine de I/O yaptığı için thread'de çalışmalıdır.
         """
         data = {
             'ders_adi': os.path.basename(folder_path),
@@ -165,10 +334,11 @@ class ResimYonetimiBeyni:
         }
         
         try:
-            # os.listdir (I/O)
-            konular_list = [d for d in os.listdir(folder_path)
-                            if os.path.isdir(os.path.join(folder_path, d))]
+            # os.scandir (I/O) - tür bilgisi girdiden gelir, ek 'isdir' yok
+            with os.scandir(folder_path) as girdiler:
+                konular_list = [g.name for g in girdiler if g.is_dir()]
             
+            # Tek geçiş: ders ve altındaki tüm klasörlerin istatistikleri
             data['total_images'] = self.count_all_images_recursive_cached(folder_path)
             data['total_size'] = self.get_folder_size_cached(folder_path)
             data['last_modified'] = self.get_last_modified(folder_path)
@@ -176,7 +346,7 @@ class ResimYonetimiBeyni:
             konular_data = []
             for konu in sorted(konular_list):
                 konu_path = os.path.join(folder_path, konu)
-                # os.walk (I/O)
+                # Önbellekten (ders taramasında hesaplandı)
                 konu_images = self.count_all_images_recursive_cached(konu_path)
                 konular_data.append({'ad': konu, 'resim_sayisi': konu_images})
                 
@@ -247,47 +417,147 @@ class ResimYonetimiBeyni:
         Bir resmin PIL.Image thumbnail'ını üretir ve cache'ler.
         CTK BİLMEZ. Sadece PIL bilir.
         """
-        if path in self._thumb_cache:
-            return self._thumb_cache[path]
-        
-        try:
-            img = Image.open(path)
-            # Kodunuzda LANCZOS kullanılıyor, onu koruyoruz
-            img.thumbnail(max_size, Image.LANCZOS) 
-            self._thumb_cache[path] = img
-            return img
-        except Exception as e:
-            logger.warning(f"PIL thumbnail üretilemedi: {path} -> {e}")
-            return None
+        # Bellek -> disk -> orijinal sırasıyla bakılır (LANCZOS korunuyor)
+        return self._thumb_cache.al(path, max_size)
+
+    def get_cached_pil_thumbnail(self, path: str, max_size: tuple = (180, 180)):
+        """Thumbnail bellekte hazırsa döndürür, yoksa None (hiç üretmez)."""
+        return self._thumb_cache.bellekte(path, max_size)
+
+    def thumbnaillari_uret(self, yollar, max_size, geri_cagirim, iptal_token=None):
+        """
+        Thumbnail'ları thread havuzunda, 'yollar' sırasıyla üretir.
+        Her biri bittiğinde 'geri_cagirim(path, pil_img)' İŞÇİ thread'inden
+        çağrılır (UI, 'after' ile kendi thread'ine aktarmalıdır). 'iptal_token'
+        set edilirse henüz başlamamış işler atlanır.
+        """
+        if self._thumb_havuzu is None:
+            self._thumb_havuzu = ThreadPoolExecutor(
+                max_workers=THUMBNAIL_ISCI_SAYISI, thread_name_prefix="Thumbnail")
+
+        def _is(path):
+            if iptal_token is not None and iptal_token.is_set():
+                return
+            geri_cagirim(path, self._thumb_cache.al(path, max_size))
+
+        for path in yollar:
+            self._thumb_havuzu.submit(_is, path)
 
     def kopyala_resim(self, src_path: str, hedef_yol: str):
         """Sadece kopyalama işini yapar."""
         # Not: Gelecekte (Aşama 3) bu fonksiyonu bir thread'de çalıştıracağız.
         shutil.copy2(src_path, hedef_yol) #'daki mantık
+        # İzleyici olayı gelmeden UI yenilenebilir; hedefli geçersiz kılmayı hemen yap
+        self.yolu_gecersiz_kil(hedef_yol)
+        self._icerik_dizinini_guncelle("eklendi", hedef_yol, self.yukleyici.ozet(src_path))
         logger.info(f"Kopyalandı: {src_path} -> {hedef_yol}")
 
+    def resimleri_toplu_kopyala(self, isler, hedef_klasor, olay_callback=None, iptal_token=None):
+        """
+        [(kaynak_yol, dosya_adi), ...] listesini 'hedef_klasor'e paralel ve
+        atomik kopyalar (bkz. 'TopluYukleyici.yukle'). (kopyalanan, hata) döndürür.
+        (Thread'de çalışmalıdır)
+        """
+        def _olay(olay):
+            if olay['durum'] == "kopyalandi":
+                # Özet seçimde hesaplandı; kopya dosya tekrar okunmaz
+                self._icerik_dizinini_guncelle("eklendi", olay['hedef'], self.yukleyici.ozet(olay['kaynak']))
+            if olay_callback:
+                olay_callback(olay)
+
+        try:
+            return self.yukleyici.yukle(isler, hedef_klasor, _olay, iptal_token)
+        finally:
+            # Tek seferde: hedef klasör ve üst klasörlerin istatistikleri
+            self.yolu_gecersiz_kil(hedef_klasor)
+            dizin = self.icerik_dizini()
+            if dizin is not None:
+                dizin.kaydet()
+
     def sil_resim(self, resim_yolu: str):
         """Sadece silme işini yapar."""
         os.remove(resim_yolu) #'deki mantık
+        self.yolu_gecersiz_kil(resim_yolu)
+        self._icerik_dizinini_guncelle("silindi", resim_yolu)
         logger.info(f"Silindi: {resim_yolu}")
         
     def remove_from_thumb_cache(self, path: str):
-        """Tek bir öğeyi thumbnail cache'ten kaldırır."""
-        return self._thumb_cache.pop(path, None)
+        """Tek bir öğeyi thumbnail cache'ten (bellek katmanı) kaldırır."""
+        self._thumb_cache.kaldir(path)
     
+    def _stat_caches(self):
+        return (self._count_cache, self._size_cache, self._mtime_cache, self._direct_count_cache)
+
+    # --- Tek geçişli klasör istatistikleri ---
+
+    def _alt_agaci_tara(self, folder_path, mtime, sonuc):
+        """
+        'folder_path' altını 'os.scandir' ile aşağıdan yukarıya BİR KEZ gezer.
+        Her klasör için (toplam resim, toplam bayt, en yeni mtime, kendi resim
+        sayısı) hesaplayıp 'sonuc'a yazar. 'DirEntry.stat' kullanıldığı için
+        dosya başına ayrı 'isfile'/'getsize' çağrısı yapılmaz.
+        """
+        toplam = boyut = dogrudan = 0
+        son_mtime = mtime
+        try:
+            with os.scandir(folder_path) as girdiler:
+                for girdi in girdiler:
+                    try:
+                        if girdi.is_dir(follow_symlinks=False):
+                            alt = self._alt_agaci_tara(
+                                girdi.path, girdi.stat(follow_symlinks=False).st_mtime, sonuc)
+                            toplam += alt[0]
+                            boyut += alt[1]
+                            son_mtime = max(son_mtime, alt[2])
+                            continue
+                        st = girdi.stat()
+                    except OSError:
+                        continue
+                    boyut += st.st_size
+                    son_mtime = max(son_mtime, st.st_mtime)
+                    if girdi.name.lower().endswith(IMAGE_EXTS):
+                        toplam += 1
+                        dogrudan += 1
+        except Exception as e:
+            logger.error(f"Klasör istatistiği hesaplama hatası: {folder_path} - {e}")
+        sonuc[folder_path] = (toplam, boyut, son_mtime, dogrudan)
+        return sonuc[folder_path]
+
+    def _klasor_istatistigi(self, folder_path):
+        """
+        (toplam resim, toplam bayt, en yeni mtime, kendi resim sayısı) döndürür.
+        Önbellekte yoksa alt ağaç tek geçişte taranır ve alt ağaçtaki TÜM
+        klasörlerin sonuçları önbelleklere yazılır (örn: ders taranınca
+        konu/tür/zorluk istatistikleri de hazır olur).
+        """
+        with self._cache_lock:
+            if folder_path in self._count_cache and folder_path in self._mtime_cache:
+                return (self._count_cache[folder_path], self._size_cache[folder_path],
+                        self._mtime_cache[folder_path], self._direct_count_cache[folder_path])
+            nesil = self._nesil
+
+        try:
+            mtime = os.stat(folder_path).st_mtime
+        except OSError:
+            return (0, 0, None, 0)
+
+        sonuc = {}
+        self._alt_agaci_tara(folder_path, mtime, sonuc)
+        with self._cache_lock:
+            # Tarama sırasında bir değişiklik geldiyse sonuçlar eskimiş olabilir
+            if nesil == self._nesil:
+                for yol, (toplam, boyut, son_mtime, dogrudan) in sonuc.items():
+                    self._count_cache[yol] = toplam
+                    self._size_cache[yol] = boyut
+                    self._mtime_cache[yol] = son_mtime
+                    self._direct_count_cache[yol] = dogrudan
+        return sonuc[folder_path]
+
     def count_all_images_recursive_cached(self, folder_path):
-        if folder_path in self._count_cache:
-            return self._count_cache[folder_path]
-        val = self.count_all_images_recursive(folder_path)
-        self._count_cache[folder_path] = val
-        return val
+        return self._klasor_istatistigi(folder_path)[0]
 
     def get_folder_size_cached(self, folder_path):
-        if folder_path in self._size_cache:
-            return self._size_cache[folder_path]
-        val = self.get_folder_size(folder_path)
-        self._size_cache[folder_path] = val
-        return val
+        return self._klasor_istatistigi(folder_path)[1]
 
     def _format_size(self, n):
         try:
@@ -301,54 +571,32 @@ class ResimYonetimiBeyni:
 
     def count_images(self, folder_path):
         """Bir klasördeki (sadece o klasör) resim sayısını döndür"""
-        if not os.path.exists(folder_path):
-            return 0
-        
-        count = 0
-        try:
-            for dosya in os.listdir(folder_path):
-                dosya_yolu = os.path.join(folder_path, dosya)
-                if os.path.isfile(dosya_yolu) and dosya.lower().endswith(IMAGE_EXTS):
-                    count += 1
-        except Exception as e:
-            logger.error(f"Resim sayma hatası: {folder_path} - {e}")
-        
-        return count
+        return self._klasor_istatistigi(folder_path)[3]
 
     def count_all_images_recursive(self, folder_path):
-        """Klasör ve TÜM alt klasörlerdeki resim sayısını döndür"""
-        if not os.path.exists(folder_path):
-            return 0
-        
-        total = 0
+        """Klasör ve TÜM alt klasörlerdeki resim sayısını döndür (önbelleksiz)"""
         try:
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    if file.lower().endswith(IMAGE_EXTS):
-                        total += 1
-        except Exception as e:
-            logger.error(f"Recursive resim sayma hatası: {folder_path} - {e}")
-        
-        return total
+            sonuc = {}
+            return self._alt_agaci_tara(folder_path, os.stat(folder_path).st_mtime, sonuc)[0]
+        except OSError:
+            return 0
 
     def get_folder_size(self, folder_path):
-        """Klasörün toplam boyutunu byte cinsinden döndür"""
-        total_size = 0
+        """Klasörün toplam boyutunu byte cinsinden döndür (önbelleksiz)"""
         try:
-            for root, dirs, files in os.walk(folder_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if os.path.exists(file_path):
-                        total_size += os.path.getsize(file_path)
-        except Exception as e:
-            logger.error(f"Klasör boyutu hesaplama hatası: {folder_path} - {e}")
-        
-        return total_size
+            sonuc = {}
+            return self._alt_agaci_tara(folder_path, os.stat(folder_path).st_mtime, sonuc)[1]
+        except OSError:
+            return 0
 
     def get_last_modified(self, folder_path):
-        """Klasörün son güncellenme tarihini formatlanmış döndür"""
+        """
+        Klasörün son güncellenme tarihini formatlanmış döndür.
+        GÜNCELLENDİ: Alt ağaçtaki en yeni değişiklik (klasörün kendi mtime'ı,
+        alt klasörüne resim eklenince değişmez).
+        """
         try:
-            timestamp = os.path.getmtime(folder_path)
+            timestamp = self._klasor_istatistigi(folder_path)[2]
             dt = datetime.fromtimestamp(timestamp)
             return dt.strftime("%d.%m.%Y %H:%M")
         except:
@@ -366,16 +614,8 @@ class ResimYonetimiBeyni:
             return folder_path
     
     def is_image_file(self, path: str) -> bool:
-        
-        try:
-            p = str(path).lower()
-            if not p.endswith(IMAGE_EXTS):
-                return False
-            with Image.open(path) as im:
-                im.verify()
-            return True
-        except Exception:
-            return False
+        # GÜNCELLENDİ: Tek okumada doğrula + özetle; sonuç kopyalamada tekrar kullanılır
+        return self.yukleyici.dogrula(path) is not None
     
     def _has_subfolders(self, folder_path: str) -> bool:
         """
@@ -0,0 +1,524 @@
+# logic/soru_katalogu.py
+
+import os
+import json
+import time
+import sqlite3
+import logging
+import threading
+from logic.uygulama_klasorleri import banka_onbellek_yolu
+from logic.answer_utils import test_cevabi_ayikla, resolve_answers
+
+"""
+Soru Otomasyon Sistemi - Soru Bankası Kataloğu
+
+Konu seçimi ('calculate_total_questions' / 'calculate_detailed_questions'),
+parametre formu ('get_available_questions'), soru seçimi ve 'Güncelle'
+aynı '<ders>/<konu>/<tip>/<zorluk>' klasörlerini her adımda ayrı ayrı
+'os.listdir' ile tarıyordu. Ağ paylaşımındaki 10 bin+ görsellik bir bankada
+bu her ekranda saniyeler demektir.
+
+Bu modül, soru bankası kökü başına TEK bir katalog tutar:
+- Her klasörün alt klasörleri ve görsel dosya adları bir kez 'os.scandir'
+  ile okunur ve klasörün mtime'ı ile birlikte saklanır.
+- Sonraki erişimlerde sadece 'os.stat' yapılır; klasörün mtime'ı
+  değişmediyse liste yeniden okunmaz (dosya ekleme/silme klasör mtime'ını
+  değiştirir). Aynı klasör 'DOGRULAMA_ARALIGI' içinde tekrar sorulursa
+  stat bile yapılmaz.
+- Kaba mtime çözünürlüklü dosya sistemlerinde (FAT, SMB) okunduğu anda
+  "taze" olan bir mtime'a güvenilmez; o klasör bir sonraki erişimde
+  yeniden okunur.
+
+Kalıcı Anlık Görüntü (Snapshot):
+- Katalog (klasörler, dosya adları, boyutları, mtime'ları ve cevaplar)
+  APPDATA altındaki 'onbellek/katalog' klasöründe, kökün yolundan türetilen
+  bir SQLite dosyasına yazılır ('kaydet()'). Dosya bankanın içinde
+  tutulmaz: kökte yazılan snapshot (ve '-journal'ı) kökün mtime'ını
+  değiştirip her açılışta kökün yeniden listelenmesine yol açıyordu.
+- Bir sonraki açılışta kayıtlar ilk erişimde toplu yüklenir ama "doğrulanmamış"
+  sayılır: her klasör ilk sorulduğunda tek 'os.stat' ile mtime'ı kontrol
+  edilir, değişmemişse hiç listelenmez. 50 bin görsellik bir banka yeniden
+  taranmadan açılır.
+- Yazılı klasörlerinde 'cevaplar.json' yerinde değiştirilebildiği için
+  (klasör mtime'ı değişmez) onun mtime'ı da ayrıca kontrol edilir.
+- Görsel boyutları zaten 'gorsel_olcer' tarafından (yine APPDATA altındaki)
+  boyut dizininde kalıcı tutulduğu için burada tekrarlanmaz.
+- Dosya yazılamazsa (salt okunur ağ klasörü) katalog sadece hafızada çalışır.
+
+Ana Sınıf:
+- SoruKatalogu:
+  (ders, konu, tip, zorluk) -> görsel listesi / sayısı; konu detayları;
+  'tara()' ile kökün tamamını tek geçişte okur, 'kaydet()' ile değişen
+  klasörleri anlık görüntüye yazar.
+
+Yardımcı:
+- katalog_al(kok_klasor): Kök klasör başına TEK katalog döndürür.
+- anlik_goruntu_yolu_al(kok_klasor): Kökün anlık görüntü dosyasının yolu.
+- ders_katalogu(ders_path): Ders klasör yolundan (katalog, ders) çıkarır.
+- konu_katalogu(konu_path): Konu klasör yolundan (katalog, ders, konu) çıkarır.
+- cevap_anahtari(gorsel_yollari): Seçilen görsellerin cevapları (dışa aktarım
+  ve önizleme için; dosya sistemine gitmez).
+"""
+
+logger = logging.getLogger(__name__)
+
+GORSEL_UZANTILARI = ('.png', '.jpg', '.jpeg', '.gif', '.bmp')
+SORU_TIPLERI = ('test', 'yazili')
+ZORLUKLAR = ('kolay', 'orta', 'zor')
+
+# Bu süre içinde doğrulanmış bir klasör için tekrar 'os.stat' yapılmaz (saniye)
+DOGRULAMA_ARALIGI = 1.0
+# mtime'ı okuma anına bundan yakın olan klasörler "kararsız" sayılır (saniye)
+KARARSIZ_MTIME_PAYI = 2.0
+
+ANLIK_GORUNTU_KLASORU = "katalog"
+ANLIK_GORUNTU_SURUMU = 1
+CEVAP_DOSYA_ADI = "cevaplar.json"
+
+
+class _KlasorKaydi:
+    """
+    Bir klasörün katalog kaydı.
+    'dosyalar': {ad: (boyut, mtime_ns)}, 'cevaplar': {ad: cevap},
+    'cevap_mtime_ns': yazılı klasöründeki 'cevaplar.json'un mtime'ı (yoksa None).
+    """
+    __slots__ = ("mtime_ns", "klasorler", "gorseller", "dosyalar", "cevaplar",
+                 "cevap_mtime_ns", "dogrulama", "kararli")
+
+    def __init__(self, mtime_ns, klasorler, gorseller, dosyalar, cevaplar, cevap_mtime_ns, dogrulama, kararli):
+        self.mtime_ns = mtime_ns
+        self.klasorler = klasorler
+        self.gorseller = gorseller
+        self.dosyalar = dosyalar
+        self.cevaplar = cevaplar
+        self.cevap_mtime_ns = cevap_mtime_ns
+        self.dogrulama = dogrulama
+        self.kararli = kararli
+
+
+def anlik_goruntu_yolu_al(kok_klasor):
+    """Kök başına anlık görüntü dosyası: APPDATA/.../onbellek/katalog/<yol özeti>.sqlite"""
+    return banka_onbellek_yolu(kok_klasor, ANLIK_GORUNTU_KLASORU, ".sqlite")
+
+
+def _yazili_klasoru_mu(yol):
+    """'answer_utils' ile aynı kural: yolda 'yazili' klasörü geçiyorsa."""
+    return "yazili" in os.path.normpath(yol).lower().split(os.sep)
+
+
+def _cevap_dosyasi_mtime(yol):
+    try:
+        return os.stat(os.path.join(yol, CEVAP_DOSYA_ADI)).st_mtime_ns
+    except OSError:
+        return None
+
+
+class SoruKatalogu:
+    """
+    Bir soru bankası kökünün klasör/görsel kataloğu (thread-safe).
+
+    Metodlar:
+    - dersler(self): Kökteki ders klasörleri (sıralı).
+    - konular(self, ders): Dersin konu klasörleri (sıralı).
+    - gorseller(self, ders, konu, soru_tipi, zorluk): Görsel dosya adları (sıralı).
+    - sayi(self, ders, konu, soru_tipi, zorluk): Görsel sayısı.
+    - konu_detayi(self, ders, konu): {'test': {'kolay': n, ...}, 'yazili': {...}}
+    - konu_toplami(self, ders, konu): Konudaki toplam görsel sayısı.
+    - klasor_gorselleri(self, klasor_yolu): Herhangi bir klasörün görselleri.
+    - klasor_dosyalari(self, klasor_yolu): {ad: (boyut, mtime_ns)} (stat yapmadan).
+    - gorsel_klasorleri(self): Tüm '<ders>/<konu>/<tip>/<zorluk>' klasör yolları.
+    - tara(self): Tüm kökü okur (arka planda ısıtmak için), toplam görsel sayısını döndürür.
+    - gecersiz_kil(self, yol=None): Bir klasörün (veya hepsinin) kaydını siler.
+    - cevap(self, gorsel_path): Katalogdaki cevap (bilinmiyorsa None).
+    - cevap_anahtari(self, gorsel_yollari, dogrula=False): Cevap listesi
+        (bilinmeyenler "?"); hafızadaki kayıtlar için dosya sistemine dokunmaz.
+    - cevapsiz_sayisi(self, ders, konu, soru_tipi, zorluk): Cevabı bilinmeyen görsel sayısı.
+    - kaydet(self): Değişen klasörleri kalıcı anlık görüntüye yazar.
+    - anlik_goruntu_baglantisi(self): Anlık görüntü dosyasına SQLite bağlantısı
+        (içerik ve benzerlik dizinleri de aynı dosyayı kullanır).
+    """
+
+    def __init__(self, kok_klasor):
+        self.kok = os.path.normpath(kok_klasor)
+        self.anlik_goruntu_yolu = anlik_goruntu_yolu_al(self.kok)
+        self._kayitlar = {}  # {normalize klasör yolu: _KlasorKaydi}
+        self._kilit = threading.Lock()
+        self._yukleme_kilidi = threading.Lock()
+        self._yuklendi = False
+        self._kirli = set()     # Anlık görüntüye yazılmamış (değişmiş) klasörler
+        self._silinen = set()   # Anlık görüntüden silinecek klasörler
+
+    # --- Klasör okuma ---
+
+    def _klasor(self, klasor_yolu):
+        """Klasörün güncel kaydı; klasör yoksa / okunamıyorsa None."""
+        if not self._yuklendi:
+            self._anlik_goruntuyu_yukle()
+
+        yol = os.path.normpath(os.path.abspath(klasor_yolu))
+        simdi = time.monotonic()
+        with self._kilit:
+            kayit = self._kayitlar.get(yol)
+        if kayit is not None and kayit.kararli and simdi - kayit.dogrulama < DOGRULAMA_ARALIGI:
+            return kayit
+
+        try:
+            mtime_ns = os.stat(yol).st_mtime_ns
+        except OSError:
+            with self._kilit:
+                if self._kayitlar.pop(yol, None) is not None:
+                    self._kirli.discard(yol)
+                    self._silinen.add(yol)
+            return None
+
+        yazili = _yazili_klasoru_mu(yol)
+        cevap_mtime_ns = _cevap_dosyasi_mtime(yol) if yazili else None
+
+        if (kayit is not None and kayit.kararli and kayit.mtime_ns == mtime_ns
+                and kayit.cevap_mtime_ns == cevap_mtime_ns):
+            kayit.dogrulama = simdi
+            return kayit
+
+        try:
+            kayit = self._oku(yol, mtime_ns, cevap_mtime_ns, yazili, simdi)
+        except OSError as e:
+            logger.warning(f"Klasör okunamadı: {yol} -> {e}")
+            return None
+        with self._kilit:
+            self._kayitlar[yol] = kayit
+            self._kirli.add(yol)
+            self._silinen.discard(yol)
+        return kayit
+
+    @staticmethod
+    def _oku(yol, mtime_ns, cevap_mtime_ns, yazili, simdi):
+        klasorler, dosyalar = [], {}
+        with os.scandir(yol) as girdiler:
+            for girdi in girdiler:
+                try:
+                    if girdi.is_dir():
+                        klasorler.append(girdi.name)
+                    elif girdi.name.lower().endswith(GORSEL_UZANTILARI):
+                        st = girdi.stat()
+                        dosyalar[girdi.name] = (st.st_size, st.st_mtime_ns)
+                except OSError:
+                    continue
+
+        cevaplar = {}
+        if yazili:
+            if cevap_mtime_ns is not None:
+                try:
+                    with open(os.path.join(yol, CEVAP_DOSYA_ADI), "r", encoding="utf-8") as f:
+                        json_cevaplar = json.load(f)
+                    cevaplar = {ad: str(json_cevaplar[ad]) for ad in dosyalar if ad in json_cevaplar}
+                except (OSError, ValueError, AttributeError, TypeError) as e:
+                    logger.warning(f"Cevap dosyası okunamadı: {os.path.join(yol, CEVAP_DOSYA_ADI)} -> {e}")
+        else:
+            for ad in dosyalar:
+                cevap = test_cevabi_ayikla(ad)
+                if cevap is not None:
+                    cevaplar[ad] = cevap
+
+        kararli = time.time() - mtime_ns / 1e9 > KARARSIZ_MTIME_PAYI
+        return _KlasorKaydi(
+            mtime_ns,
+            tuple(sorted(klasorler, key=str.lower)),
+            tuple(sorted(dosyalar)),
+            dosyalar,
+            cevaplar,
+            cevap_mtime_ns,
+            simdi,
+            kararli,
+        )
+
+    # --- Kalıcı anlık görüntü ---
+
+    def _goreli(self, yol):
+        """Kök içindeki klasör yolunu '/' ayraçlı göreli yola çevirir (kök dışıysa None)."""
+        try:
+            goreli = os.path.relpath(yol, self.kok)
+        except ValueError:
+            return None # Windows: farklı sürücü
+        if goreli.startswith(".."):
+            return None
+        return "" if goreli == "." else goreli.replace(os.sep, "/")
+
+    def _mutlak(self, goreli):
+        return os.path.normpath(os.path.join(self.kok, *goreli.split("/"))) if goreli else self.kok
+
+    def anlik_goruntu_baglantisi(self):
+        """Anlık görüntü dosyasına bağlantı (klasörü yoksa oluşturur)."""
+        try:
+            os.makedirs(os.path.dirname(self.anlik_goruntu_yolu), exist_ok=True)
+        except OSError:
+            pass  # 'connect' sqlite3.Error ile başarısız olur, çağıran onu yakalar
+        return sqlite3.connect(self.anlik_goruntu_yolu, timeout=5)
+
+    def _baglan(self):
+        baglanti = self.anlik_goruntu_baglantisi()
+        baglanti.execute("CREATE TABLE IF NOT EXISTS meta (anahtar TEXT PRIMARY KEY, deger TEXT)")
+        surum = baglanti.execute("SELECT deger FROM meta WHERE anahtar = 'surum'").fetchone()
+        if surum is None or surum[0] != str(ANLIK_GORUNTU_SURUMU):
+            baglanti.executescript("""
+                DROP TABLE IF EXISTS klasorler;
+                DROP TABLE IF EXISTS gorseller;
+                CREATE TABLE klasorler (
+                    yol TEXT PRIMARY KEY, mtime_ns INTEGER, alt_klasorler TEXT,
+                    cevap_mtime_ns INTEGER, kararli INTEGER
+                );
+                CREATE TABLE gorseller (
+                    klasor TEXT, ad TEXT, boyut INTEGER, mtime_ns INTEGER, cevap TEXT,
+                    PRIMARY KEY (klasor, ad)
+                ) WITHOUT ROWID;
+            """)
+            baglanti.execute(
+                "INSERT OR REPLACE INTO meta (anahtar, deger) VALUES ('surum', ?)",
+                (str(ANLIK_GORUNTU_SURUMU),)
+            )
+            baglanti.commit()
+        return baglanti
+
+    def _anlik_goruntuyu_yukle(self):
+        """Anlık görüntüyü (varsa) bir kez hafızaya alır; kayıtlar ilk erişimde doğrulanır."""
+        with self._yukleme_kilidi:
+            if self._yuklendi:
+                return
+            self._yuklendi = True
+            if not os.path.exists(self.anlik_goruntu_yolu):
+                return
+
+            baslangic = time.perf_counter()
+            try:
+                baglanti = self._baglan()
+                try:
+                    dosyalar, cevaplar = {}, {}
+                    for klasor, ad, boyut, mtime_ns, cevap in baglanti.execute(
+                            "SELECT klasor, ad, boyut, mtime_ns, cevap FROM gorseller"):
+                        dosyalar.setdefault(klasor, {})[ad] = (boyut, mtime_ns)
+                        if cevap is not None:
+                            cevaplar.setdefault(klasor, {})[ad] = cevap
+
+                    yuklenen = {}
+                    for goreli, mtime_ns, alt_klasorler, cevap_mtime_ns, kararli in baglanti.execute(
+                            "SELECT yol, mtime_ns, alt_klasorler, cevap_mtime_ns, kararli FROM klasorler"):
+                        klasor_dosyalari = dosyalar.get(goreli, {})
+                        yuklenen[self._mutlak(goreli)] = _KlasorKaydi(
+                            mtime_ns,
+                            tuple(json.loads(alt_klasorler)),
+                            tuple(sorted(klasor_dosyalari)),
+                            klasor_dosyalari,
+                            cevaplar.get(goreli, {}),
+                            cevap_mtime_ns,
+                            float("-inf"), # Doğrulanmamış: ilk erişimde stat yapılır
+                            bool(kararli),
+                        )
+                finally:
+                    baglanti.close()
+            except (sqlite3.Error, ValueError) as e:
+                logger.warning(f"Katalog anlık görüntüsü okunamadı, yok sayılıyor: {self.anlik_goruntu_yolu} -> {e}")
+                return
+
+            with self._kilit:
+                for yol, kayit in yuklenen.items():
+                    self._kayitlar.setdefault(yol, kayit)
+            logger.info(
+                f"Katalog anlık görüntüsü yüklendi: {len(yuklenen)} klasör, "
+                f"{sum(len(d) for d in dosyalar.values())} görsel, {(time.perf_counter() - baslangic) * 1000:.0f} ms"
+            )
+
+    def kaydet(self):
+        """Değişen/silinen klasörleri anlık görüntüye yazar (değişiklik yoksa hiçbir şey yapmaz)."""
+        with self._kilit:
+            kirli = {yol: self._kayitlar[yol] for yol in self._kirli if yol in self._kayitlar}
+            silinen = set(self._silinen)
+            self._kirli.clear()
+            self._silinen.clear()
+        if not kirli and not silinen:
+            return
+
+        try:
+            baglanti = self._baglan()
+            try:
+                with baglanti:
+                    for yol in silinen:
+                        goreli = self._goreli(yol)
+                        if goreli is None:
+                            continue
+                        baglanti.execute("DELETE FROM klasorler WHERE yol = ?", (goreli,))
+                        baglanti.execute("DELETE FROM gorseller WHERE klasor = ?", (goreli,))
+                    for yol, kayit in kirli.items():
+                        goreli = self._goreli(yol)
+                        if goreli is None:
+                            continue
+                        baglanti.execute(
+                            "INSERT OR REPLACE INTO klasorler (yol, mtime_ns, alt_klasorler, cevap_mtime_ns, kararli) "
+                            "VALUES (?, ?, ?, ?, ?)",
+                            (goreli, kayit.mtime_ns, json.dumps(list(kayit.klasorler), ensure_ascii=False),
+                             kayit.cevap_mtime_ns, int(kayit.kararli))
+                        )
+                        baglanti.execute("DELETE FROM gorseller WHERE klasor = ?", (goreli,))
+                        baglanti.executemany(
+                            "INSERT INTO gorseller (klasor, ad, boyut, mtime_ns, cevap) VALUES (?, ?, ?, ?, ?)",
+                            [(goreli, ad, boyut, mtime_ns, kayit.cevaplar.get(ad))
+                             for ad, (boyut, mtime_ns) in kayit.dosyalar.items()]
+                        )
+            finally:
+                baglanti.close()
+            logger.debug(f"Katalog anlık görüntüsü güncellendi: {len(kirli)} klasör yazıldı, {len(silinen)} silindi")
+        except sqlite3.Error as e:
+            # Salt okunur ağ klasörü vb. -> sadece hafızada devam et
+            logger.warning(f"Katalog anlık görüntüsü kaydedilemedi: {self.anlik_goruntu_yolu} -> {e}")
+
+    # --- Sorgular ---
+
+    def dersler(self):
+        kayit = self._klasor(self.kok)
+        return list(kayit.klasorler) if kayit else []
+
+    def konular(self, ders):
+        kayit = self._klasor(os.path.join(self.kok, ders))
+        return list(kayit.klasorler) if kayit else []
+
+    def klasor_gorselleri(self, klasor_yolu):
+        kayit = self._klasor(klasor_yolu)
+        return list(kayit.gorseller) if kayit else []
+
+    def klasor_dosyalari(self, klasor_yolu):
+        kayit = self._klasor(klasor_yolu)
+        return dict(kayit.dosyalar) if kayit else {}
+
+    def gorsel_klasorleri(self):
+        for ders in self.dersler():
+            for konu in self.konular(ders):
+                for soru_tipi in SORU_TIPLERI:
+                    for zorluk in ZORLUKLAR:
+                        yield os.path.join(self.kok, ders, konu, soru_tipi, zorluk)
+
+    def gorseller(self, ders, konu, soru_tipi, zorluk):
+        return self.klasor_gorselleri(
+            os.path.join(self.kok, ders, konu, soru_tipi.lower(), zorluk.lower())
+        )
+
+    def sayi(self, ders, konu, soru_tipi, zorluk):
+        kayit = self._klasor(os.path.join(self.kok, ders, konu, soru_tipi.lower(), zorluk.lower()))
+        return len(kayit.gorseller) if kayit else 0
+
+    def konu_detayi(self, ders, konu):
+        return {
+            soru_tipi: {zorluk: self.sayi(ders, konu, soru_tipi, zorluk) for zorluk in ZORLUKLAR}
+            for soru_tipi in SORU_TIPLERI
+        }
+
+    def konu_toplami(self, ders, konu):
+        return sum(sum(zorluklar.values()) for zorluklar in self.konu_detayi(ders, konu).values())
+
+    def cevap(self, gorsel_path):
+        klasor_yolu, ad = os.path.split(os.path.abspath(gorsel_path))
+        kayit = self._klasor(klasor_yolu)
+        return kayit.cevaplar.get(ad) if kayit else None
+
+    def _hafizadaki_kayit(self, klasor_yolu):
+        """Kayıt hafızadaysa doğrulamadan (stat yapmadan) döndürür, yoksa okur."""
+        if not self._yuklendi:
+            self._anlik_goruntuyu_yukle()
+        with self._kilit:
+            kayit = self._kayitlar.get(os.path.normpath(os.path.abspath(klasor_yolu)))
+        return kayit if kayit is not None else self._klasor(klasor_yolu)
+
+    def cevap_anahtari(self, gorsel_yollari, dogrula=False):
+        """
+        Görsellerin cevapları, aynı sırada (bilinmeyenler "?").
+        Cevaplar klasör okunurken ('1-A.png' adından / 'cevaplar.json'dan)
+        zaten çözülür ve soru seçimi klasörü (cevap dosyasının mtime'ı dahil)
+        doğruladığından, dışa aktarımda hafızadaki kayıtlar doğrudan kullanılır.
+        'dogrula=True' her klasörü yeniden doğrular. Katalogda olmayan
+        (okunamayan) klasörler için 'answer_utils.resolve_answers' kullanılır.
+        """
+        gorsel_yollari = list(gorsel_yollari)
+        cevaplar = [None] * len(gorsel_yollari)
+        kayitlar, eksikler = {}, []
+        for i, gorsel_path in enumerate(gorsel_yollari):
+            klasor_yolu, ad = os.path.split(os.path.normpath(os.path.abspath(gorsel_path)))
+            if klasor_yolu not in kayitlar:
+                kayitlar[klasor_yolu] = self._hafizadaki_kayit(klasor_yolu) if not dogrula else self._klasor(klasor_yolu)
+            kayit = kayitlar[klasor_yolu]
+            if kayit is None:
+                eksikler.append(i)
+            else:
+                cevaplar[i] = kayit.cevaplar.get(ad, "?")
+        if eksikler:
+            for i, cevap in zip(eksikler, resolve_answers(gorsel_yollari[i] for i in eksikler)):
+                cevaplar[i] = cevap
+        return cevaplar
+
+    def cevapsiz_sayisi(self, ders, konu, soru_tipi, zorluk):
+        kayit = self._klasor(os.path.join(self.kok, ders, konu, soru_tipi.lower(), zorluk.lower()))
+        if not kayit:
+            return 0
+        return sum(1 for ad in kayit.gorseller if ad not in kayit.cevaplar)
+
+    def tara(self):
+        baslangic = time.perf_counter()
+        toplam = 0
+        for ders in self.dersler():
+            for konu in self.konular(ders):
+                toplam += self.konu_toplami(ders, konu)
+        logger.info(f"Soru kataloğu tarandı: {self.kok} - {toplam} görsel, {time.perf_counter() - baslangic:.2f} sn")
+        self.kaydet()
+        return toplam
+
+    def gecersiz_kil(self, yol=None):
+        """Kaydı hafızadan siler; bir sonraki erişimde klasör yeniden okunur (anlık görüntü de güncellenir)."""
+        with self._kilit:
+            if yol is None:
+                self._kayitlar.clear()
+            else:
+                self._kayitlar.pop(os.path.normpath(os.path.abspath(yol)), None)
+
+
+_kataloglar = {}
+_kataloglar_kilit = threading.Lock()
+
+
+def katalog_al(kok_klasor):
+    """Aynı soru bankası için her ekrandan AYNI kataloğu döndürür."""
+    anahtar = os.path.normpath(os.path.abspath(kok_klasor))
+    with _kataloglar_kilit:
+        if anahtar not in _kataloglar:
+            _kataloglar[anahtar] = SoruKatalogu(anahtar)
+        return _kataloglar[anahtar]
+
+
+def ders_katalogu(ders_path):
+    """'<kök>/<ders>' yolundan (katalog, ders) döndürür."""
+    kok, ders = os.path.split(os.path.normpath(os.path.abspath(ders_path)))
+    return katalog_al(kok), ders
+
+
+def konu_katalogu(konu_path):
+    """'<kök>/<ders>/<konu>' yolundan (katalog, ders, konu) döndürür."""
+    konu_path = os.path.normpath(os.path.abspath(konu_path))
+    ders_path, konu = os.path.split(konu_path)
+    kok, ders = os.path.split(ders_path)
+    return katalog_al(kok), ders, konu
+
+
+def cevap_anahtari(gorsel_yollari):
+    """
+    '<kök>/<ders>/<konu>/<tip>/<zorluk>/<görsel>' yollarının cevapları, aynı
+    sırada (bilinmeyenler "?"). Yollar kök klasöre göre gruplanır; her grup
+    kendi kataloğundan çözülür.
+    """
+    gorsel_yollari = list(gorsel_yollari)
+    cevaplar = [None] * len(gorsel_yollari)
+    gruplar = {} # {kök: [sıra, ...]}
+    for i, gorsel_path in enumerate(gorsel_yollari):
+        kok = os.path.normpath(os.path.abspath(gorsel_path))
+        for _ in range(5):
+            kok = os.path.dirname(kok)
+        gruplar.setdefault(kok, []).append(i)
+    for kok, siralar in gruplar.items():
+        yanitlar = katalog_al(kok).cevap_anahtari(gorsel_yollari[i] for i in siralar)
+        for i, cevap in zip(siralar, yanitlar):
+            cevaplar[i] = cevap
+    return cevaplar
@@ -0,0 +1,148 @@
+# logic/soru_secici.py
+
+import os
+import random
+import logging
+from logic.soru_katalogu import konu_katalogu
+from logic.icerik_dizini import icerik_dizini_al
+from logic.benzerlik_dizini import benzerlik_dizini_al
+
+"""
+Soru Otomasyon Sistemi - Soru Seçici
+
+Konu -> soru sayısı dağılımına göre soru bankasından rastgele görsel seçer.
+UI'dan BAĞIMSIZDIR (tkinter/customtkinter import etmez); hem
+'OturumYoneticisi.secili_gorselleri_al' hem de komut satırı ('cli.py')
+aynı seçim mantığını kullanır.
+
+Klasör yapısı: <konu_path>/<soru_tipi>/<zorluk>/<görseller>
+
+Fonksiyonlar:
+- soru_klasoru(konu_path, soru_tipi, zorluk): Görsellerin bulunduğu klasör.
+- klasordeki_gorseller(klasor_yolu): Klasördeki geçerli görsel dosya adları
+  (paylaşılan 'SoruKatalogu' üzerinden; klasör değişmediyse yeniden listelenmez).
+- gorselleri_sec(...): Dağılıma göre seçip karıştırılmış TAM yol listesi döndürür.
+  İçerik dizininde aynı özete sahip (kopya) ya da benzerlik dizininde aynı
+  yakın kopya kümesindeki görsellerden yalnızca biri seçilir. Kopyalar
+  elendikten sonra bir konu istenen sayıya ulaşamazsa bu 'eksikler'e yazılır.
+"""
+
+logger = logging.getLogger(__name__)
+
+def soru_klasoru(konu_path, soru_tipi, zorluk):
+    return os.path.join(konu_path, soru_tipi.lower(), zorluk.lower())
+
+
+def klasordeki_gorseller(klasor_yolu):
+    """Klasördeki görsel dosya adları, sıralı (klasör yoksa boş liste)."""
+    konu_path = os.path.dirname(os.path.dirname(os.path.normpath(klasor_yolu)))
+    katalog, _, _ = konu_katalogu(konu_path)
+    return katalog.klasor_gorselleri(klasor_yolu)
+
+
+def _soru_kimlikleri(yol, dizin, benzerlik):
+    """Görselin "aynı soru" anahtarları: içerik özeti ve yakın kopya kümesi."""
+    kimlikler = set()
+    ozet = dizin.ozet(yol)
+    if ozet is not None:
+        kimlikler.add(('ozet', ozet))
+    kume_no = benzerlik.kume_no(yol)
+    if kume_no is not None:
+        kimlikler.add(('kume', kume_no))
+    return kimlikler
+
+
+def _kopyalari_ele(secilen, gorseller, klasor_yolu, dizin, benzerlik, secilen_kimlikler, rastgele):
+    """
+    'secilen' içinde, bu seçimde zaten alınmış bir soruyla AYNI içeriğe sahip
+    ya da aynı yakın kopya kümesinde olanları kalan görsellerden yenileriyle
+    değiştirir. Kopya yoksa 'secilen' aynen döner (aynı tohum, dizin öncesiyle
+    aynı seçimi verir).
+    """
+    sonuc, kopyalar = [], 0
+    for gorsel in secilen:
+        kimlikler = _soru_kimlikleri(os.path.join(klasor_yolu, gorsel), dizin, benzerlik)
+        if kimlikler & secilen_kimlikler:
+            kopyalar += 1
+            continue
+        secilen_kimlikler.update(kimlikler)
+        sonuc.append(gorsel)
+    if not kopyalar:
+        return sonuc
+
+    logger.info(f"{klasor_yolu}: {kopyalar} kopya soru elendi (aynı içerik / yakın kopya)")
+    secilenler = set(secilen)
+    yedekler = [g for g in gorseller if g not in secilenler]
+    rastgele.shuffle(yedekler)
+    for gorsel in yedekler:
+        if len(sonuc) == len(secilen):
+            break
+        kimlikler = _soru_kimlikleri(os.path.join(klasor_yolu, gorsel), dizin, benzerlik)
+        if kimlikler & secilen_kimlikler:
+            continue
+        secilen_kimlikler.update(kimlikler)
+        sonuc.append(gorsel)
+    return sonuc
+
+
+def gorselleri_sec(konu_dagilimi, secilen_konular, soru_tipi, zorluk, kullanilan_sorular=None, rastgele=None,
+                   eksikler=None):
+    """
+    Her konudan 'konu_dagilimi[konu]' kadar rastgele görsel seçer.
+
+    Args:
+        konu_dagilimi (dict): {konu_adi: soru_sayisi}
+        secilen_konular (dict): {konu_adi: konu_klasor_yolu}
+        soru_tipi (str): "test" / "yazili"
+        zorluk (str): "kolay" / "orta" / "zor"
+        kullanilan_sorular (dict, opsiyonel): {konu_adi: set(dosya_adi)}.
+            Verilirse seçilen dosya adları buraya eklenir.
+        rastgele (random.Random, opsiyonel): Tekrarlanabilir seçim için
+            tohumlanmış üreteç. Verilmezse 'random' modülü kullanılır.
+        eksikler (dict, opsiyonel): {konu_adi: (istenen, secilen)}. Verilirse
+            istenen sayıya ulaşamayan konular (klasör yok, soru yetmedi veya
+            kopyalar elendikten sonra yerlerine soru kalmadı) buraya yazılır.
+
+    Returns:
+        list: Karıştırılmış TAM görsel yolları.
+    """
+    rastgele = rastgele or random
+    tum_gorseller = []
+    secilen_kimlikler = set() # Konular arası kopyaları da yakalamak için tek küme
+
+    for konu_adi, sayi in konu_dagilimi.items():
+        konu_path = secilen_konular[konu_adi]
+        klasor_yolu = soru_klasoru(konu_path, soru_tipi, zorluk)
+
+        if not os.path.exists(klasor_yolu):
+            logger.warning(f"{konu_adi}: Soru klasörü bulunamadı: {klasor_yolu}")
+            if eksikler is not None and sayi > 0:
+                eksikler[konu_adi] = (sayi, 0)
+            continue
+
+        # Sıralı liste: aynı tohum her işletim sisteminde aynı seçimi versin
+        gorseller = sorted(klasordeki_gorseller(klasor_yolu))
+
+        if len(gorseller) >= sayi:
+            secilen = rastgele.sample(gorseller, sayi)
+        else:
+            secilen = gorseller
+
+        katalog, _, _ = konu_katalogu(konu_path)
+        secilen = _kopyalari_ele(secilen, gorseller, klasor_yolu, icerik_dizini_al(katalog.kok),
+                                 benzerlik_dizini_al(katalog.kok), secilen_kimlikler, rastgele)
+
+        for gorsel in secilen:
+            if kullanilan_sorular is not None:
+                kullanilan_sorular.setdefault(konu_adi, set()).add(gorsel)
+            tum_gorseller.append(os.path.join(klasor_yolu, gorsel))
+
+        logger.debug(f"{konu_adi}: {len(secilen)} görsel seçildi")
+        if len(secilen) < sayi:
+            logger.warning(f"{konu_adi}: {sayi} soru istendi, {len(secilen)} seçilebildi (kopyalar elendi / soru yetersiz)")
+            if eksikler is not None:
+                eksikler[konu_adi] = (sayi, len(secilen))
+
+    rastgele.shuffle(tum_gorseller)
+    logger.info(f"Toplam {len(tum_gorseller)} görsel seçildi ve karıştırıldı")
+    return tum_gorseller
@@ -0,0 +1,249 @@
+# logic/thumbnail_onbellegi.py
+
+import os
+import hashlib
+import logging
+import threading
+from collections import OrderedDict
+from PIL import Image, features
+from logic.uygulama_klasorleri import onbellek_klasoru
+
+"""
+Soru Otomasyon Sistemi - Thumbnail Önbelleği
+
+'ResimYonetimiBeyni.get_pil_thumbnail' thumbnail'ları sınırsız bir dict'te,
+yalnızca yola göre tutuyordu: büyük bir klasörde gezinmek belleği sürekli
+büyütüyor, yerinde düzenlenen bir resmin eski thumbnail'ı gösteriliyordu.
+
+İki katmanlı önbellek:
+- Bellek: Toplam piksel baytıyla sınırlı LRU ('OnizlemeOnbellegi' ile aynı
+  yaklaşım). Sınır aşılınca en eski thumbnail'lar atılır.
+- Disk: APPDATA altında WebP (Pillow WebP desteklemiyorsa JPEG) dosyaları.
+  Uygulama yeniden açıldığında orijinal resim tekrar çözülmez.
+
+Anahtar (mutlak yol, mtime_ns, dosya boyutu, max_size) olduğundan dosya
+değiştiğinde eski thumbnail hiçbir katmandan dönmez. Disk katmanı
+'DISK_MAX_BAYT'ı aşarsa en uzun süredir kullanılmayan dosyalar silinir.
+
+Ana Sınıf:
+- ThumbnailOnbellegi:
+  'al(path, max_size)' ile thumbnail'ı (PIL.Image) döndürür, yoksa üretir.
+  'kaldir(path)' / 'temizle()' ile bellek katmanını boşaltır.
+
+Yardımcı:
+- varsayilan_thumbnail_klasoru(): Disk katmanının klasörü.
+"""
+
+logger = logging.getLogger(__name__)
+
+THUMBNAIL_BELLEK_BAYT = 64 * 1024 * 1024
+DISK_MAX_BAYT = 256 * 1024 * 1024
+THUMBNAIL_KALITESI = 85
+
+try:
+    WEBP_AVAILABLE = features.check("webp")
+except Exception:
+    WEBP_AVAILABLE = False
+
+_DISK_UZANTISI = ".webp" if WEBP_AVAILABLE else ".jpg"
+
+
+def varsayilan_thumbnail_klasoru():
+    """APPDATA altında (yoksa proje klasöründe) thumbnail klasörü."""
+    return onbellek_klasoru("thumbnails")
+
+
+def _gosterim_moduna_al(img):
+    """Thumbnail'ı RGB/RGBA'ya çevirir (disk formatı ve Tk için ortak mod)."""
+    if img.mode in ("RGB", "RGBA"):
+        return img
+    if img.mode in ("LA", "PA") or (img.mode == "P" and "transparency" in img.info):
+        return img.convert("RGBA")
+    return img.convert("RGB")
+
+
+class ThumbnailOnbellegi:
+    """
+    Bellek + disk katmanlı thumbnail önbelleği (thread-safe).
+
+    Metodlar:
+    - al(self, path, max_size): Thumbnail'ı döndürür; üretilemezse None.
+    - bellekte(self, path, max_size): Yalnızca bellek katmanına bakar (hiç
+        çözme/disk okuması yapmaz; UI thread'inden güvenle çağrılabilir).
+    - kaldir(self, path): Yolun (klasörse altındaki dosyaların) bellek
+        kayıtlarını atar.
+    - temizle(self): Bellek katmanını boşaltır (disk katmanı kalır).
+    - diski_buda(self): Disk katmanını 'disk_max_bayt' altına indirir.
+    """
+
+    def __init__(self, max_bayt=THUMBNAIL_BELLEK_BAYT, disk_klasoru=None, disk_max_bayt=DISK_MAX_BAYT):
+        self.max_bayt = max_bayt
+        self.disk_klasoru = disk_klasoru or varsayilan_thumbnail_klasoru()
+        self.disk_max_bayt = disk_max_bayt
+        self._kayitlar = OrderedDict() # {anahtar: PIL.Image}
+        self._toplam_bayt = 0
+        self._kilit = threading.Lock()
+
+    @staticmethod
+    def _kayit_boyutu(img):
+        w, h = img.size
+        return w * h * len(img.getbands())
+
+    @staticmethod
+    def _anahtar(path, max_size):
+        st = os.stat(path)
+        return (os.path.normpath(os.path.abspath(path)), st.st_mtime_ns, st.st_size, tuple(max_size))
+
+    def _disk_yolu(self, anahtar):
+        ozet = hashlib.blake2b(repr(anahtar).encode("utf-8"), digest_size=16).hexdigest()
+        return os.path.join(self.disk_klasoru, ozet[:2], ozet + _DISK_UZANTISI)
+
+    def bellekte(self, path, max_size):
+        try:
+            anahtar = self._anahtar(path, max_size)
+        except OSError:
+            return None
+        with self._kilit:
+            img = self._kayitlar.get(anahtar)
+            if img is not None:
+                self._kayitlar.move_to_end(anahtar)
+            return img
+
+    def al(self, path, max_size):
+        try:
+            anahtar = self._anahtar(path, max_size)
+        except OSError as e:
+            logger.warning(f"PIL thumbnail üretilemedi: {path} -> {e}")
+            return None
+
+        # 1. Bellek
+        with self._kilit:
+            img = self._kayitlar.get(anahtar)
+            if img is not None:
+                self._kayitlar.move_to_end(anahtar)
+                return img
+
+        # 2. Disk
+        disk_yolu = self._disk_yolu(anahtar)
+        img = self._diskten_oku(disk_yolu)
+
+        # 3. Orijinalden üret
+        if img is None:
+            try:
+                with Image.open(path) as kaynak:
+                    if kaynak.format == "JPEG":
+                        # DCT seviyesinde küçük çöz; LANCZOS için hedefin 2 katı payı bırak
+                        kaynak.draft("RGB", (max_size[0] * 2, max_size[1] * 2))
+                    kaynak.thumbnail(max_size, Image.LANCZOS)
+                    img = _gosterim_moduna_al(kaynak)
+                    if img is kaynak:
+                        img = kaynak.copy()
+            except Exception as e:
+                logger.warning(f"PIL thumbnail üretilemedi: {path} -> {e}")
+                return None
+            self._diske_yaz(img, disk_yolu)
+
+        self._koy(anahtar, img)
+        return img
+
+    def _koy(self, anahtar, img):
+        with self._kilit:
+            eski = self._kayitlar.pop(anahtar, None)
+            if eski is not None:
+                self._toplam_bayt -= self._kayit_boyutu(eski)
+            self._kayitlar[anahtar] = img
+            self._toplam_bayt += self._kayit_boyutu(img)
+            # En son eklenen kayıt her zaman kalır
+            while self._toplam_bayt > self.max_bayt and len(self._kayitlar) > 1:
+                _, atilan = self._kayitlar.popitem(last=False)
+                self._toplam_bayt -= self._kayit_boyutu(atilan)
+
+    def _diskten_oku(self, disk_yolu):
+        try:
+            with Image.open(disk_yolu) as img:
+                img.load()
+                sonuc = img.copy()
+        except FileNotFoundError:
+            return None
+        except Exception as e:
+            logger.debug(f"Disk thumbnail'ı okunamadı, yeniden üretilecek: {disk_yolu} -> {e}")
+            return None
+        try:
+            os.utime(disk_yolu) # Budamada "son kullanım" olarak mtime kullanılır
+        except OSError:
+            pass
+        return sonuc
+
+    def _diske_yaz(self, img, disk_yolu):
+        gecici_yol = f"{disk_yolu}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            os.makedirs(os.path.dirname(disk_yolu), exist_ok=True)
+            if WEBP_AVAILABLE:
+                img.save(gecici_yol, "WEBP", quality=THUMBNAIL_KALITESI)
+            else:
+                if img.mode == "RGBA":
+                    zemin = Image.new("RGB", img.size, "white")
+                    zemin.paste(img, mask=img.getchannel("A"))
+                    img = zemin
+                img.save(gecici_yol, "JPEG", quality=THUMBNAIL_KALITESI)
+            os.replace(gecici_yol, disk_yolu)
+        except Exception as e:
+            logger.debug(f"Thumbnail diske yazılamadı: {disk_yolu} -> {e}")
+        finally:
+            if os.path.exists(gecici_yol):
+                try:
+                    os.remove(gecici_yol)
+                except OSError:
+                    pass
+
+    def kaldir(self, path):
+        hedef = os.path.normpath(os.path.abspath(path))
+        alt_onek = hedef + os.sep
+        with self._kilit:
+            for anahtar in [a for a in self._kayitlar if a[0] == hedef or a[0].startswith(alt_onek)]:
+                self._toplam_bayt -= self._kayit_boyutu(self._kayitlar.pop(anahtar))
+
+    def temizle(self):
+        with self._kilit:
+            self._kayitlar.clear()
+            self._toplam_bayt = 0
+
+    def diski_buda(self):
+        """Disk katmanı sınırı aştıysa en eski (mtime) dosyaları siler."""
+        dosyalar = []
+        toplam = 0
+        try:
+            with os.scandir(self.disk_klasoru) as alt_klasorler:
+                for alt in alt_klasorler:
+                    if not alt.is_dir():
+                        continue
+                    with os.scandir(alt.path) as girdiler:
+                        for girdi in girdiler:
+                            try:
+                                st = girdi.stat()
+                            except OSError:
+                                continue
+                            dosyalar.append((st.st_mtime, st.st_size, girdi.path))
+                            toplam += st.st_size
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Thumbnail klasörü taranamadı: {e}")
+            return
+
+        if toplam <= self.disk_max_bayt:
+            return
+        silinen = 0
+        for _, boyut, yol in sorted(dosyalar):
+            if toplam <= self.disk_max_bayt * 0.8:
+                break
+            try:
+                os.remove(yol)
+                toplam -= boyut
+                silinen += 1
+            except OSError:
+                continue
+        logger.info(f"Thumbnail disk önbelleği budandı: {silinen} dosya silindi.")
+
+    def __len__(self):
+        return len(self._kayitlar)
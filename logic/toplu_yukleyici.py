@@ -0,0 +1,201 @@
+# logic/toplu_yukleyici.py
+
+import io
+import os
+import shutil
+import hashlib
+import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from PIL import Image
+from logic.gorsel_uzantilari import IMAGE_EXTS
+
+"""
+Soru Otomasyon Sistemi - Toplu Resim Yükleyici
+
+Resim Yönetimi'nde seçilen dosyalar önce 'resim_yukle'de doğrulanıyor,
+ardından '_commit_images_async' her dosyayı TEKRAR 'Image.open().verify()'
+ile okuyup tek tek 'shutil.copy2' ile kopyalıyordu. USB bellekten 1000
+dosyada bu, her dosyanın iki-üç kez okunması ve yarım kalmış kopyalar
+demekti.
+
+Bu modül:
+- Doğrulamayı TEK okumada yapar: dosya bir kez belleğe okunur, aynı
+  baytlardan hem BLAKE2b özeti çıkarılır hem PIL 'verify' çalıştırılır.
+  Sonuç (yol, mtime_ns, boyut) anahtarıyla önbelleklenir.
+- Kopyalamayı sınırlı sayıda işçiyle paralel yapar. Her dosya hedef
+  klasörde gizli bir geçici dosyaya yazılır, 'fsync' edilir ve
+  'os.replace' ile atomik olarak yerine konur; yarım dosya asla görsel
+  adıyla görünmez. Seçimden sonra hedefte aynı adla bir dosya belirdiyse
+  (başka bir kullanıcı / pencere) üzerine yazılmaz, 'cakisma' bildirilir.
+- Kopyalama sırasında özet tekrar hesaplanır ve seçimdeki özetle
+  karşılaştırılır (kaynak arada değiştiyse/bozuk okunduysa hata).
+- Her dosya için ilerleme olayı üretir.
+
+Ana Sınıf:
+- TopluYukleyici:
+  'dogrula_toplu(yollar)' ile seçimi doğrular ({yol: özet veya None}).
+  'yukle(isler, hedef_klasor, olay_callback, iptal_token)' ile kopyalar.
+"""
+
+logger = logging.getLogger(__name__)
+
+KOPYALAMA_ISCI_SAYISI = 4
+PARCA_BOYUTU = 1024 * 1024
+
+
+def _dosya_anahtari(path):
+    st = os.stat(path)
+    return (os.path.normpath(os.path.abspath(path)), st.st_mtime_ns, st.st_size)
+
+
+class TopluYukleyici:
+    """
+    Doğrulama önbellekli, paralel ve atomik toplu kopyalama.
+
+    Metodlar:
+    - dogrula(self, path): Geçerli görselse BLAKE2b özetini (hex), değilse None döndürür.
+    - dogrula_toplu(self, yollar): Yolları işçi havuzunda doğrular.
+    - ozet(self, path): Dosya değişmediyse önbellekteki özeti, yoksa None.
+    - yukle(self, isler, hedef_klasor, olay_callback=None, iptal_token=None):
+        [(kaynak_yol, dosya_adi), ...] listesini kopyalar,
+        (kopyalanan, hata_sayisi) döndürür. 'olay_callback(olay)' ÇAĞIRAN
+        thread'inden her dosya bitince çağrılır; 'olay' bir dict'tir:
+        {'durum': 'kopyalandi'/'atlandi'/'cakisma'/'hata', 'kaynak', 'hedef',
+         'tamamlanan', 'toplam', 'hata'}. 'cakisma' ve 'hata' hata sayısına girer.
+    """
+
+    def __init__(self, max_workers=KOPYALAMA_ISCI_SAYISI):
+        self.max_workers = max_workers
+        self._dogrulamalar = {} # {(yol, mtime_ns, boyut): özet veya None}
+        self._kilit = threading.Lock()
+
+    # --- Doğrulama ---
+
+    def dogrula(self, path):
+        if not str(path).lower().endswith(IMAGE_EXTS):
+            return None
+        try:
+            anahtar = _dosya_anahtari(path)
+        except OSError:
+            return None
+        with self._kilit:
+            if anahtar in self._dogrulamalar:
+                return self._dogrulamalar[anahtar]
+
+        ozet = None
+        try:
+            with open(path, "rb") as f:
+                veri = f.read()
+            with Image.open(io.BytesIO(veri)) as im:
+                im.verify()
+            ozet = hashlib.blake2b(veri, digest_size=16).hexdigest()
+        except Exception as e:
+            logger.debug(f"Görsel doğrulanamadı: {path} -> {e}")
+
+        with self._kilit:
+            self._dogrulamalar[anahtar] = ozet
+        return ozet
+
+    def dogrula_toplu(self, yollar):
+        yollar = list(yollar)
+        if len(yollar) <= 1:
+            return {yol: self.dogrula(yol) for yol in yollar}
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(yollar)),
+                                thread_name_prefix="Dogrulama") as havuz:
+            return dict(zip(yollar, havuz.map(self.dogrula, yollar)))
+
+    def ozet(self, path):
+        try:
+            anahtar = _dosya_anahtari(path)
+        except OSError:
+            return None
+        with self._kilit:
+            return self._dogrulamalar.get(anahtar)
+
+    # --- Kopyalama ---
+
+    def _kopyala(self, kaynak, hedef_yol):
+        """
+        Tek dosya: geçici dosyaya yaz + özet kontrolü + atomik 'os.replace'.
+        Hedef bu arada oluştuysa üzerine yazmaz, "cakisma" döndürür.
+        """
+        beklenen = self.ozet(kaynak)
+        if beklenen is None:
+            # Seçimden sonra değişmiş (veya hiç doğrulanmamış): yeniden doğrula
+            beklenen = self.dogrula(kaynak)
+            if beklenen is None:
+                return "atlandi"
+
+        klasor, ad = os.path.split(hedef_yol)
+        gecici_yol = os.path.join(klasor, f".{ad}.{os.getpid()}.{threading.get_ident()}.tmp")
+        ozet = hashlib.blake2b(digest_size=16)
+        try:
+            with open(kaynak, "rb") as src, open(gecici_yol, "wb") as dst:
+                for parca in iter(lambda: src.read(PARCA_BOYUTU), b""):
+                    ozet.update(parca)
+                    dst.write(parca)
+                dst.flush()
+                os.fsync(dst.fileno())
+            if ozet.hexdigest() != beklenen:
+                raise IOError("Kaynak dosya seçimden sonra değişti veya hatalı okundu")
+            shutil.copystat(kaynak, gecici_yol) # 'copy2' gibi zaman damgalarını koru
+            # Ad seçimde kontrol edildi; kopyalama sürerken aynı adla dosya geldiyse
+            # 'os.replace' onu sessizce ezerdi
+            if os.path.lexists(hedef_yol):
+                logger.warning(f"Hedefte aynı adla dosya var, üzerine yazılmadı: {hedef_yol}")
+                return "cakisma"
+            os.replace(gecici_yol, hedef_yol)
+        finally:
+            if os.path.exists(gecici_yol):
+                try:
+                    os.remove(gecici_yol)
+                except OSError:
+                    pass
+        return "kopyalandi"
+
+    def yukle(self, isler, hedef_klasor, olay_callback=None, iptal_token=None):
+        isler = list(isler)
+        toplam = len(isler)
+        kopyalanan = hatalar = tamamlanan = 0
+        if not toplam:
+            return 0, 0
+
+        def _is(kaynak, hedef_yol):
+            if iptal_token is not None and iptal_token.is_set():
+                return "iptal"
+            return self._kopyala(kaynak, hedef_yol)
+
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, toplam),
+                                thread_name_prefix="Kopyalama") as havuz:
+            gorevler = {}
+            for kaynak, dosya_adi in isler:
+                hedef_yol = os.path.join(hedef_klasor, dosya_adi)
+                gorevler[havuz.submit(_is, kaynak, hedef_yol)] = (kaynak, hedef_yol)
+
+            for gorev in as_completed(gorevler):
+                kaynak, hedef_yol = gorevler[gorev]
+                olay = {'kaynak': kaynak, 'hedef': hedef_yol, 'hata': None}
+                try:
+                    durum = gorev.result()
+                except Exception as e:
+                    logger.error(f"Kopyalama hatası: {kaynak} -> {e}")
+                    durum = "hata"
+                    olay['hata'] = str(e)
+                if durum == "iptal":
+                    continue
+                if durum == "kopyalandi":
+                    kopyalanan += 1
+                    logger.debug(f"Kopyalandı: {kaynak} -> {hedef_yol}")
+                elif durum == "cakisma":
+                    hatalar += 1
+                    olay['hata'] = "Hedefte aynı adla dosya var"
+                elif durum == "hata":
+                    hatalar += 1
+                tamamlanan += 1
+                olay.update(durum=durum, tamamlanan=tamamlanan, toplam=toplam)
+                if olay_callback:
+                    olay_callback(olay)
+
+        logger.info(f"Toplu yükleme bitti: {kopyalanan}/{toplam} kopyalandı, {hatalar} hata -> {hedef_klasor}")
+        return kopyalanan, hatalar
@@ -0,0 +1,37 @@
+# logic/uygulama_klasorleri.py
+
+import os
+import hashlib
+
+"""
+Soru Otomasyon Sistemi - Uygulama Klasörleri
+
+Uygulamanın kendi yazdığı önbellek / dizin dosyaları APPDATA altında
+(APPDATA yoksa proje klasöründe) tutulur; soru bankasının içine hiçbir şey
+yazılmaz. Bankanın içine yazılan bir dosya kök klasörün mtime'ını
+değiştirir ve katalog kökü her açılışta yeniden listeler.
+
+Bu modül import zincirinin en altındadır (başka 'logic' modülü import
+etmez); görsel hazırlayıcı, thumbnail önbelleği, soru kataloğu ve görsel
+boyut servisi birbirini import etmeden aynı yolları kullanır.
+
+Yardımcı:
+- onbellek_klasoru(alt_klasor): 'SoruOtomasyonSistemi/onbellek/<alt_klasor>' yolu.
+- banka_onbellek_yolu(kok_klasor, alt_klasor, uzanti): Soru bankası başına
+  dosya; adı kökün normalize yolunun özetidir.
+"""
+
+
+def onbellek_klasoru(alt_klasor):
+    """APPDATA altında (yoksa proje klasöründe) 'onbellek/<alt_klasor>' yolu."""
+    app_data_path = os.getenv('APPDATA')
+    if not app_data_path:
+        app_data_path = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    return os.path.join(app_data_path, "SoruOtomasyonSistemi", "onbellek", alt_klasor)
+
+
+def banka_onbellek_yolu(kok_klasor, alt_klasor, uzanti):
+    """Kök başına önbellek dosyası: APPDATA/.../onbellek/<alt_klasor>/<yol özeti><uzanti>"""
+    anahtar = os.path.normcase(os.path.normpath(os.path.abspath(kok_klasor)))
+    ozet = hashlib.blake2b(anahtar.encode("utf-8"), digest_size=16).hexdigest()
+    return os.path.join(onbellek_klasoru(alt_klasor), ozet + uzanti)
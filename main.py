@@ -1,16 +1,27 @@
-from logger_config import setup_logging 
-import logging                       
-from ui.main_ui import AnaPencere
+import logging
+import multiprocessing
 
-setup_logging() 
-logger = logging.getLogger(__name__) 
+logger = logging.getLogger(__name__)
 
+# DİKKAT: UI importu ve log kurulumu '__main__' bloğunda. Windows'ta (spawn,
+# PyInstaller .exe) PDF görsel hazırlığının her process'i bu dosyayı
+# '__mp_main__' olarak yeniden çalıştırır; modül seviyesinde kalırlarsa her
+# işçi customtkinter'ı ve tüm arayüzü yükler, aynı log dosyalarına kendi
+# döner (rotating) handler'larını açar.
 if __name__ == "__main__":
+    # PDF görsel hazırlığı process havuzu kullanıyor (PyInstaller .exe için gerekli)
+    multiprocessing.freeze_support()
+
+    from logger_config import setup_logging
+    from ui.main_ui import AnaPencere
+
+    setup_logging()
+
     logger.info("========================================")
-    logger.info("Soru Otomasyon Sistemi Uygulaması Başlatılıyor...") 
+    logger.info("Soru Otomasyon Sistemi Uygulaması Başlatılıyor...")
     logger.info("========================================")
-    
+
     app = AnaPencere()
     app.mainloop()
-    
-    logger.info("Uygulama Kapatıldı.") # <--- EKLENDİ
\ No newline at end of file
+
+    logger.info("Uygulama Kapatıldı.") # <--- EKLENDİ
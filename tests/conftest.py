@@ -0,0 +1,75 @@
+# tests/conftest.py
+
+import os
+import sys
+import pytest
+from PIL import Image, ImageDraw, ImageFont
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+@pytest.fixture(autouse=True)
+def gecici_appdata(tmp_path, monkeypatch):
+    """Önbellekler (thumbnail, görsel hazırlayıcı, log) proje klasörüne değil geçici klasöre yazılsın."""
+    monkeypatch.setenv("APPDATA", str(tmp_path / "appdata"))
+
+
+def soru_gorseli(yol, tohum, boyut=(600, 240)):
+    """Beyaz zeminde tohuma göre farklı siyah bloklardan oluşan sahte soru görseli."""
+    import random
+    rastgele = random.Random(tohum)
+    img = Image.new("RGB", boyut, "white")
+    cizim = ImageDraw.Draw(img)
+    for _ in range(30):
+        x, y = rastgele.randrange(boyut[0] - 60), rastgele.randrange(boyut[1] - 15)
+        cizim.rectangle([x, y, x + rastgele.randrange(5, 60), y + rastgele.randrange(3, 15)], fill="black")
+    os.makedirs(os.path.dirname(yol), exist_ok=True)
+    img.save(yol)
+    return yol
+
+
+PROJE_KLASORU = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+KELIMELER = ("bir iki üç dört beş sayı kesir denklem aşağıdakilerden hangisi doğrudur buna "
+             "göre x y değeri kaçtır üçgen alan çevre oran orantı yüzde problem işçi havuz hız zaman").split()
+
+
+def metin_fontu(boyut=None):
+    """'boyut' verilirse projedeki Arial, yoksa PIL'in varsayılan bitmap fontu."""
+    if boyut is None:
+        return ImageFont.load_default()
+    return ImageFont.truetype(os.path.join(PROJE_KLASORU, "resources", "fonts", "arial.ttf"), boyut)
+
+
+def metin_sorusu(tohum, font):
+    """Beyaz zeminde, tohuma göre farklı satırlardan oluşan yazılı soru görseli."""
+    import random
+    rastgele = random.Random(tohum)
+    satir_yuksekligi = getattr(font, "size", 12) + 10
+    satir_sayisi = rastgele.randint(2, 7)
+    en = rastgele.choice([560, 600, 640, 700, 800])
+    boy = 40 + satir_sayisi * satir_yuksekligi + rastgele.choice([0, 40, 80])
+    img = Image.new("RGB", (en, boy), "white")
+    cizim = ImageDraw.Draw(img)
+    cizim.text((20, 20), f"{rastgele.randint(1, 40)}.", fill="black", font=font)
+    y = 20
+    for _ in range(satir_sayisi):
+        metin = " ".join(rastgele.choice(KELIMELER) for _ in range(rastgele.randint(4, 10)))
+        cizim.text((60, y), metin, fill="black", font=font)
+        y += satir_yuksekligi
+    return img
+
+
+@pytest.fixture
+def soru_bankasi(tmp_path):
+    """
+    '<kök>/Matematik/<konu>/test/kolay/<n>-<cevap>.png' yapısında küçük bir banka.
+    {konu_adi: konu_path} ile kök yolunu döndürür.
+    """
+    kok = tmp_path / "banka"
+    secilen_konular = {}
+    for k, konu in enumerate(("Sayilar", "Kesirler")):
+        konu_path = kok / "Matematik" / konu
+        for i in range(6):
+            soru_gorseli(str(konu_path / "test" / "kolay" / f"{i + 1}-{'ABCD'[i % 4]}.png"), tohum=k * 100 + i)
+        secilen_konular[konu] = str(konu_path)
+    return str(kok), secilen_konular
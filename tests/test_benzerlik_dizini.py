@@ -0,0 +1,88 @@
+# tests/test_benzerlik_dizini.py
+
+import os
+import pytest
+from PIL import Image
+from logic import benzerlik_dizini
+from logic.benzerlik_dizini import BenzerlikDizini
+from logic.soru_katalogu import SoruKatalogu
+from conftest import metin_fontu, metin_sorusu
+
+
+def _banka(kok, font, sayi):
+    for i in range(sayi):
+        klasor = os.path.join(kok, "Matematik", f"Konu{i % 3}", "test", "kolay")
+        os.makedirs(klasor, exist_ok=True)
+        metin_sorusu(i, font).save(os.path.join(klasor, f"{i}-A.png"))
+
+
+@pytest.mark.parametrize("font_boyutu", [None, 18, 26])
+def test_farkli_yazili_sorular_kumelenmez(tmp_path, font_boyutu):
+    kok = str(tmp_path / "banka")
+    _banka(kok, metin_fontu(font_boyutu), 150)
+
+    dizin = BenzerlikDizini(SoruKatalogu(kok))
+    dizin.guncelle()
+
+    assert dizin.kumeler() == []
+
+
+def test_yeniden_olceklenmis_kopya_baska_konuda_bulunur(tmp_path):
+    kok = str(tmp_path / "banka")
+    font = metin_fontu(18)
+    _banka(kok, font, 30)
+    # 0. sorunun küçültülmüş JPEG kopyası başka bir konuda
+    kopya_yolu = os.path.join(kok, "Matematik", "Konu1", "test", "kolay", "tarama-A.jpg")
+    orijinal = metin_sorusu(0, font)
+    orijinal.resize((orijinal.width * 3 // 4, orijinal.height * 3 // 4), Image.LANCZOS).save(kopya_yolu, quality=75)
+
+    dizin = BenzerlikDizini(SoruKatalogu(kok))
+    dizin.guncelle()
+
+    orijinal_yolu = os.path.join(kok, "Matematik", "Konu0", "test", "kolay", "0-A.png")
+    assert dizin.kume(kopya_yolu) == {dizin._normal(orijinal_yolu)}
+    assert len(dizin.kumeler()) == 1
+
+
+def test_kumeler_zincirlenmez(tmp_path):
+    """A~B ve B~C iken A ile C birbirine uzaksa üçü aynı kümeye düşmemeli."""
+    dizin = BenzerlikDizini(SoruKatalogu(str(tmp_path)))
+    dizin._yuklendi = True
+    esik = benzerlik_dizini.DOGRULAMA_ESIGI
+    b_ozeti = (1 << esik) - 1                 # A'ya 'esik' bit uzak
+    c_ozeti = (1 << (2 * esik)) - 1           # B'ye 'esik', A'ya 2*'esik' bit uzak
+    dizin._yollar = {
+        "/banka/a.png": (0, 0, 0, 0, 600, 200),
+        "/banka/b.png": (0, 0, 0, b_ozeti, 600, 200),
+        "/banka/c.png": (0, 0, 0, c_ozeti, 600, 200),
+    }
+    dizin._kumeleri_kur()
+
+    for kume in dizin.kumeler():
+        assert not {"/banka/a.png", "/banka/c.png"} <= set(kume)
+
+
+def test_en_boy_orani_farkli_gorseller_kopya_sayilmaz(tmp_path):
+    dizin = BenzerlikDizini(SoruKatalogu(str(tmp_path)))
+    dizin._yuklendi = True
+    dizin._yollar = {
+        "/banka/genis.png": (0, 0, 0, 0, 600, 200),
+        "/banka/kare.png": (0, 0, 0, 0, 400, 400),
+    }
+    dizin._kumeleri_kur()
+
+    assert dizin.kumeler() == []
+
+
+@pytest.mark.skipif(not benzerlik_dizini.NUMPY_AVAILABLE, reason="NumPy yok")
+def test_numpy_ve_saf_python_ayni_ozeti_verir(tmp_path):
+    font = metin_fontu(18)
+    izgaralar = []
+    for i in range(5):
+        yol = str(tmp_path / f"{i}.png")
+        metin_sorusu(i, font).save(yol)
+        izgaralar.append(benzerlik_dizini._kucuk_gri_oku(yol)[0])
+
+    assert benzerlik_dizini._algisal_ozetler_numpy(izgaralar) == [
+        benzerlik_dizini._algisal_ozet_python(g) for g in izgaralar
+    ]
@@ -0,0 +1,69 @@
+# tests/test_gorsel_olcer.py
+
+import os
+import json
+import threading
+from logic.gorsel_olcer import GorselBoyutServisi, ESKI_INDEKS_DOSYA_ADI
+
+
+def _gorseller(secilen_konular):
+    klasor = os.path.join(secilen_konular["Sayilar"], "test", "kolay")
+    return [os.path.join(klasor, ad) for ad in sorted(os.listdir(klasor))]
+
+
+def test_dizin_bankanin_disina_yazilir(soru_bankasi, tmp_path):
+    kok, secilen_konular = soru_bankasi
+    once_icerik = sorted(os.listdir(kok))
+    once_mtime = os.stat(kok).st_mtime_ns
+
+    servis = GorselBoyutServisi(kok)
+    assert servis.boyut_al(_gorseller(secilen_konular)[0]) == (600, 240)
+    servis.kaydet()
+
+    assert sorted(os.listdir(kok)) == once_icerik
+    assert os.stat(kok).st_mtime_ns == once_mtime
+    assert servis.indeks_yolu.startswith(str(tmp_path / "appdata"))
+    assert len(GorselBoyutServisi(kok)._kayitlar) == 1
+
+
+def test_eszamanli_kaydet_yarim_dosya_yayinlamaz(soru_bankasi):
+    kok, secilen_konular = soru_bankasi
+    servis = GorselBoyutServisi(kok)
+    gorseller = _gorseller(secilen_konular)
+    hatalar = []
+
+    def _yaz(gorsel):
+        # Dışa aktarım thread'i ve UI thread'i gibi: ölç ve kaydet
+        try:
+            for _ in range(20):
+                servis.boyut_al(gorsel)
+                servis._degisti = True
+                servis.kaydet()
+                with open(servis.indeks_yolu, encoding="utf-8") as f:
+                    json.load(f)
+        except Exception as e:
+            hatalar.append(e)
+
+    threadler = [threading.Thread(target=_yaz, args=(g,)) for g in gorseller]
+    for t in threadler:
+        t.start()
+    for t in threadler:
+        t.join()
+
+    assert hatalar == []
+    klasor = os.path.dirname(servis.indeks_yolu)
+    assert [ad for ad in os.listdir(klasor) if ad.endswith(".tmp")] == []
+
+
+def test_eski_surumun_bankadaki_dizini_okunur(soru_bankasi):
+    kok, secilen_konular = soru_bankasi
+    eski = GorselBoyutServisi(kok)
+    gorsel = _gorseller(secilen_konular)[0]
+    eski.boyut_al(gorsel)
+    with open(os.path.join(kok, ESKI_INDEKS_DOSYA_ADI), "w", encoding="utf-8") as f:
+        json.dump({"surum": 1, "gorseller": eski._kayitlar}, f)
+
+    servis = GorselBoyutServisi(kok)
+    assert servis._kayitlar == eski._kayitlar
+    servis.kaydet()
+    assert os.path.exists(servis.indeks_yolu)
@@ -0,0 +1,47 @@
+# tests/test_klasor_izleyici.py
+
+import os
+from logic.klasor_izleyici import KlasorIzleyici
+from logic.soru_katalogu import katalog_al
+
+
+def test_uygulamanin_kendi_dosyalari_olay_uretmez(soru_bankasi):
+    kok, secilen_konular = soru_bankasi
+    izleyici = KlasorIzleyici(kok, lambda olaylar: None)
+    anlik = {}
+    izleyici._yokla(anlik, tam=True)
+
+    # Uygulamanın kökte / klasörlerde yazdığı gizli dosyalar
+    for ad in (".gorsel_boyutlari.json", ".gorsel_boyutlari.json.tmp",
+               ".soru_katalogu.sqlite", ".soru_katalogu.sqlite-journal"):
+        with open(os.path.join(kok, ad), "wb") as f:
+            f.write(b"x")
+    klasor = os.path.join(secilen_konular["Sayilar"], "test", "kolay")
+    with open(os.path.join(klasor, ".7-A.png.1.2.tmp"), "wb") as f:
+        f.write(b"x")
+    katalog_al(kok).kaydet()
+    assert izleyici._yokla(anlik, tam=True) == []
+
+    yeni = os.path.join(klasor, "7-A.png")
+    with open(yeni, "wb") as f:
+        f.write(b"x")
+    assert izleyici._yokla(anlik, tam=True) == [("eklendi", yeni)]
+
+
+def test_yoklama_bosta_seyreklesir(soru_bankasi):
+    kok, _ = soru_bankasi
+    beklemeler = []
+    izleyici = KlasorIzleyici(kok, lambda olaylar: None, aralik=1.0, maks_aralik=8.0)
+
+    class SahteOlay:
+        """'wait' süresini kaydeder, beklemeden döner; 6 turdan sonra durur."""
+        def wait(self, sure):
+            beklemeler.append(sure)
+            return len(beklemeler) > 6
+
+        def is_set(self):
+            return False
+
+    izleyici._dur = SahteOlay()
+    izleyici._yoklama_dongusu()
+    assert beklemeler == [1.0, 2.0, 4.0, 8.0, 8.0, 8.0, 8.0]
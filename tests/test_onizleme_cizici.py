@@ -0,0 +1,48 @@
+# tests/test_onizleme_cizici.py
+
+import os
+import logging
+import threading
+import pytest
+from PIL import ImageChops
+from logic.onizleme_cizici import OnizlemeCizici, font_al, font_yollari, onizleme_onbellegi
+
+
+def test_font_onbellegi_threadler_arasinda_paylasilir():
+    regular = font_yollari()[0]
+    ana_thread_fontu = font_al((regular,), 17)
+    sonuclar = []
+    # Ön yükleyici her 'baslat'ta yeni thread açar; aynı font tekrar yüklenmemeli
+    for _ in range(3):
+        t = threading.Thread(target=lambda: sonuclar.append(font_al((regular,), 17)))
+        t.start()
+        t.join()
+    assert all(font is ana_thread_fontu for font in sonuclar)
+
+
+def _sayfa(soru_bankasi, soru_tipi):
+    """İlk sayfanın en üstünden başlayan sorularla sütunlar."""
+    _, secilen_konular = soru_bankasi
+    klasor = os.path.join(secilen_konular["Sayilar"], "test", "kolay")
+    yollar = sorted(os.path.join(klasor, ad) for ad in os.listdir(klasor))
+    if soru_tipi.lower() == "yazili":
+        return [[{'path': yollar[0], 'final_size': None}, {'path': yollar[1], 'final_size': None}]]
+    return [[{'path': y, 'final_size': (260, 104)} for y in yollar[:3]],
+            [{'path': y, 'final_size': (260, 104)} for y in yollar[3:]]]
+
+
+@pytest.mark.parametrize("soru_tipi", ["Test", "Yazili"])
+@pytest.mark.parametrize("baslik_pt_max", [40, 120])
+def test_baslik_seridi_tam_cizimle_ayni(soru_bankasi, soru_tipi, baslik_pt_max):
+    onizleme_onbellegi.temizle()
+    sabitler = {'BASLIK_PT_MAX': baslik_pt_max, 'BASLIK_PT_MIN': 25, 'TITLE_MAX_W_RATIO': 0.85}
+    sutunlar = _sayfa(soru_bankasi, soru_tipi)
+    logger = logging.getLogger(__name__)
+
+    # Gövde önbelleğe girsin, sonra başlık değişsin (yalnızca şerit çizilir)
+    OnizlemeCizici(soru_tipi, "ilk", logger, sabitler).sayfa_onizlemesi_ciz(sutunlar, 0, 0)
+    cizici = OnizlemeCizici(soru_tipi, "matematik deneme sinavi", logger, sabitler)
+    hizli = cizici.sayfa_onizlemesi_ciz(sutunlar, 0, 0)
+    tam = cizici._sayfayi_ciz(sutunlar, 0, 0)  # şablon, başlık, sorular sırasıyla
+
+    assert ImageChops.difference(hizli, tam).getbbox() is None
@@ -0,0 +1,65 @@
+# tests/test_planlama.py
+
+import random
+import pytest
+from logic.pdf_generator import PDFCreator, _DogrusalSoruHavuzu, _SiraliSoruHavuzu
+
+
+class SahteBoyutServisi:
+    """Diske dokunmadan sabit görsel boyutları döndüren boyut servisi."""
+
+    def __init__(self, boyutlar):
+        self.boyutlar = boyutlar
+
+    def boyut_al(self, gorsel_path):
+        return self.boyutlar[gorsel_path]
+
+    def kaydet(self):
+        pass
+
+
+def _planlayici(boyutlar):
+    pdf = PDFCreator()
+    pdf.boyut_servisi = SahteBoyutServisi(boyutlar)
+    pdf.soru_tipi = "test"
+    pdf.gorsel_listesi = list(boyutlar)
+    return pdf
+
+
+@pytest.mark.parametrize("tohum", range(200))
+def test_bisect_ve_klasik_motor_ayni_plani_uretir(tohum):
+    rastgele = random.Random(tohum)
+    boyutlar = {
+        f"/banka/test/kolay/{i}-A.png": (rastgele.randint(200, 1600), rastgele.randint(60, 1400))
+        for i in range(rastgele.randint(1, 60))
+    }
+    # Eşit yükseklikte sorular: eşitlik durumunda sıra (index) kuralı da sınansın
+    if rastgele.random() < 0.5:
+        ortak = rastgele.randint(100, 600)
+        for yol in list(boyutlar)[::3]:
+            boyutlar[yol] = (800, ortak)
+
+    pdf = _planlayici(boyutlar)
+
+    assert pdf.planla_test_duzeni(motor="klasik") == pdf.planla_test_duzeni(motor="bisect")
+
+
+def test_bos_liste_bos_plan():
+    pdf = _planlayici({})
+
+    assert pdf.planla_test_duzeni(motor="klasik") == pdf.planla_test_duzeni(motor="bisect") == []
+
+
+@pytest.mark.parametrize("tohum", range(50))
+def test_sirali_havuz_dogrusal_havuzla_ayni_sirayla_verir(tohum):
+    rastgele = random.Random(tohum)
+    yukseklikler = [rastgele.choice([50.0, 75.5, 120.25]) for _ in range(40)]
+    yukseklikler += [rastgele.uniform(30, 700) for _ in range(40)]
+    sorular = [{'total_height': y, 'index': i} for i, y in enumerate(yukseklikler)]
+    dogrusal, sirali = _DogrusalSoruHavuzu(list(sorular)), _SiraliSoruHavuzu(list(sorular))
+
+    while len(sirali):
+        kalan_bosluk = rastgele.uniform(20, 800)
+        beklenen = dogrusal.en_uygununu_al(kalan_bosluk)
+        assert sirali.en_uygununu_al(kalan_bosluk) is beklenen
+    assert len(dogrusal) == 0
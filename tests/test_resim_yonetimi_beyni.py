@@ -0,0 +1,53 @@
+# tests/test_resim_yonetimi_beyni.py
+
+import os
+import shutil
+import pytest
+from logic.resim_yonetimi_beyni import ResimYonetimiBeyni
+
+
+@pytest.fixture
+def beyin(soru_bankasi):
+    """Ders ekranından geçmeden, doğrudan resim yönetimi ekranında açılmış banka."""
+    kok, _ = soru_bankasi
+    beyin = ResimYonetimiBeyni()
+    beyin.set_ana_klasor(kok)
+    yield beyin
+    beyin.izlemeyi_durdur()
+
+
+def test_resim_yonetiminde_acilan_bankada_kopya_bulunur(beyin, soru_bankasi, tmp_path):
+    _, secilen_konular = soru_bankasi
+    bankadaki = os.path.join(secilen_konular["Kesirler"], "test", "kolay", "2-B.png")
+    yeni = str(tmp_path / "telefon_fotografi.png")
+    shutil.copyfile(bankadaki, yeni)
+
+    # '_dogrula' thread'inin yaptığı gibi: doğrula, dizini eşitle, sorgula
+    ozet = beyin.yukleyici.dogrula_toplu([yeni])[yeni]
+    dizin = beyin.icerik_dizinini_esitle()
+    assert os.path.normcase(os.path.abspath(bankadaki)) in dizin.kopyalari(ozet)
+
+
+def test_arka_plan_esitlemesi_dizini_doldurur(beyin, soru_bankasi):
+    _, secilen_konular = soru_bankasi
+    beyin._esitleme_thread.join(timeout=30)
+    dizin = beyin.icerik_dizini()
+    assert dizin.esitlendi
+    bankadaki = os.path.join(secilen_konular["Sayilar"], "test", "kolay", "1-A.png")
+    assert dizin.ozet(bankadaki) is not None
+
+
+def test_resim_yonetiminde_acilan_bankada_benzer_sorular_dolar(soru_bankasi):
+    kok, secilen_konular = soru_bankasi
+    sayilar = os.path.join(secilen_konular["Sayilar"], "test", "kolay")
+    kesirler = os.path.join(secilen_konular["Kesirler"], "test", "kolay")
+    shutil.copyfile(os.path.join(sayilar, "3-C.png"), os.path.join(kesirler, "7-C.png"))
+
+    beyin = ResimYonetimiBeyni()
+    beyin.set_ana_klasor(kok)
+    try:
+        beyin._esitleme_thread.join(timeout=30)
+        benzerler = dict(beyin.benzer_sorular(kesirler))
+    finally:
+        beyin.izlemeyi_durdur()
+    assert benzerler == {"7-C.png": [os.path.join("Matematik", "Sayilar", "test", "kolay", "3-C.png")]}
@@ -0,0 +1,28 @@
+# tests/test_soru_katalogu.py
+
+import os
+from logic.icerik_dizini import icerik_dizini_al
+from logic.soru_katalogu import SoruKatalogu, katalog_al
+
+
+def test_anlik_goruntu_bankanin_disina_yazilir(soru_bankasi, tmp_path):
+    kok, _ = soru_bankasi
+    once_icerik = sorted(os.listdir(kok))
+    once_mtime = os.stat(kok).st_mtime_ns
+
+    katalog = katalog_al(kok)
+    assert katalog.tara() == 12
+    katalog.kaydet()
+    icerik_dizini_al(kok).guncelle()  # aynı dosyaya 'ozetler' tablosunu yazar
+
+    # Kökte snapshot / journal oluşmaz, kökün mtime'ı değişmez
+    assert sorted(os.listdir(kok)) == once_icerik
+    assert os.stat(kok).st_mtime_ns == once_mtime
+    assert os.path.isfile(katalog.anlik_goruntu_yolu)
+    assert katalog.anlik_goruntu_yolu.startswith(str(tmp_path / "appdata"))
+
+    # Yeni bir katalog aynı dosyayı bulur ve kayıtları oradan yükler
+    yeni = SoruKatalogu(kok)
+    assert yeni.anlik_goruntu_yolu == katalog.anlik_goruntu_yolu
+    yeni._anlik_goruntuyu_yukle()
+    assert yeni.konu_toplami("Matematik", "Kesirler") == 6
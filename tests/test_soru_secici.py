@@ -0,0 +1,72 @@
+# tests/test_soru_secici.py
+
+import os
+import random
+import shutil
+from logic.icerik_dizini import icerik_dizini_al
+from logic.soru_secici import gorselleri_sec, soru_klasoru
+
+
+def _eski_secim(konu_dagilimi, secilen_konular, tohum):
+    """Kopya elemeden önceki seçim: konu başına 'sample', sonunda 'shuffle'."""
+    rastgele = random.Random(tohum)
+    tum = []
+    for konu_adi, sayi in konu_dagilimi.items():
+        klasor = soru_klasoru(secilen_konular[konu_adi], "test", "kolay")
+        gorseller = sorted(os.listdir(klasor))
+        secilen = rastgele.sample(gorseller, sayi) if len(gorseller) >= sayi else gorseller
+        tum.extend(os.path.join(klasor, g) for g in secilen)
+    rastgele.shuffle(tum)
+    return tum
+
+
+def test_kopya_yoksa_tohumlu_secim_degismez(soru_bankasi):
+    kok, secilen_konular = soru_bankasi
+    icerik_dizini_al(kok).guncelle()
+    dagilim = {"Sayilar": 4, "Kesirler": 3}
+
+    for tohum in range(20):
+        eksikler = {}
+        secim = gorselleri_sec(dagilim, secilen_konular, "test", "kolay",
+                               rastgele=random.Random(tohum), eksikler=eksikler)
+        assert secim == _eski_secim(dagilim, secilen_konular, tohum)
+        assert eksikler == {}
+
+
+def test_konular_arasi_kopya_yedekle_degistirilir(soru_bankasi):
+    kok, secilen_konular = soru_bankasi
+    sayilar = soru_klasoru(secilen_konular["Sayilar"], "test", "kolay")
+    kesirler = soru_klasoru(secilen_konular["Kesirler"], "test", "kolay")
+    # 'Sayilar'daki bir soru 'Kesirler'e farklı adla kopyalanmış
+    shutil.copy2(os.path.join(sayilar, "1-A.png"), os.path.join(kesirler, "kopya-A.png"))
+    icerik_dizini_al(kok).guncelle()
+
+    for tohum in range(20):
+        eksikler = {}
+        secim = gorselleri_sec({"Sayilar": 6, "Kesirler": 6}, secilen_konular, "test", "kolay",
+                               rastgele=random.Random(tohum), eksikler=eksikler)
+        adlar = {os.path.relpath(yol, kok) for yol in secim}
+        # Aynı soru iki kez seçilmez, 'Kesirler'deki yedekle tamamlanır
+        assert not {os.path.relpath(os.path.join(sayilar, "1-A.png"), kok),
+                    os.path.relpath(os.path.join(kesirler, "kopya-A.png"), kok)} <= adlar
+        assert len(secim) == 12
+        assert eksikler == {}
+
+
+def test_kopyalar_elenince_eksik_bildirilir(soru_bankasi):
+    kok, secilen_konular = soru_bankasi
+    sayilar = soru_klasoru(secilen_konular["Sayilar"], "test", "kolay")
+    kesirler = soru_klasoru(secilen_konular["Kesirler"], "test", "kolay")
+    # 'Kesirler' tamamen 'Sayilar'ın kopyası
+    for ad in os.listdir(kesirler):
+        os.remove(os.path.join(kesirler, ad))
+    for ad in os.listdir(sayilar)[:3]:
+        shutil.copy2(os.path.join(sayilar, ad), os.path.join(kesirler, "k" + ad))
+    icerik_dizini_al(kok).guncelle()
+
+    eksikler = {}
+    secim = gorselleri_sec({"Sayilar": 6, "Kesirler": 3}, secilen_konular, "test", "kolay",
+                           rastgele=random.Random(1), eksikler=eksikler)
+
+    assert len(secim) == 6
+    assert eksikler == {"Kesirler": (3, 0)}
@@ -0,0 +1,27 @@
+# tests/test_toplu_yukleyici.py
+
+import os
+from conftest import soru_gorseli
+from logic.toplu_yukleyici import TopluYukleyici
+
+
+def test_sonradan_olusan_hedefin_uzerine_yazilmaz(tmp_path):
+    kaynaklar = [soru_gorseli(str(tmp_path / "secim" / f"{i}.png"), tohum=i) for i in range(3)]
+    hedef_klasor = tmp_path / "hedef"
+    hedef_klasor.mkdir()
+    yukleyici = TopluYukleyici()
+    assert all(yukleyici.dogrula_toplu(kaynaklar).values())
+
+    # Seçim doğrulandıktan sonra hedefte aynı adla bir dosya belirdi
+    mevcut = hedef_klasor / "1.png"
+    mevcut.write_bytes(b"baska bir kullanicinin dosyasi")
+
+    olaylar = []
+    kopyalanan, hatalar = yukleyici.yukle(
+        [(k, os.path.basename(k)) for k in kaynaklar], str(hedef_klasor), olaylar.append
+    )
+
+    assert (kopyalanan, hatalar) == (2, 1)
+    assert mevcut.read_bytes() == b"baska bir kullanicinin dosyasi"
+    assert [o['hedef'] for o in olaylar if o['durum'] == "cakisma"] == [str(mevcut)]
+    assert sorted(os.listdir(hedef_klasor)) == ["0.png", "1.png", "2.png"]  # geçici dosya kalmadı
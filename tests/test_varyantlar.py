@@ -0,0 +1,31 @@
+# tests/test_varyantlar.py
+
+import os
+import random
+from logic.pdf_generator import PDFCreator
+from logic.gorsel_olcer import boyut_servisi_al
+from logic.soru_secici import gorselleri_sec
+
+
+def test_varyantlari_kaydet_cevap_anahtari(soru_bankasi, tmp_path):
+    kok, secilen_konular = soru_bankasi
+    gorseller = gorselleri_sec({"Sayilar": 4, "Kesirler": 4}, secilen_konular, "test", "kolay",
+                               rastgele=random.Random(7))
+
+    pdf = PDFCreator()
+    pdf.boyut_servisi = boyut_servisi_al(kok)
+    pdf.soru_tipi = "test"
+    pdf.baslik_ekle("DENEME")
+    pdf.gorsel_listesi = gorseller
+
+    dosyalar = [str(tmp_path / f"sinav_{etiket}.pdf") for etiket in "AB"]
+    varyantlar = pdf.varyantlari_kaydet(dosyalar, [1, 2], cevap_anahtari=True, baslik_etiketleri=["A", "B"])
+
+    assert len(varyantlar) == 2
+    for varyant in varyantlar:
+        assert varyant['basarili']
+        assert os.path.getsize(varyant['dosya']) > 0
+        # Cevap anahtarı varyantın KENDİ sırasına göre, dosya adından ('3-C.png' -> 'C')
+        beklenen = [os.path.splitext(os.path.basename(yol))[0].split("-")[1] for yol in varyant['gorsel_listesi']]
+        assert varyant['cevaplar'] == beklenen
+        assert sorted(varyant['gorsel_listesi']) == sorted(gorseller)
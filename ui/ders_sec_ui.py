@@ -2,6 +2,10 @@ import customtkinter as ctk
 from tkinter import filedialog
 import os
 import logging
+import threading
+from logic.soru_katalogu import katalog_al
+from logic.icerik_dizini import icerik_dizini_al
+from logic.benzerlik_dizini import benzerlik_dizini_al
 
 # Yeni loglama sistemi: Bu modülün kendi logger'ını al.
 # Adı otomatik olarak 'ui.ders_sec_ui' olacaktır.
@@ -139,6 +143,19 @@ class DersSecmePenceresi(ctk.CTkFrame):
             logger.info(f"Toplam {len(self.current_buttons)} ders butonu oluşturuldu.")
             self.relayout_buttons()
 
+            # YENİ: Soru kataloğunu arka planda tek geçişte oku; konu ekranı sayıları
+            # klasörleri tekrar listelemeden katalogdan alır
+            katalog = katalog_al(ana_klasor)
+
+            def _katalogu_tara():
+                katalog.tara()
+                # Ardından kopya tespiti için içerik dizinini eşitle (yalnızca yeni/değişen dosyalar özetlenir)
+                icerik_dizini_al(ana_klasor).guncelle()
+                # Yakın kopya (yeniden taranmış / yeniden boyutlanmış) soru kümeleri
+                benzerlik_dizini_al(ana_klasor).guncelle()
+
+            threading.Thread(target=_katalogu_tara, name="KatalogTarama", daemon=True).start()
+
         except PermissionError:
             logger.error(f"Klasöre erişim izni hatası: {ana_klasor}", exc_info=True)
             self.show_error_message(f"Klasöre erişim izni yok:\n{ana_klasor}")
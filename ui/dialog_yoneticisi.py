@@ -13,8 +13,84 @@ Ana Sınıf:
 - DialogYoneticisi: 
   Ana UI penceresine (parent_ui) bağlanarak, onun adına
   hata, bildirim, onay ve bilgilendirme pencereleri açar.
+
+Yardımcı Sınıf:
+- IlerlemeDialogu:
+  'show_ilerleme_dialog'un döndürdüğü, güncellenebilir ilerleme penceresi.
 """
 
+
+class IlerlemeDialogu:
+    """
+    İlerleme çubuğu + aşama metni + 'İptal' butonu olan pencere.
+    SADECE ana (Tk) thread'den çağrılmalıdır; worker'lar 'after()' kullanır.
+    
+    Metodlar:
+    - guncelle(self, tamamlanan, toplam, asama): Çubuğu ve metni günceller.
+    - kapat(self): Pencereyi kapatır (birden fazla çağrılabilir).
+    """
+
+    def __init__(self, master, title, on_cancel=None):
+        self.on_cancel = on_cancel
+        self.window = ctk.CTkToplevel(master)
+        self.window.title(title)
+        self.window.geometry("420x200")
+        self.window.resizable(False, False)
+        self.window.transient(master)
+        self.window.grab_set()
+
+        try:
+            master.update_idletasks()
+            x = master.winfo_x() + master.winfo_width()//2 - 210
+            y = master.winfo_y() + master.winfo_height()//2 - 100
+            self.window.geometry(f"+{x}+{y}")
+        except Exception:
+            pass # Merkezleme başarısız olursa devam et
+
+        self.asama_label = ctk.CTkLabel(
+            self.window, text="Hazırlanıyor...",
+            font=ctk.CTkFont(size=14, weight="bold")
+        )
+        self.asama_label.pack(pady=(25, 10))
+
+        self.progress_bar = ctk.CTkProgressBar(self.window, width=340)
+        self.progress_bar.set(0)
+        self.progress_bar.pack(pady=5)
+
+        self.detay_label = ctk.CTkLabel(self.window, text="", font=ctk.CTkFont(size=12))
+        self.detay_label.pack(pady=5)
+
+        self.iptal_btn = ctk.CTkButton(
+            self.window, text="İptal", command=self._iptal,
+            font=ctk.CTkFont(size=14, weight="bold"), width=100, height=35,
+            fg_color="#6c757d", hover_color="#5a6268"
+        )
+        self.iptal_btn.pack(pady=15)
+
+        # Pencere kapatma (X) = İptal
+        self.window.protocol("WM_DELETE_WINDOW", self._iptal)
+
+    def _iptal(self):
+        self.iptal_btn.configure(state="disabled", text="İptal ediliyor...")
+        if callable(self.on_cancel):
+            self.on_cancel()
+
+    def guncelle(self, tamamlanan, toplam, asama):
+        if not self.window.winfo_exists():
+            return
+        self.asama_label.configure(text=asama)
+        self.progress_bar.set(tamamlanan / toplam if toplam else 0)
+        self.detay_label.configure(text=f"{tamamlanan} / {toplam}")
+
+    def kapat(self):
+        try:
+            if self.window.winfo_exists():
+                self.window.grab_release()
+                self.window.destroy()
+        except Exception:
+            pass # Pencere zaten kapanmış
+
+
 class DialogYoneticisi:
     """
     Tüm pop-up pencereleri (Hata, Bildirim, Onay) yönetir.
@@ -42,6 +118,10 @@ class DialogYoneticisi:
     - show_havuz_tukendi_dialog(self, konu_adi, index): 
         Soru güncellemede havuz biterse sıfırlama onayı ister.
         
+    - show_ilerleme_dialog(self, title, on_cancel=None): 
+        Uzun işlemler (PDF kaydetme) için ilerleme çubuklu, 'İptal'
+        butonlu pencere açar ve 'IlerlemeDialogu' döndürür.
+        
     - _darken_color(self, hex_color): 
         Dialog butonları için renk koyulaştırma yardımcısı.
     """
@@ -356,4 +436,9 @@ class DialogYoneticisi:
             font=ctk.CTkFont(size=14, weight="bold"), width=80, height=40,
             fg_color="#6c757d", hover_color="#5a6268"
         )
-        hayir_btn.pack(side="left", padx=10)
\ No newline at end of file
+        hayir_btn.pack(side="left", padx=10)
+
+    def show_ilerleme_dialog(self, title, on_cancel=None):
+        """İlerleme penceresini açar. 'on_cancel': 'İptal'e basılınca çağrılır."""
+        self.logger.debug(f"İlerleme dialogu gösteriliyor: {title}")
+        return IlerlemeDialogu(self.master, title, on_cancel=on_cancel)
@@ -4,6 +4,7 @@ import os
 import logging
 from datetime import datetime
 import math
+from logic.soru_katalogu import ders_katalogu, konu_katalogu
 
 # Yeni loglama sistemi: Bu modülün kendi logger'ını al.
 # Adı otomatik olarak 'ui.konu_baslik_sec_ui' olacaktır.
@@ -353,17 +354,11 @@ class KonuBaslikSecmePenceresi(ctk.CTkFrame):
         self.topic_items[konu_adi] = item_frame
     
     def calculate_detailed_questions(self, konu_path):
-        """Detaylı soru sayılarını hesapla"""
+        """Detaylı soru sayılarını hesapla (GÜNCELLENDİ: paylaşılan katalogdan)"""
         detay = {'test': {'kolay': 0, 'orta': 0, 'zor': 0}, 'yazili': {'kolay': 0, 'orta': 0, 'zor': 0}}
         try:
-            for soru_tipi in ['test', 'yazili']:
-                soru_tipi_path = os.path.join(konu_path, soru_tipi)
-                if os.path.exists(soru_tipi_path):
-                    for zorluk in ['kolay', 'orta', 'zor']:
-                        zorluk_path = os.path.join(soru_tipi_path, zorluk)
-                        if os.path.exists(zorluk_path):
-                            gorseller = [f for f in os.listdir(zorluk_path) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))]
-                            detay[soru_tipi][zorluk] = len(gorseller)
+            katalog, ders, konu = konu_katalogu(konu_path)
+            detay = katalog.konu_detayi(ders, konu)
         except Exception as e:
             logger.warning(f"Detaylı soru hesaplama hatası - {konu_path}: {e}")
         return detay
@@ -511,13 +506,15 @@ class KonuBaslikSecmePenceresi(ctk.CTkFrame):
                 logger.error(f"Ders klasörü bulunamadı: {self.ders_klasor_yolu}")
                 return []
             
-            for item in os.listdir(self.ders_klasor_yolu):
+            # GÜNCELLENDİ: Konu klasörleri paylaşılan katalogdan (değişmediyse yeniden listelenmez)
+            katalog, ders = ders_katalogu(self.ders_klasor_yolu)
+            for item in katalog.konular(ders):
                 konu_path = os.path.join(self.ders_klasor_yolu, item)
-                if os.path.isdir(konu_path):
-                    toplam_soru = self.calculate_total_questions(konu_path)
-                    konu_listesi.append({'adi': item, 'yol': konu_path, 'toplam_soru': toplam_soru})
+                toplam_soru = self.calculate_total_questions(konu_path)
+                konu_listesi.append({'adi': item, 'yol': konu_path, 'toplam_soru': toplam_soru})
             
             konu_listesi.sort(key=lambda x: x['adi'].lower())
+            katalog.kaydet() # Yeni okunan klasörler bir sonraki açılışta taranmasın
             logger.info(f"{len(konu_listesi)} konu başlığı bulundu")
             return konu_listesi
         except Exception as e:
@@ -525,17 +522,11 @@ class KonuBaslikSecmePenceresi(ctk.CTkFrame):
             return []
 
     def calculate_total_questions(self, konu_path):
-        """Toplam soru sayısını hesapla"""
+        """Toplam soru sayısını hesapla (GÜNCELLENDİ: paylaşılan katalogdan)"""
         toplam = 0
         try:
-            for soru_tipi in ['test', 'yazili']:
-                soru_tipi_path = os.path.join(konu_path, soru_tipi)
-                if os.path.exists(soru_tipi_path):
-                    for zorluk in ['kolay', 'orta', 'zor']:
-                        zorluk_path = os.path.join(soru_tipi_path, zorluk)
-                        if os.path.exists(zorluk_path):
-                            gorseller = [f for f in os.listdir(zorluk_path) if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))]
-                            toplam += len(gorseller)
+            katalog, ders, konu = konu_katalogu(konu_path)
+            toplam = katalog.konu_toplami(ders, konu)
         except Exception as e:
             logger.warning(f"Soru sayısı hesaplama hatası - {konu_path}: {e}")
         return toplam
@@ -93,6 +93,20 @@ class KontrolPaneli(ctk.CTkFrame):
                 pass
         title_entry.bind("<Destroy>", _on_destroy)
 
+        # YENİ: Cevap anahtarı durumu (tüm seçim için; cevaplar katalogda hazır)
+        try:
+            cevapsiz = self.controller.oturum_yoneticisi.cevapsiz_sayisi(self.controller.secilen_gorseller)
+        except Exception:
+            cevapsiz = 0
+        if cevapsiz:
+            ctk.CTkLabel(
+                self,
+                text=f"⚠ {cevapsiz} sorunun cevabı bilinmiyor (cevap anahtarında '?' görünecek)",
+                font=ctk.CTkFont(size=12, weight="bold"),
+                text_color="#b45309",
+                anchor="w"
+            ).pack(fill="x", padx=15, pady=(0, 6))
+
         # --- Scrollable frame ---
         scroll_frame = ctk.CTkScrollableFrame(
             self,
@@ -105,6 +119,14 @@ class KontrolPaneli(ctk.CTkFrame):
         bu_sayfanin_soru_bilgileri_duz = []
         for sutun in bu_sayfanin_sutunlari:
             bu_sayfanin_soru_bilgileri_duz.extend(sutun)
+
+        # YENİ: Sayfadaki tüm cevaplar tek toplu çağrıda
+        try:
+            sayfa_cevaplari = self.controller.oturum_yoneticisi.resolve_answers(
+                [soru_info['path'] for soru_info in bu_sayfanin_soru_bilgileri_duz]
+            )
+        except Exception:
+            sayfa_cevaplari = ["?"] * len(bu_sayfanin_soru_bilgileri_duz)
         
         # --- Her soru için kontrol kartı ---
         for i, soru_info in enumerate(bu_sayfanin_soru_bilgileri_duz):
@@ -120,10 +142,7 @@ class KontrolPaneli(ctk.CTkFrame):
     
             soru_no = global_offset + i + 1
             
-            try:
-                cevap = self.controller.oturum_yoneticisi.get_answer_for_image(gorsel_path)
-            except Exception:
-                cevap = "?"
+            cevap = sayfa_cevaplari[i]
     
             try:
                 # DİKKAT: 'self.find_topic_from_path' -> 'self.controller.find_topic_from_path'
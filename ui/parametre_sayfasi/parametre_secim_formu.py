@@ -4,6 +4,7 @@ import customtkinter as ctk
 import tkinter as tk
 import os
 import logging
+from logic.soru_katalogu import konu_katalogu
 
 # Ana dosyadan 'YAZILI_INFO_SHOWN' global değişkenini buraya da taşıyoruz.
 # İşlevselliği bozmamak için bu global değişkeni koruyoruz.
@@ -44,6 +45,9 @@ class ParametreSecimFormu(ctk.CTkFrame):
         
     - get_available_questions(self, ...):
         Doğrulama için bir konudaki mevcut soru sayısını kontrol eder.
+
+    - get_unknown_answers(self, ...):
+        Bir konudaki cevabı bilinmeyen soru sayısı (katalogdan, canlı gösterim için).
         
     - _bind_combobox_open / _open_dropdown_safely:
         ComboBox'lar için yardımcı fonksiyonlar.
@@ -323,6 +327,26 @@ class ParametreSecimFormu(ctk.CTkFrame):
                     var.trace('w', lambda *_: self.update_total())
                 except Exception:
                     pass
+
+        # YENİ: Tip/zorluk değişince cevapsız soru sayısı da güncellensin.
+        # Değişkenler controller'da paylaşıldığı için izler form kapanınca kaldırılır.
+        self._secim_izleri = []
+        for paylasilan_var in (self.soru_tipi_var, self.zorluk_var):
+            try:
+                self._secim_izleri.append(
+                    (paylasilan_var, paylasilan_var.trace_add('write', lambda *_: self.update_total()))
+                )
+            except Exception:
+                pass
+
+        def _izleri_kaldir(_):
+            for paylasilan_var, iz in self._secim_izleri:
+                try:
+                    paylasilan_var.trace_remove('write', iz)
+                except Exception:
+                    pass
+            self._secim_izleri = []
+        self.total_label.bind("<Destroy>", _izleri_kaldir)
         self.update_total()
 
         devam_btn = ctk.CTkButton(
@@ -467,31 +491,48 @@ class ParametreSecimFormu(ctk.CTkFrame):
         try:
             # 'self.secilen_konular' ana controller'dan alındı
             konu_path = self.secilen_konular[konu_adi]
-            klasor_yolu = os.path.join(konu_path, soru_tipi.lower(), zorluk.lower())
-            
-            if not os.path.exists(klasor_yolu):
-                return 0
-                
-            gorseller = [f for f in os.listdir(klasor_yolu) 
-                        if f.lower().endswith(('.png', '.jpg', '.jpeg', '.gif', '.bmp'))]
-            
-            return len(gorseller)
+
+            # GÜNCELLENDİ: Sayı paylaşılan katalogdan (klasör değişmediyse yeniden listelenmez)
+            katalog, ders, konu = konu_katalogu(konu_path)
+            return katalog.sayi(ders, konu, soru_tipi, zorluk)
         except Exception as e:
             self.logger.error(f"Mevcut soru sayısı hesaplama hatası - {konu_adi}: {e}")
             return 0
 
+    def get_unknown_answers(self, konu_adi, soru_tipi, zorluk):
+        """YENİ: Bir konu klasöründe cevabı bilinmeyen soru sayısı (katalogdan)"""
+        try:
+            konu_path = self.secilen_konular[konu_adi]
+            katalog, ders, konu = konu_katalogu(konu_path)
+            return katalog.cevapsiz_sayisi(ders, konu, soru_tipi, zorluk)
+        except Exception as e:
+            self.logger.error(f"Cevapsız soru sayısı hesaplama hatası - {konu_adi}: {e}")
+            return 0
+
     def update_total(self):
-        """Toplam seçilen soru sayısını canlı güncelle"""
+        """Toplam seçilen soru sayısını (ve cevabı bilinmeyen soruları) canlı güncelle"""
         try:
             toplam = 0
-            for var in self.konu_entry_vars.values():
+            secilen_konular = []
+            for konu_adi, var in self.konu_entry_vars.items():
                 try:
                     val = int(var.get())
                     if val > 0:
                         toplam += val
+                        secilen_konular.append(konu_adi)
                 except Exception:
                     continue
+            metin = f"Toplam Seçilen Soru: {toplam}"
+
+            # YENİ: Tip ve zorluk seçildiyse, seçilen konulardaki cevapsız soruları göster
+            soru_tipi = self.soru_tipi_var.get()
+            zorluk = self.zorluk_var.get()
+            if soru_tipi and zorluk and "seçin" not in soru_tipi.lower() and "seçin" not in zorluk.lower():
+                cevapsiz = sum(self.get_unknown_answers(k, soru_tipi, zorluk) for k in secilen_konular)
+                if cevapsiz:
+                    metin += f"  ·  ⚠ Bankada cevabı bilinmeyen: {cevapsiz}"
+
             if hasattr(self, 'total_label') and self.total_label.winfo_exists():
-                self.total_label.configure(text=f"Toplam Seçilen Soru: {toplam}")
+                self.total_label.configure(text=metin)
         except Exception:
             pass
\ No newline at end of file
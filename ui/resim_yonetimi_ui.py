@@ -34,6 +34,7 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
         self.selected_images = []  # Seçilen resimler listesi
         self.search_timer = None  # Arama timer'ı
         self.search_results = []  # Arama sonuçları
+        self._thumb_iptal_token = None  # Bekleyen thumbnail işleri (panel yeniden çizilince iptal)
 
         logger.info("ResimYonetimiPenceresi frame'i başlatılıyor")
         self.setup_ui()
@@ -657,18 +658,49 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
 
         logger.info(f"Seçilen dosya sayısı: {len(dosyalar)}")
 
+        # GÜNCELLENDİ: Doğrulama (tek okuma + özet) arka planda, paralel yapılır;
+        # sonuçlar önbelleklenir ve kopyalamada dosyalar tekrar doğrulanmaz
+        def _dogrula():
+            try:
+                sonuclar = self.beyin.yukleyici.dogrula_toplu(dosyalar)
+            except Exception as e:
+                logger.error(f"Seçim doğrulanamadı: {e}", exc_info=True)
+                sonuclar = {}
+            try:
+                # YENİ: Kopya sorgusu UI thread'inde; içerik dizini burada eşitlensin
+                self.beyin.icerik_dizinini_esitle()
+            except Exception as e:
+                logger.warning(f"İçerik dizini eşitlenemedi, bankadaki kopyalar gösterilmeyebilir: {e}")
+            self.after(0, self._on_secim_dogrulandi, dosyalar, sonuclar)
+
+        threading.Thread(target=_dogrula, daemon=True).start()
+
+    def _on_secim_dogrulandi(self, dosyalar, sonuclar):
+        """UI thread'inde: doğrulanan dosyaları bekleyen listeye ekler."""
         gecersizler = []
+        bankada_olanlar = []  # [(src, dosya_adi, bankadaki_yol)]
+        dizin = self.beyin.icerik_dizini()
+        # YENİ: Bekleyen listede içerik tekrarı (farklı adla aynı fotoğraf)
+        bekleyen_ozetler = {self.beyin.yukleyici.ozet(it[0]) for it in self.selected_images}
         for src in dosyalar:
             try:
                 dosya_adi = os.path.basename(src)
+                ozet = sonuclar.get(src)
 
                 # SADECE GERÇEK GÖRSELLERİ KABUL ET
-                if not self.beyin.is_image_file(src):
+                if not ozet:
                     gecersizler.append(dosya_adi)
                     continue
 
-                # Aynı isim zaten bekleyen listede varsa ekleme
-                if any(dosya_adi == it[1] for it in self.selected_images):
+                # Aynı isim veya aynı içerik zaten bekleyen listede varsa ekleme
+                if ozet in bekleyen_ozetler or any(dosya_adi == it[1] for it in self.selected_images):
+                    continue
+                bekleyen_ozetler.add(ozet)
+
+                # YENİ: Aynı içerik bankada zaten var mı? (içerik dizini, O(1))
+                mevcutlar = dizin.kopyalari(ozet) if dizin is not None else set()
+                if mevcutlar:
+                    bankada_olanlar.append((src, dosya_adi, sorted(mevcutlar)[0]))
                     continue
 
                 # Bekleyen listeye ekle (henüz KOPYALAMA YAPMIYORUZ)
@@ -676,6 +708,21 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
             except Exception as e:
                 logger.error(f"Seçime eklenemedi: {src} - {e}", exc_info=True)
 
+        if bankada_olanlar:
+            satirlar = [
+                f"{dosya_adi}  →  {self.beyin.get_relative_path(mevcut)}"
+                for _, dosya_adi, mevcut in bankada_olanlar[:10]
+            ]
+            msg = "Aşağıdaki dosyaların aynısı soru bankasında zaten var:\n\n- " + "\n- ".join(satirlar)
+            if len(bankada_olanlar) > 10:
+                msg += "\n\n(…)"
+            msg += "\n\nYine de eklensin mi?"
+            logger.info(f"{len(bankada_olanlar)} dosya bankada zaten var (içerik özeti eşleşti).")
+            if messagebox.askyesno("Kopya Sorular", msg):
+                for src, dosya_adi, _ in bankada_olanlar:
+                    if not any(dosya_adi == it[1] for it in self.selected_images):
+                        self.selected_images.append((src, dosya_adi))
+
         # Kullanıcıya bilgi ver
         if gecersizler:
             try:
@@ -727,12 +774,13 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
             for w in self.selected_images_scroll.winfo_children():
                 w.destroy()
             
-            ctk.CTkLabel(
+            self._kopyalama_etiketi = ctk.CTkLabel(
                 self.selected_images_scroll,
                 text=f"⏳ {len(self.selected_images)} resim kopyalanıyor, lütfen bekleyin...",
                 font=ctk.CTkFont(family="Segoe UI", size=14),
                 text_color="#2d3436"
-            ).pack(pady=50)
+            )
+            self._kopyalama_etiketi.pack(pady=50)
             
             # 3. Arka plan "işçi" thread'ini başlat
             # (Kopyalanacak listeyi ve hedefi işçiye veriyoruz)
@@ -754,31 +802,38 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
     def _commit_images_async(self, images_to_copy_list, hedef_klasor):
         """
         !!! BU FONKSİYON ARKA PLAN THREAD'İNDE ÇALIŞIR !!!
-        Ağır 'shutil.copy2' işini yapar.
+        GÜNCELLENDİ: Kopyalama Beyin'in toplu yükleyicisiyle paralel ve atomik
+        yapılır; seçimde doğrulanan dosyalar tekrar 'verify' edilmez.
         """
-        kopyalanan = 0
-        hatalar = 0
-        
-        for src_path, dosya_adi in images_to_copy_list:
-            try:
-                # (Bu kontroller hızlı, burada kalabilir)
-                if not self.beyin.is_image_file(src_path):
-                    continue
-                
-                hedef_yol = os.path.join(hedef_klasor, dosya_adi)
-                
-                # Ağır iş: shutil.copy2
-                self.beyin.kopyala_resim(src_path, hedef_yol)
-                kopyalanan += 1
+        kopyalanan, hatalar = 0, 0
+        cakismalar = [] # YENİ: Hedefte bu arada aynı adla oluşan (üzerine yazılmayan) dosyalar
 
-            except Exception as e:
-                logger.error(f"Kopyalama thread'i hatası: {src_path} -> {e}", exc_info=True)
-                hatalar += 1
+        def _olay(olay):
+            if olay['durum'] == "cakisma":
+                cakismalar.append(os.path.basename(olay['hedef']))
+            self.after(0, self._on_commit_progress, olay)
+
+        try:
+            kopyalanan, hatalar = self.beyin.resimleri_toplu_kopyala(
+                images_to_copy_list, hedef_klasor, olay_callback=_olay
+            )
+        except Exception as e:
+            logger.error(f"Kopyalama thread'i hatası: {hedef_klasor} -> {e}", exc_info=True)
+            hatalar = len(images_to_copy_list) - kopyalanan
         
         # İş bitince, sonucu (başarı/hata sayısı) ana thread'e yolla
-        self.after(0, self._on_commit_complete, kopyalanan, hatalar)
+        self.after(0, self._on_commit_complete, kopyalanan, hatalar, cakismalar)
 
-    def _on_commit_complete(self, kopyalanan_sayisi, hata_sayisi):
+    def _on_commit_progress(self, olay):
+        """UI thread'inde: her dosya bittiğinde ilerleme yazısını günceller."""
+        etiket = getattr(self, "_kopyalama_etiketi", None)
+        if etiket is None or not etiket.winfo_exists():
+            return
+        etiket.configure(
+            text=f"⏳ {olay['tamamlanan']}/{olay['toplam']} resim kopyalandı...\n{os.path.basename(olay['kaynak'])}"
+        )
+
+    def _on_commit_complete(self, kopyalanan_sayisi, hata_sayisi, cakismalar=()):
         """
         !!! BU FONKSİYON ANA UI THREAD'İNDE ÇALIŞIR !!!
         Kopyalama bitince UI'ı günceller.
@@ -792,13 +847,23 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
         
         self.show_initial_message() # Başlangıç mesajını göster
         
-        if hata_sayisi > 0:
+        if cakismalar:
+            liste = "\n- ".join(cakismalar[:10]) + ("\n(…)" if len(cakismalar) > 10 else "")
+            digerleri = hata_sayisi - len(cakismalar)
+            messagebox.showwarning(
+                "Kopyalama Tamamlandı",
+                f"{kopyalanan_sayisi} dosya kopyalandı.\n\n"
+                f"Aşağıdaki dosyalar, kopyalama sırasında hedefte aynı adla bir dosya "
+                f"oluştuğu için kopyalanmadı (mevcut dosyanın üzerine yazılmadı):\n- {liste}"
+                + (f"\n\n{digerleri} dosyada başka bir hata oluştu (detaylar log'da)." if digerleri > 0 else "")
+            )
+        elif hata_sayisi > 0:
             messagebox.showwarning("Kopyalama Tamamlandı", f"{kopyalanan_sayisi} dosya kopyalandı.\n{hata_sayisi} dosyada hata oluştu (detaylar log'da).")
         else:
             messagebox.showinfo("Tamamlandı", f"{kopyalanan_sayisi} dosya başarıyla kopyalandı.")
 
-        # 2. Cache'leri temizle ve ağacı yenile
-        self.beyin._clear_caches()
+        # 2. Ağacı yenile (GÜNCELLENDİ: 'kopyala_resim' yalnızca hedef klasörün
+        #    ve üst klasörlerinin önbelleğini geçersiz kıldı; tümü temizlenmez)
         if self.ana_klasor_yolu:
             self.display_tree(self.ana_klasor_yolu) # Tembel yükleme
             
@@ -820,6 +885,12 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
 
     def show_selected_images(self):
         """Sağ panelde bekleyen yüklemeleri thumbnail'larla göster (henüz kopyalanmadı)."""
+        # Önceki çizimin bekleyen thumbnail işleri artık gereksiz
+        if self._thumb_iptal_token is not None:
+            self._thumb_iptal_token.set()
+        iptal_token = threading.Event()
+        self._thumb_iptal_token = iptal_token
+        bekleyen_thumblar = {}  # {src_path: [img_lbl, ...]}
         try:
             container = getattr(self, "selected_images_scroll", None)
             if container is None or not container.winfo_exists():
@@ -872,17 +943,21 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
                 img_frame.grid(row=0, column=0, sticky="nsew", padx=10, pady=(10, 6))
                 img_frame.pack_propagate(False) # Frame'in küçülmesini engelle
 
-                thumb = self._get_ctk_thumb(src_path, max_size=(180, 180))
-                if thumb is not None:
+                # GÜNCELLENDİ: Bellekte hazır değilse yer tutucu göster; thumbnail
+                # işçi havuzunda üretilip hazır oldukça yerine konur
+                pil_img = self.beyin.get_cached_pil_thumbnail(src_path, (180, 180))
+                if pil_img is not None:
+                    thumb = ctk.CTkImage(light_image=pil_img, dark_image=pil_img, size=pil_img.size)
                     img_lbl = ctk.CTkLabel(img_frame, image=thumb, text="")
                     img_lbl.image = thumb  # GC koruması
                 else:
                     img_lbl = ctk.CTkLabel(
                         img_frame,
-                        text="(Önizleme yok)",
+                        text="Yükleniyor…",
                         font=ctk.CTkFont(size=10),
                         text_color="#6c757d"
                     )
+                    bekleyen_thumblar.setdefault(src_path, []).append(img_lbl)
                 
                 # .pack() kullanarak resim çerçevesi içinde ortala
                 img_lbl.pack(expand=True, anchor="center") 
@@ -935,8 +1010,46 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
                 command=self.clear_selected_images
             ).pack(side="left")
 
+            if bekleyen_thumblar:
+                self.beyin.thumbnaillari_uret(
+                    list(bekleyen_thumblar), (180, 180),
+                    lambda path, pil_img: self._thumb_hazir_bildir(iptal_token, bekleyen_thumblar.get(path, []), pil_img),
+                    iptal_token
+                )
+
         except Exception as e:
             logger.error(f"Seçili resimleri göstermek başarısız: {e}", exc_info=True)
+
+    def _thumb_hazir_bildir(self, iptal_token, etiketler, pil_img):
+        """İşçi thread'inden: tamamlanan thumbnail'ı UI thread'ine aktarır."""
+        if iptal_token.is_set():
+            return
+        try:
+            self.after(0, self._thumb_yerlestir, iptal_token, etiketler, pil_img)
+        except Exception:
+            pass # Pencere kapatılmış (TclError)
+
+    def _thumb_yerlestir(self, iptal_token, etiketler, pil_img):
+        """UI thread'inde: yer tutucu etiketi gerçek thumbnail ile değiştirir."""
+        if iptal_token.is_set():
+            return
+        thumb = None
+        if pil_img is not None:
+            try:
+                thumb = ctk.CTkImage(light_image=pil_img, dark_image=pil_img, size=pil_img.size)
+            except Exception as e:
+                logger.warning(f"CTkImage thumbnail'a dönüştürülemedi: {e}")
+        for img_lbl in etiketler:
+            try:
+                if not img_lbl.winfo_exists():
+                    continue
+                if thumb is not None:
+                    img_lbl.configure(image=thumb, text="")
+                    img_lbl.image = thumb  # GC koruması
+                else:
+                    img_lbl.configure(text="(Önizleme yok)")
+            except Exception:
+                continue
             
     # def create_selected_image_widget(self, resim_yolu, dosya_adi, index):
     #     """Seçilen resim widget'ı oluştur"""
@@ -1514,4 +1627,33 @@ class ResimYonetimiPenceresi(ctk.CTkFrame):
         # İstatistikler (Artık 'try' bloğuna gerek yok)
         self.create_detail_row("📷", "Toplam Resim", total_images)
         self.create_detail_row("💾", "Toplam Boyut", total_size_str)
-        self.create_detail_row("📅", "Son Güncelleme", last_modified)
\ No newline at end of file
+        self.create_detail_row("📅", "Son Güncelleme", last_modified)
+
+        # YENİ: Yakın kopya sorular (benzerlik dizininden, I/O yok)
+        benzer_sorular = data.get('benzer_sorular') or []
+        if benzer_sorular:
+            ctk.CTkLabel(
+                self.detail_scroll,
+                text="─" * 40,
+                text_color="#e0e0e0",
+                font=ctk.CTkFont(size=8)
+            ).pack(pady=5)
+            self.create_detail_row("🔁", "Benzer Sorular", len(benzer_sorular), text_color="#e17055")
+            for dosya_adi, digerleri in benzer_sorular[:8]:
+                ctk.CTkLabel(
+                    self.detail_scroll,
+                    text=f"• {dosya_adi} ≈ {', '.join(digerleri)}",
+                    font=ctk.CTkFont(family="Segoe UI", size=10),
+                    text_color="#6c757d",
+                    anchor="w",
+                    justify="left",
+                    wraplength=260
+                ).pack(fill="x", padx=(10, 0), pady=1)
+            if len(benzer_sorular) > 8:
+                ctk.CTkLabel(
+                    self.detail_scroll,
+                    text=f"… ve {len(benzer_sorular) - 8} soru daha",
+                    font=ctk.CTkFont(family="Segoe UI", size=10),
+                    text_color="#6c757d",
+                    anchor="w"
+                ).pack(fill="x", padx=(10, 0), pady=1)
\ No newline at end of file
@@ -13,6 +13,7 @@ from ui.parametre_sayfasi.parametre_secim_formu import ParametreSecimFormu
 from ui.parametre_sayfasi.onizleme_ekrani import OnizlemeEkrani
 from ui.parametre_sayfasi.kontrol_paneli import KontrolPaneli
 from logic.onizleme_cizici import OnizlemeCizici
+from logic.onizleme_on_yukleyici import OnizlemeOnYukleyici
 from ui.parametre_sayfasi.sayfa_basligi import SayfaBasligi
 from logic.oturum_yoneticisi import OturumYoneticisi
 
@@ -71,6 +72,9 @@ class SoruParametresiSecmePenceresi(ctk.CTkFrame):
         
         # YENİ: Oturum Yöneticisini (Beyin) başlat
         self.oturum_yoneticisi = OturumYoneticisi(self)
+
+        # YENİ: Komşu önizleme sayfalarını arka planda hazırlayan yükleyici
+        self.onizleme_on_yukleyici = OnizlemeOnYukleyici(self.after, self.logger)
         
         # UI'ı oluştur
         self.setup_ui()
@@ -287,6 +291,8 @@ class SoruParametresiSecmePenceresi(ctk.CTkFrame):
             pdf_preview = cizici.generate_preview_image(
                 bu_sayfanin_sutunlari, global_offset, self.current_page
             )
+            # YENİ: Komşu sayfaları arka planda hazırla (eski iş iptal edilir)
+            self.onizleme_on_yukleyici.baslat(cizici, self.sayfa_haritasi, self.current_page)
 
             if pdf_preview:
                 pdf_label = tk.Label(
@@ -478,6 +484,8 @@ class SoruParametresiSecmePenceresi(ctk.CTkFrame):
         pdf_preview = cizici.generate_preview_image(
             bu_sayfanin_sutunlari, global_offset, self.current_page
         )
+        # YENİ: Komşu sayfaları arka planda hazırla (eski iş iptal edilir)
+        self.onizleme_on_yukleyici.baslat(cizici, self.sayfa_haritasi, self.current_page)
 
         if pdf_preview:
             pdf_label = tk.Label(
@@ -592,6 +600,9 @@ class SoruParametresiSecmePenceresi(ctk.CTkFrame):
             self._havuzu_sifirla()
             self.logger.info("Geri dönüş - Havuz sıfırlandı")
             
+            # YENİ: Bekleyen önizleme ön yüklemesini bırak
+            self.onizleme_on_yukleyici.iptal()
+
             # Ekran 2'yi (Önizleme) yok et
             if self.onizleme_ekrani:
                 self.onizleme_ekrani.destroy()